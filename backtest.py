@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+백테스트 실행 스크립트
+로컬 캔들 파일로 시그널 규칙의 과거 발생 시점과 이후 수익률 계산 (네트워크 사용 안 함)
+"""
+import os
+import sys
+import time
+import yaml
+import logging
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.backtest import Backtester, load_directory
+from src.kline_cache import INTERVAL_MS
+from src.momentum_engine import momentum_windows_from_config
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(
+        description='SignalDetector 규칙 백테스트',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  # 캔들 저장소 데이터로 백테스트
+  python backtest.py --data data/candles/15m
+
+  # 특정 심볼만, 결과 CSV 저장
+  python backtest.py --data history/15m --symbols BTCUSDT ETHUSDT --output signals.csv
+        """
+    )
+    parser.add_argument('--config', default='config/config.yaml', help='설정 파일 경로')
+    parser.add_argument('--data', default='data/candles/15m', help='심볼별 캔들 파일 디렉터리 (.bin 또는 .csv)')
+    parser.add_argument('--symbols', nargs='*', help='백테스트할 심볼 (기본: 디렉터리 전체)')
+    parser.add_argument('--output', help='시그널 CSV 저장 경로')
+    parser.add_argument('--interval', help='캔들 시간 프레임 (기본: 데이터 디렉터리 이름 또는 MONITOR.TIMEFRAME)')
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    )
+
+    config = {}
+    if os.path.exists(args.config):
+        with open(args.config, 'r', encoding='utf-8') as f:
+            config = yaml.safe_load(f) or {}
+
+    signal_config = config.get('SIGNAL', {})
+    momentum_config = signal_config.get('MOMENTUM', {})
+
+    interval = args.interval
+    if interval is None:
+        directory_name = os.path.basename(os.path.normpath(args.data))
+        interval = directory_name if directory_name in INTERVAL_MS else config.get('MONITOR', {}).get('TIMEFRAME', '15m')
+
+    backtester = Backtester(
+        interval=interval,
+        cooldown=signal_config.get('COOLDOWN', 3600),
+        momentum_windows=momentum_windows_from_config(momentum_config, interval),
+    )
+
+    start = time.perf_counter()
+    histories = load_directory(args.data, args.symbols)
+    loaded = time.perf_counter()
+    signals = backtester.run(histories)
+    elapsed = time.perf_counter() - loaded
+
+    candles = sum(len(ts) for ts, _ in histories.values())
+    print(f"\n심볼 {len(histories)}개 / 캔들 {candles:,}개 "
+          f"(로드 {loaded - start:.2f}초, 계산 {elapsed:.2f}초)")
+    print(f"시그널 {len(signals)}건\n")
+
+    if not signals.empty:
+        print(backtester.summarize(signals).to_string(float_format=lambda v: f"{v:.2f}"))
+
+        if args.output:
+            signals.to_csv(args.output, index=False)
+            print(f"\n시그널 저장: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
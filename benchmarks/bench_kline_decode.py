@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+캔들 디코딩 마이크로벤치마크
+기존 12컬럼 데이터프레임 변환과 kline_decoder 경로의 호출당 시간 비교
+"""
+import os
+import sys
+import json
+import time
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import kline_decoder
+from src.kline_decoder import decode_klines, klines_to_frame
+from benchmarks.synthetic import make_raw_klines
+
+
+def legacy_klines_to_dataframe(klines: list) -> pd.DataFrame:
+    """기존 get_klines 변환 방식"""
+    df = pd.DataFrame(klines, columns=[
+        'timestamp', 'open', 'high', 'low', 'close', 'volume',
+        'close_time', 'quote_volume', 'trades', 'taker_buy_base',
+        'taker_buy_quote', 'ignore'
+    ])
+
+    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+    df['open'] = df['open'].astype(float)
+    df['high'] = df['high'].astype(float)
+    df['low'] = df['low'].astype(float)
+    df['close'] = df['close'].astype(float)
+    df['volume'] = df['volume'].astype(float)
+
+    df.set_index('timestamp', inplace=True)
+
+    return df[['open', 'high', 'low', 'close', 'volume']]
+
+
+def timeit(func, *args, repeat: int = 200) -> float:
+    """호출당 평균 시간 (ms, 5회 예열 후 측정)"""
+    for _ in range(5):
+        func(*args)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(*args)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    klines = make_raw_klines()
+    body = json.dumps(klines).encode()
+
+    results = {
+        'legacy_dataframe': timeit(legacy_klines_to_dataframe, klines),
+        'decode_klines': timeit(decode_klines, klines),
+        'klines_to_frame': timeit(klines_to_frame, klines),
+        'json_loads': timeit(json.loads, body),
+        'decoder_loads': timeit(kline_decoder.loads, body),
+    }
+
+    print(f"캔들 {len(klines)}개 / orjson {'사용' if kline_decoder.orjson is not None else '미설치'}")
+    for name, ms in results.items():
+        print(f"  {name:<18} {ms:8.3f} ms")
+
+    speedup = results['legacy_dataframe'] / results['klines_to_frame']
+    print(f"  데이터프레임 변환 속도 향상: {speedup:.1f}배")
+
+
+if __name__ == '__main__':
+    main()
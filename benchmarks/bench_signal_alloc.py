@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+SMA/시그널 경로 메모리 할당 측정
+tracemalloc으로 심볼 1개 분석(SMAMonitor.analyze_symbol: 증분 SMA + 1시간봉 리샘플 + 역배열 시그널 + 4h/24h 모멘텀 시그널)의
+최대 할당량을 재고,
+캔들 데이터 크기와 무관하게 한도 이하인지 보고 (초과하면 종료 코드 1, 같은 검사는 tests/test_signal_alloc.py)
+"""
+import os
+import sys
+import argparse
+import logging
+import tracemalloc
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import binance_api
+from src.kline_cache import INTERVAL_MS
+from src.monitor import SMAMonitor
+from src.momentum_engine import MomentumEngine, momentum_windows_from_config
+from src.resampler import resample_frame
+from src.signal_detector import SignalDetector
+from src.sma_calculator import SMACalculator
+from benchmarks.fake_client import FakeFuturesClient
+from benchmarks.synthetic import make_universe
+
+SMA_PERIODS = [120, 240, 480, 960]
+KLINE_LIMIT = max(SMA_PERIODS) + 100  # SMAMonitor.kline_limit과 동일 (1060)
+MAX_KIB = 16.0  # 심볼당 최대 할당 한도 (tests/test_signal_alloc.py와 공유)
+
+
+def peak_bytes(func: Callable[[], None]) -> int:
+    """함수 실행 중 늘어난 최대 할당량 (바이트)"""
+    tracemalloc.reset_peak()
+    before, _ = tracemalloc.get_traced_memory()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    return peak - before
+
+
+def make_monitor(symbols: List[str]) -> SMAMonitor:
+    """분석만 하는 SMAMonitor (캔들은 인자로 전달, 알림/디스크 저장/비동기 수집 비활성화)"""
+    binance_api.Client = lambda *args, **kwargs: FakeFuturesClient(0)
+    monitor = SMAMonitor({
+        'BINANCE': {'WEIGHT_PER_MINUTE': 10 ** 9},
+        'MONITOR': {
+            'TIMEFRAME': '15m',
+            'COIN_FILTER': {'MODE': 'SPECIFIC', 'SPECIFIC_COINS': symbols},
+            'ASYNC_FETCH': {'ENABLED': False},
+            'CANDLE_STORE': {'ENABLED': False},
+        },
+        'SMA': {'PERIODS': SMA_PERIODS},
+        'SIGNAL': {
+            'BREAKOUT': {'TARGET_SMA': 480},
+            'MOMENTUM': {'ENABLED': True, 'TIMEFRAMES': ['4h', '24h'],
+                         'MIN_VOLUME_USD': 1_000_000, 'MIN_PRICE_CHANGE_PCT': 5.0},
+            'COOLDOWN': 0,
+        },
+        'NOTIFICATION': {'METHODS': {'CONSOLE': False}},
+    })
+    monitor.symbols = symbols
+    return monitor
+
+
+def measure_path(n_symbols: int, n_candles: int, scans: int, legacy: bool) -> List[int]:
+    """
+    스캔마다 새 캔들 1개가 추가된 상태로 심볼별 분석 최대 할당량 측정
+
+    Args:
+        n_symbols: 심볼 수
+        n_candles: 분석 캔들 수
+        scans: 측정할 스캔 횟수
+        legacy: True면 SMA 컬럼을 붙인 데이터프레임을 만드는 기존 경로 (1시간봉 전체 리샘플 포함),
+            False면 실제 모니터 경로 (SMAMonitor.analyze_symbol)
+
+    Returns:
+        심볼×스캔별 최대 할당량 (바이트)
+    """
+    frames = make_universe(n_symbols, n_candles + scans)
+
+    if legacy:
+        calculator = SMACalculator(periods=SMA_PERIODS)
+        detector = SignalDetector(target_sma=480, cooldown=0)
+        engine = MomentumEngine(momentum_windows_from_config(
+            {'TIMEFRAMES': ['4h', '24h'], 'MIN_VOLUME_USD': 1_000_000, 'MIN_PRICE_CHANGE_PCT': 5.0}, '15m'))
+        history = detector.confirm_candles + 1
+
+        def analyze(symbol: str, df):
+            df_with_sma = calculator.calculate_all_smas_streaming(symbol, df, history=history)
+            sma_values = calculator.get_current_sma_values(df_with_sma)
+            hourly_df = resample_frame(df, INTERVAL_MS['1h'], INTERVAL_MS['15m'])
+            detector.analyze_signal(symbol, df_with_sma, sma_values, True, 'FULL', 480, hourly_df=hourly_df)
+            for window in engine.windows:
+                detector.analyze_momentum_signal_rolling(symbol, df, window.timeframe, 1_000_000, 5.0)
+    else:
+        monitor = make_monitor(list(frames))
+
+        def analyze(symbol: str, df):
+            monitor.analyze_symbol(symbol, df=df)
+
+    peaks = []
+    for scan in range(scans + 1):
+        # 캔들 창 준비는 측정에서 제외 (수집 단계)
+        windows: Dict[str, object] = {
+            symbol: df.iloc[scan:scan + n_candles] for symbol, df in frames.items()
+        }
+
+        for symbol, window in windows.items():
+            peak = peak_bytes(lambda: analyze(symbol, window))
+            # 첫 스캔은 증분 엔진 적재 (측정 제외)
+            if scan > 0:
+                peaks.append(peak)
+
+    return peaks
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='SMA/시그널 경로 메모리 할당 측정')
+    parser.add_argument('--symbols', type=int, default=50, help='심볼 수')
+    parser.add_argument('--candles', type=int, nargs='+', default=[KLINE_LIMIT, 4 * KLINE_LIMIT],
+                        help='분석 캔들 수 리스트 (할당량이 캔들 수에 비례하지 않는지 확인)')
+    parser.add_argument('--scans', type=int, default=3, help='측정할 스캔 횟수')
+    parser.add_argument('--max-kib', type=float, default=MAX_KIB, help='심볼당 최대 할당 한도 (KiB)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    tracemalloc.start()
+
+    failed = False
+    for n_candles in args.candles:
+        frame_kib = n_candles * 8 * 8 / 1024
+        print(f"\n캔들 {n_candles}개 (심볼당 캔들 데이터 {frame_kib:.0f} KiB)")
+        for name, legacy in (('기존 (SMA 컬럼 추가)', True), ('배열 뷰 (analyze_symbol)', False)):
+            peaks = measure_path(args.symbols, n_candles, args.scans, legacy)
+            worst = max(peaks) / 1024
+            mean = sum(peaks) / len(peaks) / 1024
+            print(f"  {name:<24} 심볼당 최대 {worst:8.1f} KiB, 평균 {mean:8.1f} KiB")
+            if not legacy and worst > args.max_kib:
+                failed = True
+                print(f"  한도 초과: {worst:.1f} KiB > {args.max_kib:.1f} KiB")
+
+    tracemalloc.stop()
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""
+벤치마크용 가짜 선물 클라이언트
+python-binance Client 대신 합성 캔들을 네트워크 없이 응답 (응답 본문은 미리 직렬화)
+"""
+import json
+import time
+from typing import Dict, List, Optional
+import numpy as np
+
+from benchmarks.synthetic import INTERVAL_MS, make_candles, symbol_name, to_raw_klines
+
+
+class _FakeResponse:
+    """requests.Response 대용"""
+
+    def __init__(self, content: bytes):
+        self.status_code = 200
+        self.headers: Dict[str, str] = {}
+        self.content = content
+        self.text = ''
+
+
+class _FakeSession:
+    """requests.Session 대용 (/v1/klines만 지원)"""
+
+    def __init__(self, client: 'FakeFuturesClient'):
+        self.client = client
+
+    def get(self, url: str, params: Optional[Dict] = None, timeout=None) -> _FakeResponse:
+        return _FakeResponse(self.client.klines_body(**params))
+
+
+class FakeFuturesClient:
+    """합성 캔들을 돌려주는 가짜 Client (마지막 캔들 = 현재 진행 중인 캔들)"""
+
+    FUTURES_URL = 'http://fake/fapi'
+    REQUEST_TIMEOUT = 10
+
+    def __init__(self, n_symbols: int, n_candles: int = 1200, seed: int = 42):
+        """
+        초기화
+
+        Args:
+            n_symbols: 심볼 수
+            n_candles: 심볼당 캔들 수
+            seed: 난수 시드
+        """
+        self.session = _FakeSession(self)
+        self.response = None
+
+        now_ms = int(time.time() * 1000)
+        start_ms = (now_ms // INTERVAL_MS - (n_candles - 1)) * INTERVAL_MS
+
+        self.timestamps: Dict[str, np.ndarray] = {}
+        self.raw: Dict[str, List[List]] = {}
+        for i in range(n_symbols):
+            timestamps, values = make_candles(n_candles, seed, i, start_ms=start_ms)
+            self.timestamps[symbol_name(i)] = timestamps
+            self.raw[symbol_name(i)] = to_raw_klines(timestamps, values)
+
+        self._bodies: Dict[tuple, bytes] = {}
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(self.raw)
+
+    def _slice(self, symbol: str, limit: int, startTime: Optional[int]) -> slice:
+        n = len(self.raw[symbol])
+        if startTime is None:
+            return slice(max(0, n - limit), n)
+        start = int(np.searchsorted(self.timestamps[symbol], startTime))
+        return slice(start, min(n, start + limit))
+
+    def futures_klines(self, symbol: str, interval: str = '15m', limit: int = 500,
+                       startTime: Optional[int] = None, **kwargs) -> List[List]:
+        return self.raw[symbol][self._slice(symbol, limit, startTime)]
+
+    def klines_body(self, symbol: str, interval: str = '15m', limit: int = 500,
+                    startTime: Optional[int] = None, **kwargs) -> bytes:
+        """futures_klines 응답 본문 (요청별로 한 번만 직렬화)"""
+        key = (symbol, limit, startTime)
+        if key not in self._bodies:
+            self._bodies[key] = json.dumps(self.futures_klines(symbol, interval, limit, startTime)).encode()
+        return self._bodies[key]
+
+    def futures_exchange_info(self) -> Dict:
+        return {
+            'symbols': [
+                {'symbol': s, 'status': 'TRADING', 'contractType': 'PERPETUAL'}
+                for s in self.raw
+            ]
+        }
+
+    def futures_ticker(self, symbol: Optional[str] = None):
+        tickers = [
+            {
+                'symbol': s,
+                'quoteVolume': str(1e8 * (len(self.raw) - i)),
+                'priceChangePercent': '10',
+                'lastPrice': klines[-1][4],
+                'volume': klines[-1][5],
+            }
+            for i, (s, klines) in enumerate(self.raw.items())
+        ]
+        if symbol is None:
+            return tickers
+        return next(t for t in tickers if t['symbol'] == symbol)
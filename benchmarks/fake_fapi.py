@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+로컬 바이낸스 선물(fapi) REST 대체 서버
+합성 데이터로 exchangeInfo, ticker/24hr, ticker/price, klines 응답
+지연 시간, 웨이트 헤더, 429 주입 설정 가능 (네트워크 없이 부하 테스트용)
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlparse
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.kline_cache import INTERVAL_MS
+from src.rate_limiter import request_weight
+from benchmarks.synthetic import make_candles, symbol_name, to_raw_klines
+
+# 경로 → 웨이트 계산용 python-binance 메서드 이름
+ROUTES = {
+    '/fapi/v1/ping': 'futures_ping',
+    '/fapi/v1/time': 'futures_time',
+    '/fapi/v1/exchangeInfo': 'futures_exchange_info',
+    '/fapi/v1/ticker/24hr': 'futures_ticker',
+    '/fapi/v1/ticker/price': 'futures_symbol_ticker',
+    '/fapi/v2/ticker/price': 'futures_symbol_ticker',
+    '/fapi/v1/klines': 'futures_klines',
+}
+
+
+class FakeFapiState:
+    """서버 데이터와 웨이트/통계 상태 (핸들러 스레드 공용)"""
+
+    def __init__(self, n_symbols: int = 1000, n_candles: int = 1500, seed: int = 42,
+                 latency_ms: float = 0.0, jitter_ms: float = 0.0,
+                 weight_limit: int = 2400, error_rate: float = 0.0):
+        """
+        초기화
+
+        Args:
+            n_symbols: 심볼 수
+            n_candles: 심볼/시간 프레임당 캔들 수 (마지막 = 진행 중인 캔들, 15분봉은 시작 시 생성)
+            seed: 난수 시드
+            latency_ms: 응답 지연 (ms)
+            jitter_ms: 응답 지연 편차 (ms, 지수 분포)
+            weight_limit: 분당 웨이트 한도 (초과 시 429)
+            error_rate: 무작위 429 응답 비율 (0~1)
+        """
+        self.symbols = [symbol_name(i) for i in range(n_symbols)]
+        self.n_candles = n_candles
+        self.seed = seed
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.weight_limit = weight_limit
+        self.error_rate = error_rate
+        self.started_ms = int(time.time() * 1000)
+
+        self._candles: Dict[Tuple[str, str], Tuple[np.ndarray, List[List]]] = {}
+        self._tickers: Optional[List[Dict]] = None
+        self._lock = threading.RLock()
+        self._random = random.Random(seed)
+
+        # 분 단위 웨이트 (바이낸스처럼 매 분 0으로 초기화)
+        self._minute = 0
+        self._used_weight = 0
+
+        # 통계
+        self.requests: Dict[str, int] = {}
+        self.status_counts: Dict[int, int] = {}
+        self.max_used_weight = 0
+        self.service_ms: List[float] = []
+
+        # 스캔 대상 15분봉은 미리 생성 (첫 요청 지연이 측정에 섞이지 않도록)
+        for symbol in self.symbols:
+            self.candles(symbol, '15m')
+
+    def candles(self, symbol: str, interval: str) -> Tuple[np.ndarray, List[List]]:
+        """
+        심볼/시간 프레임 캔들 (최초 요청 시 생성)
+
+        Returns:
+            (캔들 시각 배열, futures_klines 형식 리스트)
+        """
+        key = (symbol, interval)
+        with self._lock:
+            if key not in self._candles:
+                interval_ms = INTERVAL_MS.get(interval, INTERVAL_MS['15m'])
+                start_ms = (self.started_ms // interval_ms - (self.n_candles - 1)) * interval_ms
+                timestamps, values = make_candles(
+                    self.n_candles, self.seed, self.symbols.index(symbol),
+                    start_ms=start_ms, interval_ms=interval_ms
+                )
+                self._candles[key] = (timestamps, to_raw_klines(timestamps, values, interval_ms))
+            return self._candles[key]
+
+    def advance(self, interval: str = '15m') -> Dict[str, List]:
+        """
+        다음 캔들로 진행: 진행 중이던 마지막 캔들을 마감하고 새 캔들 추가 (스트림 대체 서버용)
+
+        Args:
+            interval: 시간 프레임
+
+        Returns:
+            {심볼: 방금 마감된 캔들 (futures_klines 형식)}
+        """
+        interval_ms = INTERVAL_MS.get(interval, INTERVAL_MS['15m'])
+        with self._lock:
+            rng = np.random.default_rng([self.seed, len(self.candles(self.symbols[0], interval)[0])])
+            returns = rng.normal(0, 0.006, len(self.symbols))
+            volumes = rng.lognormal(10, 1, len(self.symbols))
+
+            closed = {}
+            for i, symbol in enumerate(self.symbols):
+                timestamps, klines = self.candles(symbol, interval)
+                closed[symbol] = klines[-1]
+
+                open_ = float(klines[-1][4])
+                close = open_ * float(np.exp(returns[i]))
+                quote_volume = volumes[i] * (open_ + close) / 2
+                values = np.array([[
+                    open_, max(open_, close) * 1.001, min(open_, close) * 0.999, close, volumes[i],
+                    quote_volume, volumes[i] / 2, quote_volume / 2,
+                ]])
+                timestamp = timestamps[-1:] + interval_ms
+                klines.extend(to_raw_klines(timestamp, values, interval_ms))
+                self._candles[(symbol, interval)] = (np.concatenate([timestamps, timestamp]), klines)
+
+            self._tickers = None
+            return closed
+
+    def tickers(self) -> List[Dict]:
+        """24시간 티커 (거래대금 내림차순, 상승률 무작위, 최초 요청 시 생성)"""
+        with self._lock:
+            if self._tickers is None:
+                rng = np.random.default_rng(self.seed)
+                change = rng.normal(3, 8, len(self.symbols))
+                self._tickers = [
+                    {
+                        'symbol': symbol,
+                        'priceChangePercent': f"{change[i]:.3f}",
+                        'lastPrice': self.candles(symbol, '15m')[1][-1][4],
+                        'volume': f"{1e6 / (i + 1):.3f}",
+                        'quoteVolume': f"{5e9 / (i + 1):.4f}",
+                    }
+                    for i, symbol in enumerate(self.symbols)
+                ]
+        return self._tickers
+
+    def consume(self, weight: int) -> Tuple[int, bool]:
+        """
+        요청 웨이트 사용
+
+        Args:
+            weight: 요청 웨이트
+
+        Returns:
+            (이번 분 사용 웨이트, 한도 초과 여부)
+        """
+        with self._lock:
+            minute = int(time.time() // 60)
+            if minute != self._minute:
+                self._minute = minute
+                self._used_weight = 0
+            self._used_weight += weight
+            self.max_used_weight = max(self.max_used_weight, self._used_weight)
+            return self._used_weight, self._used_weight > self.weight_limit
+
+    def inject_error(self) -> bool:
+        """무작위 429 주입 여부"""
+        with self._lock:
+            return self.error_rate > 0 and self._random.random() < self.error_rate
+
+    def delay(self) -> float:
+        """이번 응답 지연 (초)"""
+        if self.latency_ms <= 0 and self.jitter_ms <= 0:
+            return 0.0
+        with self._lock:
+            jitter = self._random.expovariate(1 / self.jitter_ms) if self.jitter_ms > 0 else 0.0
+        return (self.latency_ms + jitter) / 1000
+
+    def record(self, path: str, status: int, service_ms: float):
+        with self._lock:
+            self.requests[path] = self.requests.get(path, 0) + 1
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+            self.service_ms.append(service_ms)
+
+    def stats(self) -> Dict:
+        """요청 통계"""
+        with self._lock:
+            service = np.asarray(self.service_ms) if self.service_ms else np.zeros(1)
+            return {
+                'requests': dict(self.requests),
+                'status_counts': {str(k): v for k, v in self.status_counts.items()},
+                'max_used_weight_1m': self.max_used_weight,
+                'weight_limit': self.weight_limit,
+                'service_ms': {
+                    'p50': float(np.percentile(service, 50)),
+                    'p95': float(np.percentile(service, 95)),
+                    'p99': float(np.percentile(service, 99)),
+                    'max': float(service.max()),
+                },
+            }
+
+
+class FakeFapiHandler(BaseHTTPRequestHandler):
+    """fapi 요청 처리"""
+
+    protocol_version = 'HTTP/1.1'  # keep-alive
+    disable_nagle_algorithm = True  # 헤더/본문 분리 전송 시 지연 ACK 대기 방지
+    state: FakeFapiState = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body, headers: Optional[Dict[str, str]] = None):
+        data = body if isinstance(body, bytes) else json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        start = time.perf_counter()
+        parsed = urlparse(self.path)
+        params = dict(parse_qsl(parsed.query))
+        status = self._handle(parsed.path, params)
+        self.state.record(parsed.path, status, (time.perf_counter() - start) * 1000)
+
+    def _handle(self, path: str, params: Dict[str, str]) -> int:
+        state = self.state
+
+        if path == '/__stats':
+            self._send(200, state.stats())
+            return 200
+
+        method = ROUTES.get(path)
+        if method is None:
+            self._send(404, {'code': -1000, 'msg': f'Unknown path {path}'})
+            return 404
+
+        if 'limit' in params:
+            params['limit'] = int(params['limit'])
+
+        used_weight, over_limit = state.consume(request_weight(method, params))
+        headers = {'X-MBX-USED-WEIGHT-1M': str(used_weight)}
+
+        delay = state.delay()
+        if delay:
+            time.sleep(delay)
+
+        if over_limit or state.inject_error():
+            headers['Retry-After'] = str(60 - int(time.time()) % 60 if over_limit else 1)
+            self._send(429, {'code': -1003, 'msg': 'Too many requests; current limit is exceeded.'}, headers)
+            return 429
+
+        if method == 'futures_klines':
+            symbol = params.get('symbol')
+            if symbol not in state.symbols:
+                self._send(400, {'code': -1121, 'msg': 'Invalid symbol.'}, headers)
+                return 400
+
+            timestamps, klines = state.candles(symbol, params.get('interval', '15m'))
+            limit = min(params.get('limit', 500), 1500)
+            if 'startTime' in params:
+                start = int(np.searchsorted(timestamps, int(params['startTime'])))
+                body = klines[start:start + limit]
+            else:
+                body = klines[-limit:]
+
+        elif method == 'futures_ticker':
+            tickers = state.tickers()
+            body = tickers
+            if 'symbol' in params:
+                body = next((t for t in tickers if t['symbol'] == params['symbol']), None)
+
+        elif method == 'futures_symbol_ticker':
+            symbols = [params['symbol']] if 'symbol' in params else state.symbols
+            prices = [
+                {'symbol': s, 'price': state.candles(s, '15m')[1][-1][4], 'time': int(time.time() * 1000)}
+                for s in symbols
+            ]
+            body = prices[0] if 'symbol' in params else prices
+
+        elif method == 'futures_exchange_info':
+            body = {
+                'timezone': 'UTC',
+                'serverTime': int(time.time() * 1000),
+                'symbols': [
+                    {'symbol': s, 'status': 'TRADING', 'contractType': 'PERPETUAL', 'quoteAsset': 'USDT'}
+                    for s in state.symbols
+                ],
+            }
+
+        elif method == 'futures_time':
+            body = {'serverTime': int(time.time() * 1000)}
+
+        else:
+            body = {}
+
+        self._send(200, body, headers)
+        return 200
+
+
+class FakeFapiServer:
+    """로컬 fapi 대체 서버 (백그라운드 스레드)"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, **state_kwargs):
+        """
+        초기화
+
+        Args:
+            host: 바인드 주소
+            port: 포트 (0이면 빈 포트 자동 선택)
+            **state_kwargs: FakeFapiState 인자
+        """
+        self.state = FakeFapiState(**state_kwargs)
+        handler = type('Handler', (FakeFapiHandler,), {'state': self.state})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """BinanceAPI futures_url로 지정할 주소"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/fapi"
+
+    def start(self) -> 'FakeFapiServer':
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self.httpd.serve_forever()
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='로컬 바이낸스 선물 REST 대체 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--symbols', type=int, default=1000, help='합성 심볼 수')
+    parser.add_argument('--candles', type=int, default=1500, help='심볼당 캔들 수')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='응답 지연 (ms)')
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help='응답 지연 편차 (ms)')
+    parser.add_argument('--weight-limit', type=int, default=2400, help='분당 웨이트 한도')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='무작위 429 비율 (0~1)')
+    args = parser.parse_args()
+
+    server = FakeFapiServer(
+        args.host, args.port,
+        n_symbols=args.symbols, n_candles=args.candles,
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        weight_limit=args.weight_limit, error_rate=args.error_rate,
+    )
+    print(f"fapi 대체 서버 실행: {server.url} (심볼 {args.symbols}개)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+로컬 SMTP 대체 서버 (aiosmtpd)
+받은 메일과 연결 수를 기록해 이메일 알림의 연결 재사용/묶음 전송/재연결을 확인
+aiosmtpd 필요: pip install aiosmtpd
+"""
+import os
+import sys
+import time
+import argparse
+import logging
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from aiosmtpd.controller import Controller
+    from aiosmtpd.smtp import SMTP
+except ImportError:
+    Controller = None
+    SMTP = object
+
+from src.notifier import Notifier
+
+
+class RecordingHandler:
+    """받은 메일/연결 수 기록"""
+
+    def __init__(self):
+        self.messages: List[bytes] = []
+        self.connections = 0
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages.append(envelope.content)
+        return '250 Message accepted for delivery'
+
+
+class _CountingSMTP(SMTP):
+    """연결 수를 세는 SMTP 프로토콜"""
+
+    def connection_made(self, transport):
+        self.event_handler.connections += 1
+        super().connection_made(transport)
+
+
+class FakeSMTPServer:
+    """로컬 SMTP 대체 서버 (백그라운드 스레드, STARTTLS/인증 없음)"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 8025, idle_timeout: float = 300.0):
+        """
+        초기화
+
+        Args:
+            host: 바인드 주소
+            port: 포트
+            idle_timeout: 서버가 유휴 연결을 끊는 시간 (초)
+        """
+        if Controller is None:
+            raise ImportError("aiosmtpd가 설치되어 있지 않습니다: pip install aiosmtpd")
+
+        self.handler = RecordingHandler()
+        controller_class = type('CountingController', (Controller,), {
+            'factory': lambda controller: _CountingSMTP(controller.handler, **controller.SMTP_kwargs),
+        })
+        self.controller = controller_class(self.handler, hostname=host, port=port, timeout=idle_timeout)
+        self.host = host
+        self.port = port
+
+    def start(self) -> 'FakeSMTPServer':
+        self.controller.start()
+        # 시작 시 준비 확인용 연결은 제외
+        self.handler.connections = 0
+        return self
+
+    def stop(self):
+        self.controller.stop()
+
+
+def main():
+    """메인 함수 (대체 서버를 띄우고 Notifier로 알림 메일 전송)"""
+    parser = argparse.ArgumentParser(description='로컬 SMTP 대체 서버로 이메일 알림 전송 확인')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8025)
+    parser.add_argument('--alerts', type=int, default=50, help='보낼 알림 수')
+    parser.add_argument('--idle-timeout', type=float, default=300.0, help='서버 유휴 연결 종료 시간 (초)')
+    parser.add_argument('--serve', action='store_true', help='서버만 실행')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    server = FakeSMTPServer(args.host, args.port, args.idle_timeout).start()
+    print(f"SMTP 대체 서버 실행: {args.host}:{args.port}")
+
+    if args.serve:
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            server.stop()
+        return
+
+    notifier = Notifier({
+        'METHODS': {'CONSOLE': False, 'EMAIL': True},
+        'EMAIL': {
+            'SMTP_SERVER': args.host,
+            'SMTP_PORT': args.port,
+            'SENDER_EMAIL': 'monitor@localhost',
+            'RECEIVER_EMAIL': 'alerts@localhost',
+            'STARTTLS': False,
+        },
+    })
+
+    start = time.perf_counter()
+    for i in range(args.alerts):
+        notifier._deliver({'email': (f"[Binance Alert] 테스트 {i + 1}", f"알림 메일 {i + 1}")})
+    notifier.close()
+    elapsed = time.perf_counter() - start
+
+    print(f"메일 {len(server.handler.messages)}/{args.alerts}통, 연결 {server.handler.connections}회, {elapsed:.2f}초")
+    server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+로컬 바이낸스 선물 combined 캔들 스트림 대체 서버
+<symbol>@kline_<interval> 구독에 대해 일정 주기마다 마감 캔들(x=true)을 전송
+fapi 대체 서버와 데이터를 공유해 REST 공백 복구와 스트림이 같은 캔들을 보도록 하고,
+일정 메시지 수마다 연결을 끊어 재연결 경로를 재현 (네트워크 없이 스트리밍 모드 점검용)
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import threading
+from typing import Dict, List, Optional, Set
+from urllib.parse import parse_qs, urlparse
+
+import websockets
+from websockets.asyncio.server import ServerConnection, serve
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fake_fapi import FakeFapiServer, FakeFapiState
+
+
+def kline_message(symbol: str, interval: str, kline: List) -> str:
+    """
+    futures_klines 형식 캔들을 combined 스트림 kline 메시지로 변환
+
+    Args:
+        symbol: 심볼
+        interval: 시간 프레임
+        kline: futures_klines 형식 캔들
+
+    Returns:
+        JSON 메시지
+    """
+    return json.dumps({
+        'stream': f"{symbol.lower()}@kline_{interval}",
+        'data': {
+            'e': 'kline',
+            'E': int(time.time() * 1000),
+            's': symbol,
+            'k': {
+                't': kline[0], 'T': kline[6], 's': symbol, 'i': interval,
+                'o': kline[1], 'h': kline[2], 'l': kline[3], 'c': kline[4], 'v': kline[5],
+                'n': kline[8], 'x': True, 'q': kline[7], 'V': kline[9], 'Q': kline[10], 'B': '0',
+            },
+        },
+    })
+
+
+class FakeStreamServer:
+    """로컬 combined 스트림 대체 서버 (백그라운드 스레드 이벤트 루프)"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, state: Optional[FakeFapiState] = None,
+                 interval: str = '15m', candle_seconds: float = 1.0, drop_after: int = 0, **state_kwargs):
+        """
+        초기화
+
+        Args:
+            host: 바인드 주소
+            port: 포트 (0이면 빈 포트 자동 선택)
+            state: 공유할 fapi 대체 서버 상태 (None이면 새로 생성)
+            interval: 스트림 시간 프레임
+            candle_seconds: 캔들 마감 주기 (초, 실제 시간 프레임보다 빠르게 진행)
+            drop_after: 연결당 이 수만큼 메시지를 보내면 연결 끊기 (0이면 끊지 않음)
+            **state_kwargs: state가 없을 때 FakeFapiState 인자
+        """
+        self.host = host
+        self.port = port
+        self.state = state if state is not None else FakeFapiState(**state_kwargs)
+        self.interval = interval
+        self.candle_seconds = candle_seconds
+        self.drop_after = drop_after
+
+        self._subscribers: Dict[ServerConnection, Set[str]] = {}
+        self._sent: Dict[ServerConnection, int] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop: Optional[asyncio.Event] = None
+        self._ready = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # 통계
+        self.connections = 0
+        self.drops = 0
+        self.messages = 0
+        self.candles_closed = 0
+
+    @property
+    def url(self) -> str:
+        """MONITOR.STREAM.URL로 지정할 주소"""
+        return f"ws://{self.host}:{self.port}/stream"
+
+    async def _handler(self, connection: ServerConnection):
+        """구독 연결 등록 후 끊길 때까지 대기"""
+        query = parse_qs(urlparse(connection.request.path).query)
+        symbols = set()
+        for stream in query.get('streams', [''])[0].split('/'):
+            name, _, kind = stream.partition('@')
+            symbol = name.upper()
+            if kind == f"kline_{self.interval}" and symbol in self.state.symbols:
+                symbols.add(symbol)
+
+        self.connections += 1
+        self._subscribers[connection] = symbols
+        self._sent[connection] = 0
+        try:
+            await connection.wait_closed()
+        finally:
+            self._subscribers.pop(connection, None)
+            self._sent.pop(connection, None)
+
+    async def _tick(self):
+        """candle_seconds마다 캔들을 마감하고 구독자에게 전송"""
+        while not self._stop.is_set():
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=self.candle_seconds)
+                break
+            except asyncio.TimeoutError:
+                pass
+
+            closed = self.state.advance(self.interval)
+            self.candles_closed += 1
+
+            for connection, symbols in list(self._subscribers.items()):
+                try:
+                    for symbol in sorted(symbols):
+                        await connection.send(kline_message(symbol, self.interval, closed[symbol]))
+                        self.messages += 1
+                        self._sent[connection] += 1
+                        if self.drop_after and self._sent[connection] >= self.drop_after:
+                            self.drops += 1
+                            await connection.close()
+                            break
+                except websockets.ConnectionClosed:
+                    continue
+
+    async def _serve(self):
+        self._stop = asyncio.Event()
+        async with serve(self._handler, self.host, self.port, max_size=None) as server:
+            self.port = server.sockets[0].getsockname()[1]
+            self._ready.set()
+            await self._tick()
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        self._loop.run_until_complete(self._serve())
+        self._loop.close()
+
+    def start(self) -> 'FakeStreamServer':
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self._ready.wait(timeout=30)
+        return self
+
+    def serve_forever(self):
+        if self._thread is None:
+            self.start()
+        while self._thread.is_alive():
+            self._thread.join(timeout=1)
+
+    def stop(self):
+        if self._loop is not None and self._stop is not None:
+            self._loop.call_soon_threadsafe(self._stop.set)
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+
+    def stats(self) -> Dict:
+        """전송 통계"""
+        return {
+            'connections': self.connections,
+            'drops': self.drops,
+            'messages': self.messages,
+            'candles_closed': self.candles_closed,
+        }
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='로컬 바이낸스 선물 캔들 스트림 대체 서버 (fapi 대체 서버 포함)')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8766, help='스트림 포트')
+    parser.add_argument('--fapi-port', type=int, default=8765, help='fapi 대체 서버 포트')
+    parser.add_argument('--symbols', type=int, default=300, help='합성 심볼 수')
+    parser.add_argument('--candles', type=int, default=1500, help='심볼당 캔들 수')
+    parser.add_argument('--candle-seconds', type=float, default=1.0, help='캔들 마감 주기 (초)')
+    parser.add_argument('--drop-after', type=int, default=0, help='연결당 메시지 수마다 연결 끊기 (0이면 끊지 않음)')
+    args = parser.parse_args()
+
+    fapi = FakeFapiServer(args.host, args.fapi_port, n_symbols=args.symbols, n_candles=args.candles,
+                          weight_limit=10 ** 9).start()
+    server = FakeStreamServer(args.host, args.port, state=fapi.state,
+                              candle_seconds=args.candle_seconds, drop_after=args.drop_after).start()
+    print(f"fapi 대체 서버: {fapi.url}")
+    print(f"스트림 대체 서버: {server.url} (심볼 {args.symbols}개, {args.candle_seconds}초마다 캔들 마감)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+    finally:
+        fapi.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+SMAMonitor 종단 간 부하 테스트
+로컬 fapi 대체 서버(별도 프로세스)를 띄우고 실제 코드 경로로 전체 스캔을 반복 실행
+처리량, 요청 지연 분포, 레이트 리밋 동작을 측정
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import logging
+import multiprocessing
+from typing import Dict, List, Tuple
+import numpy as np
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.monitor import SMAMonitor
+from benchmarks.fake_fapi import FakeFapiServer
+
+
+def _serve(queue: multiprocessing.Queue, kwargs: Dict):
+    """서버 프로세스 진입점 (선택된 주소를 큐로 전달)"""
+    server = FakeFapiServer(**kwargs)
+    queue.put(server.url)
+    server.serve_forever()
+
+
+def start_server(**kwargs) -> Tuple[multiprocessing.Process, str]:
+    """
+    별도 프로세스에서 대체 서버 실행
+
+    Returns:
+        (서버 프로세스, futures_url)
+    """
+    queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_serve, args=(queue, kwargs), daemon=True)
+    process.start()
+    return process, queue.get(timeout=30)
+
+
+def percentiles(values: List[float]) -> Dict[str, float]:
+    """p50/p95/p99/max (ms)"""
+    if not values:
+        return {}
+    array = np.asarray(values)
+    return {
+        'p50': float(np.percentile(array, 50)),
+        'p95': float(np.percentile(array, 95)),
+        'p99': float(np.percentile(array, 99)),
+        'max': float(array.max()),
+    }
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='SMAMonitor 종단 간 부하 테스트 (로컬 fapi 대체 서버)')
+    parser.add_argument('--symbols', type=int, default=1000, help='합성 심볼 수')
+    parser.add_argument('--scans', type=int, default=3, help='스캔 횟수 (첫 회는 캐시 없음)')
+    parser.add_argument('--latency-ms', type=float, default=20.0, help='서버 응답 지연 (ms)')
+    parser.add_argument('--jitter-ms', type=float, default=10.0, help='서버 응답 지연 편차 (ms)')
+    parser.add_argument('--weight-limit', type=int, default=10 ** 9, help='서버 분당 웨이트 한도 (실제 2400)')
+    parser.add_argument('--client-weight', type=int, default=10 ** 9, help='클라이언트 WEIGHT_PER_MINUTE (실제 1800)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='서버 무작위 429 비율 (0~1)')
+    parser.add_argument('--async-fetch', action='store_true', help='비동기 캔들 수집 사용')
+    parser.add_argument('--concurrency', type=int, default=10, help='비동기 동시 요청 수')
+    parser.add_argument('--prescreen', action='store_true', help='현재가 사전 선별 사용')
+    parser.add_argument('--workers', type=int, default=0, help='프로세스 풀 분석 프로세스 수 (0이면 순차 분석)')
+    parser.add_argument('--output', help='결과 JSON 경로')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    process, futures_url = start_server(
+        n_symbols=args.symbols, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        weight_limit=args.weight_limit, error_rate=args.error_rate,
+    )
+    print(f"대체 서버: {futures_url} (심볼 {args.symbols}개)")
+
+    monitor = None
+    try:
+        monitor = SMAMonitor({
+            'BINANCE': {'FUTURES_URL': futures_url, 'WEIGHT_PER_MINUTE': args.client_weight},
+            'MONITOR': {
+                'TIMEFRAME': '15m',
+                'COIN_FILTER': {'MODE': 'TOP_VOLUME', 'TOP_N': args.symbols},
+                'ASYNC_FETCH': {'ENABLED': args.async_fetch, 'CONCURRENCY': args.concurrency},
+                'CANDLE_STORE': {'ENABLED': False},
+                'PROCESS_POOL': {'ENABLED': args.workers > 0, 'WORKERS': args.workers},
+                'PRESCREEN': {'ENABLED': args.prescreen},
+            },
+            'SMA': {'PERIODS': [120, 240, 480, 960]},
+            'SIGNAL': {'MOMENTUM': {'ENABLED': True}},
+            'NOTIFICATION': {'METHODS': {'CONSOLE': False}},
+        })
+
+        # 동기 경로 요청 지연 (클라이언트 측)
+        latencies: List[float] = []
+        monitor.api.client.session.hooks['response'].append(
+            lambda response, *a, **kw: latencies.append(response.elapsed.total_seconds() * 1000)
+        )
+
+        start = time.perf_counter()
+        monitor.update_symbol_list()
+        symbol_list_s = time.perf_counter() - start
+        print(f"심볼 리스트: {len(monitor.symbols)}개 ({symbol_list_s:.2f}초)")
+
+        scans = []
+        for i in range(args.scans):
+            latencies.clear()
+            start = time.perf_counter()
+            signals = monitor.scan_all_symbols()
+            elapsed = time.perf_counter() - start
+
+            scan = {
+                'scan': i + 1,
+                'seconds': elapsed,
+                'symbols_per_second': len(monitor.symbols) / elapsed if elapsed > 0 else None,
+                'signals': signals,
+                'request_ms': percentiles(latencies),
+            }
+            scans.append(scan)
+
+            latency = scan['request_ms']
+            latency_text = f", 요청 p50 {latency['p50']:.1f} / p99 {latency['p99']:.1f} ms" if latency else ''
+            print(f"스캔 {i + 1}: {elapsed:.2f}초, {scan['symbols_per_second']:.1f} 심볼/초{latency_text}")
+
+        server_stats = requests.get(futures_url.rsplit('/fapi', 1)[0] + '/__stats', timeout=10).json()
+        print(f"서버: 최대 웨이트 {server_stats['max_used_weight_1m']}/{server_stats['weight_limit']}, "
+              f"상태 코드 {server_stats['status_counts']}, 경로별 요청 {server_stats['requests']}")
+
+        results = {
+            'args': vars(args),
+            'symbol_list_seconds': symbol_list_s,
+            'scans': scans,
+            'server': server_stats,
+        }
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2, ensure_ascii=False)
+            print(f"결과 저장: {args.output}")
+
+    finally:
+        if monitor is not None:
+            monitor.close()
+        process.terminate()
+
+
+if __name__ == '__main__':
+    main()
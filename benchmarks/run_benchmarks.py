@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+핫 패스 벤치마크 실행 스크립트
+SMA 계산, 시그널 분석, 캔들 파싱, 전체 스캔을 심볼 수별로 측정하고 JSON으로 저장
+"""
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import logging
+import statistics
+import subprocess
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import src.binance_api as binance_api
+from src.binance_api import BinanceAPI
+from src.candle_view import CandleView
+from src.kline_decoder import klines_to_frame
+from src.momentum_engine import MomentumEngine, momentum_windows_from_config
+from src.monitor import SMAMonitor
+from src.signal_detector import SignalDetector, timeframe_candles
+from src.sma_calculator import SMACalculator
+from benchmarks.fake_client import FakeFuturesClient
+from benchmarks.synthetic import make_universe
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+SMA_PERIODS = [120, 240, 480, 960]
+KLINE_LIMIT = max(SMA_PERIODS) + 100  # SMAMonitor.kline_limit과 동일 (1060)
+
+
+def measure(func: Callable[[], None], repeat: int, setup: Optional[Callable[[], None]] = None) -> Dict:
+    """
+    함수 실행 시간 측정 (1회 예열 후 repeat회)
+
+    Args:
+        func: 측정할 함수
+        repeat: 측정 횟수
+        setup: 매 측정 전 호출할 함수 (측정 시간에서 제외)
+
+    Returns:
+        {'mean_ms', 'median_ms', 'min_ms', 'max_ms', 'repeat'}
+    """
+    if setup is not None:
+        setup()
+    func()
+
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+
+    return {
+        'mean_ms': statistics.fmean(times),
+        'median_ms': statistics.median(times),
+        'min_ms': min(times),
+        'max_ms': max(times),
+        'repeat': repeat,
+    }
+
+
+def momentum_change_pct(df: pd.DataFrame, timeframe: str, interval: str = '15m') -> Optional[float]:
+    """
+    모멘텀 시간 기준 구간의 상승률 (Rolling 모멘텀 필터와 같은 계산, 구간별 측정용)
+
+    Args:
+        df: 캔들 데이터프레임
+        timeframe: 시간 기준 (4h, 6h, 12h, 24h)
+        interval: 캔들 시간 프레임
+
+    Returns:
+        상승률 (%, 데이터가 부족하면 None)
+    """
+    return CandleView(df).change_pct(timeframe_candles(timeframe, interval))
+
+
+def make_api(client: FakeFuturesClient) -> BinanceAPI:
+    """가짜 클라이언트를 쓰는 BinanceAPI (레이트 리밋 대기 없음)"""
+    binance_api.Client = lambda *args, **kwargs: client
+    return BinanceAPI(weight_per_minute=10 ** 9)
+
+
+def make_monitor(client: FakeFuturesClient) -> SMAMonitor:
+    """가짜 클라이언트를 쓰는 SMAMonitor (알림/디스크 저장/비동기 수집 비활성화)"""
+    binance_api.Client = lambda *args, **kwargs: client
+    monitor = SMAMonitor({
+        'BINANCE': {'WEIGHT_PER_MINUTE': 10 ** 9},
+        'MONITOR': {
+            'TIMEFRAME': '15m',
+            'COIN_FILTER': {'MODE': 'SPECIFIC', 'SPECIFIC_COINS': client.symbols},
+            'ASYNC_FETCH': {'ENABLED': False},
+            'CANDLE_STORE': {'ENABLED': False},
+        },
+        'SMA': {'PERIODS': SMA_PERIODS},
+        'SIGNAL': {
+            'BREAKOUT': {'TARGET_SMA': 960, 'CONFIRM_CANDLES': 1},
+            'MOMENTUM': {'ENABLED': True, 'MIN_VOLUME_USD': 1_000_000, 'MIN_PRICE_CHANGE_PCT': 5.0},
+            'COOLDOWN': 0,
+        },
+        'NOTIFICATION': {'METHODS': {'CONSOLE': False}},
+    })
+    monitor.symbols = client.symbols
+    return monitor
+
+
+def run_size(n_symbols: int, repeat: int) -> Dict[str, Dict]:
+    """
+    심볼 수 하나에 대한 전체 벤치마크 (각 항목 = 전체 심볼 1회 처리 시간)
+
+    Args:
+        n_symbols: 심볼 수
+        repeat: 측정 횟수
+
+    Returns:
+        {벤치마크 이름: 측정 결과}
+    """
+    frames = make_universe(n_symbols, KLINE_LIMIT)
+    calculator = SMACalculator(periods=SMA_PERIODS)
+    detector = SignalDetector(target_sma=480, cooldown=0)
+    momentum = MomentumEngine(momentum_windows_from_config({'TIMEFRAMES': ['4h', '6h', '12h', '24h']}, '15m'))
+    for symbol, df in frames.items():
+        momentum.update(symbol, df)
+
+    with_sma = {symbol: calculator.calculate_all_smas(df) for symbol, df in frames.items()}
+    sma_values = {symbol: calculator.get_current_sma_values(df) for symbol, df in with_sma.items()}
+    alignment = {
+        symbol: calculator.check_reverse_alignment_flexible(values, 480)
+        for symbol, values in sma_values.items()
+    }
+
+    def analyze_signal():
+        for symbol, df in with_sma.items():
+            reverse_aligned, reverse_type = alignment[symbol]
+            detector.analyze_signal(symbol, df, sma_values[symbol], reverse_aligned, reverse_type, 480)
+
+    client = FakeFuturesClient(n_symbols, n_candles=KLINE_LIMIT + 100)
+    api = make_api(client)
+    raw = {symbol: client.futures_klines(symbol, limit=KLINE_LIMIT) for symbol in client.symbols}
+
+    cold_monitor: List[SMAMonitor] = []
+    warm_monitor = make_monitor(client)
+    warm_monitor.scan_all_symbols()
+
+    benchmarks = {
+        'sma.calculate_all_smas': (lambda: [calculator.calculate_all_smas(df) for df in frames.values()], None),
+        'sma.get_current_sma_values': (lambda: [calculator.get_current_sma_values(df) for df in with_sma.values()], None),
+        'sma.latest_sma_values': (lambda: [calculator.latest_sma_values(df) for df in frames.values()], None),
+        'sma.check_reverse_alignment_flexible': (
+            lambda: [calculator.check_reverse_alignment_flexible(values, 480) for values in sma_values.values()], None),
+        'signal.analyze_signal': (analyze_signal, None),
+        'signal.analyze_momentum_signal_rolling': (
+            lambda: [detector.analyze_momentum_signal_rolling(symbol, df, '24h', 1_000_000, 5.0)
+                     for symbol, df in frames.items()], None),
+        'signal.momentum_rolling.4_windows': (
+            lambda: [momentum_change_pct(df, timeframe)
+                     for df in frames.values() for timeframe in ('4h', '6h', '12h', '24h')], None),
+        'signal.momentum_engine.update': (
+            lambda: [momentum.update(symbol, df) for symbol, df in frames.items()], None),
+        'parse.klines_to_frame': (lambda: [klines_to_frame(klines) for klines in raw.values()], None),
+        'api.get_klines': (lambda: [api.get_klines(symbol, limit=KLINE_LIMIT) for symbol in client.symbols], None),
+        'monitor.scan_all_symbols.cold': (
+            lambda: cold_monitor[-1].scan_all_symbols(),
+            lambda: cold_monitor.append(make_monitor(client))),
+        'monitor.scan_all_symbols.warm': (warm_monitor.scan_all_symbols, None),
+    }
+
+    results = {}
+    for name, (func, setup) in benchmarks.items():
+        result = measure(func, repeat, setup)
+        result['per_symbol_us'] = result['median_ms'] * 1000 / n_symbols
+        results[name] = result
+        print(f"  {name:<40} {result['median_ms']:10.2f} ms  ({result['per_symbol_us']:8.1f} us/심볼)")
+
+    return results
+
+
+def git_commit() -> Optional[str]:
+    """현재 git 커밋 (없으면 None)"""
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(baseline_path: str, results: Dict):
+    """
+    기준 결과 대비 변화 출력 (중앙값 기준)
+
+    Args:
+        baseline_path: 기준 결과 JSON 경로
+        results: 이번 실행 결과
+    """
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    print(f"\n기준 비교: {baseline_path} ({baseline['meta'].get('git_commit')})")
+    for size, entries in results['results'].items():
+        base_entries = baseline['results'].get(size, {})
+        for name, result in entries.items():
+            if name not in base_entries:
+                continue
+            before = base_entries[name]['median_ms']
+            after = result['median_ms']
+            print(f"  [{size:>4}] {name:<40} {before:10.2f} → {after:10.2f} ms  (x{before / after:.2f})")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='핫 패스 벤치마크')
+    parser.add_argument('--symbols', type=int, nargs='+', default=[50, 200, 600], help='심볼 수 리스트')
+    parser.add_argument('--repeat', type=int, default=3, help='측정 횟수')
+    parser.add_argument('--output', help='결과 JSON 경로 (기본: benchmarks/results/<시각>.json)')
+    parser.add_argument('--compare', help='비교할 기준 결과 JSON 경로')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+
+    results = {
+        'meta': {
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'git_commit': git_commit(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'platform': platform.platform(),
+            'kline_limit': KLINE_LIMIT,
+            'sma_periods': SMA_PERIODS,
+        },
+        'results': {},
+    }
+
+    for n_symbols in args.symbols:
+        print(f"\n심볼 {n_symbols}개 / 캔들 {KLINE_LIMIT}개")
+        results['results'][str(n_symbols)] = run_size(n_symbols, args.repeat)
+
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, datetime.now().strftime('%Y%m%d-%H%M%S') + '.json')
+
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    print(f"\n결과 저장: {output}")
+
+    if args.compare:
+        compare(args.compare, results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+"""
+결정적 합성 캔들 생성기
+같은 seed/심볼 번호면 항상 같은 캔들을 만들어 실행 간 비교가 가능하도록 함
+"""
+from typing import Dict, List, Tuple
+import numpy as np
+import pandas as pd
+
+from src.kline_decoder import KLINE_FIELDS, frame_from_arrays
+
+# 15분봉 (ms)
+INTERVAL_MS = 15 * 60 * 1000
+
+# 기본 시작 시각 (2024-01-01 00:00 UTC)
+DEFAULT_START_MS = 1_704_067_200_000
+
+
+def symbol_name(index: int) -> str:
+    """합성 심볼 이름"""
+    return f"SYN{index:04d}USDT"
+
+
+def make_candles(n: int = 1060, seed: int = 42, index: int = 0,
+                 start_ms: int = DEFAULT_START_MS, interval_ms: int = INTERVAL_MS) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    합성 캔들 배열 생성
+    - 추세가 주기적으로 바뀌는 로그 정규 가격 (역배열/돌파 구간이 섞이도록)
+
+    Args:
+        n: 캔들 수
+        seed: 난수 시드
+        index: 심볼 번호 (심볼마다 다른 난수열)
+        start_ms: 첫 캔들 시각 (ms)
+        interval_ms: 캔들 간격 (ms)
+
+    Returns:
+        (캔들 시각 int64 배열(ms), KLINE_FIELDS 순서의 float64 2차원 배열)
+    """
+    rng = np.random.default_rng([seed, index])
+
+    # 240캔들마다 추세 변경
+    drift = np.repeat(rng.normal(0, 0.0015, n // 240 + 1), 240)[:n]
+    log_returns = drift + rng.normal(0, 0.006, n)
+    close = rng.uniform(0.1, 1000) * np.exp(np.cumsum(log_returns))
+
+    open_ = np.empty(n)
+    open_[0] = close[0]
+    open_[1:] = close[:-1]
+    high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.002, n)))
+    low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.002, n)))
+    volume = rng.lognormal(10, 1, n)
+    quote_volume = volume * (open_ + close) / 2
+    taker_ratio = rng.uniform(0.3, 0.7, n)
+
+    values = np.column_stack([
+        open_, high, low, close, volume,
+        quote_volume, volume * taker_ratio, quote_volume * taker_ratio,
+    ])
+    timestamps = start_ms + np.arange(n, dtype=np.int64) * interval_ms
+
+    return timestamps, values
+
+
+def make_frame(n: int = 1060, seed: int = 42, index: int = 0, **kwargs) -> pd.DataFrame:
+    """
+    합성 캔들 데이터프레임 생성 (get_klines 결과와 같은 형식)
+
+    Args:
+        n: 캔들 수
+        seed: 난수 시드
+        index: 심볼 번호
+
+    Returns:
+        캔들 데이터프레임
+    """
+    return frame_from_arrays(*make_candles(n, seed, index, **kwargs))
+
+
+def to_raw_klines(timestamps: np.ndarray, values: np.ndarray, interval_ms: int = INTERVAL_MS) -> List[List]:
+    """
+    캔들 배열을 futures_klines 응답 형식(문자열 값 리스트)으로 변환
+
+    Args:
+        timestamps: 캔들 시각 배열 (ms)
+        values: KLINE_FIELDS 순서의 값 배열
+
+    Returns:
+        futures_klines 형식 리스트
+    """
+    o, h, l, c, v, qv, tb, tq = (values[:, i] for i in range(len(KLINE_FIELDS)))
+    return [
+        [
+            int(ts), f"{o[i]:.8g}", f"{h[i]:.8g}", f"{l[i]:.8g}", f"{c[i]:.8g}", f"{v[i]:.3f}",
+            int(ts) + interval_ms - 1, f"{qv[i]:.4f}", int(v[i] // 10), f"{tb[i]:.3f}", f"{tq[i]:.4f}", "0",
+        ]
+        for i, ts in enumerate(timestamps)
+    ]
+
+
+def make_raw_klines(n: int = 1060, seed: int = 42, index: int = 0, **kwargs) -> List[List]:
+    """
+    합성 futures_klines 응답 생성
+
+    Args:
+        n: 캔들 수
+        seed: 난수 시드
+        index: 심볼 번호
+
+    Returns:
+        futures_klines 형식 리스트
+    """
+    return to_raw_klines(*make_candles(n, seed, index, **kwargs))
+
+
+def make_universe(n_symbols: int, n: int = 1060, seed: int = 42) -> Dict[str, pd.DataFrame]:
+    """
+    여러 심볼의 합성 캔들 데이터프레임 생성
+
+    Args:
+        n_symbols: 심볼 수
+        n: 심볼당 캔들 수
+        seed: 난수 시드
+
+    Returns:
+        {심볼: 캔들 데이터프레임}
+    """
+    return {symbol_name(i): make_frame(n, seed, i) for i in range(n_symbols)}
@@ -15,6 +15,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from src.monitor import SMAMonitor
 from src.notifier import Notifier
+from src import metrics
 
 
 def setup_logging(level: str = "INFO", log_file: str = None):
@@ -126,27 +127,38 @@ def main():
     # 모니터 초기화
     monitor = SMAMonitor(config)
 
-    # 모드별 실행
-    if args.test_notification:
-        # 알림 테스트
-        print("알림 테스트 실행 중...")
-        monitor.notifier.test_notifications()
-
-    elif args.test:
-        # 특정 심볼 테스트
-        symbol = args.test.upper()
-        if not symbol.endswith('USDT'):
-            symbol += 'USDT'
-        monitor.test_single_symbol(symbol)
-
-    elif args.status:
-        # 상태 출력
-        monitor.update_symbol_list()
-        monitor.print_status()
-
-    else:
-        # 메인 모니터링 실행
-        monitor.run()
+    # 모드별 실행 (어느 경로든 종료 시 리소스 정리)
+    try:
+        if args.test_notification:
+            # 알림 테스트
+            print("알림 테스트 실행 중...")
+            monitor.notifier.test_notifications()
+
+        elif args.test:
+            # 특정 심볼 테스트
+            symbol = args.test.upper()
+            if not symbol.endswith('USDT'):
+                symbol += 'USDT'
+            monitor.test_single_symbol(symbol)
+
+        elif args.status:
+            # 상태 출력
+            monitor.update_symbol_list()
+            monitor.print_status()
+
+        else:
+            # 메트릭 엔드포인트 (선택)
+            metrics_config = config.get('METRICS', {})
+            if metrics_config.get('ENABLED', False):
+                metrics.start_http_server(
+                    port=metrics_config.get('PORT', 9108),
+                    host=metrics_config.get('HOST', '127.0.0.1')
+                )
+
+            # 메인 모니터링 실행
+            monitor.run()
+    finally:
+        monitor.close()
 
 
 if __name__ == "__main__":
@@ -50,11 +50,14 @@ def main():
     config = load_config()
     monitor = SMAMonitor(config)
 
-    # 심볼 리스트 업데이트
-    monitor.update_symbol_list()
-
-    # 한 번만 스캔
-    signal_count = monitor.scan_all_symbols()
+    try:
+        # 심볼 리스트 업데이트
+        monitor.update_symbol_list()
+
+        # 한 번만 스캔
+        signal_count = monitor.scan_all_symbols()
+    finally:
+        monitor.close()
 
     if signal_count > 0:
         logger.info(f"✓ {signal_count}개 시그널 발견!")
@@ -0,0 +1,194 @@
+"""
+알림 쿨다운 저장소 모듈
+(심볼, 시그널 타입)별 쿨다운 만료 시각과 알림 이력을 SQLite에 저장해 재시작 후에도 유지
+"""
+import heapq
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS alert_cooldown (
+    symbol TEXT NOT NULL,
+    signal_type TEXT NOT NULL,
+    alerted_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (symbol, signal_type)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS alert_cooldown_expires ON alert_cooldown (expires_at);
+CREATE TABLE IF NOT EXISTS alert_history (
+    alerted_at REAL NOT NULL,
+    symbol TEXT NOT NULL,
+    signal_type TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS alert_history_time ON alert_history (alerted_at);
+"""
+
+
+class AlertStore:
+    """쿨다운 저장소 (조회는 메모리, 기록은 SQLite에 바로 반영)"""
+
+    def __init__(self, path: Optional[str] = None, history_days: float = 30.0, shared: bool = False):
+        """
+        초기화
+
+        Args:
+            path: SQLite 파일 경로 (None이면 메모리에만 보관)
+            history_days: 알림 이력 보관 기간 (일)
+            shared: 여러 인스턴스가 같은 파일을 쓰는지 여부 (True면 조회도 SQLite에서)
+        """
+        self.path = path
+        self.history_seconds = history_days * 86400
+        self.shared = shared and path is not None
+
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+        # 다른 프로세스가 쓰기 잠금을 잡고 있으면 최대 timeout초 대기
+        self._db = sqlite3.connect(path or ':memory:', timeout=10.0, check_same_thread=False, isolation_level=None)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+        # {(심볼, 시그널 타입): 만료 시각} + 만료 순 힙
+        self._expires: Dict[Tuple[str, str], float] = {}
+        self._heap: List[Tuple[float, Tuple[str, str]]] = []
+
+        self.purge_expired()
+        now = time.time()
+        for symbol, signal_type, expires_at in self._db.execute(
+                'SELECT symbol, signal_type, expires_at FROM alert_cooldown WHERE expires_at > ?', (now,)):
+            self._expires[(symbol, signal_type)] = expires_at
+            self._heap.append((expires_at, (symbol, signal_type)))
+        heapq.heapify(self._heap)
+
+        logger.info(f"알림 쿨다운 저장소 초기화: {path or '메모리'} (쿨다운 중 {len(self._expires)}개)")
+
+    def __len__(self) -> int:
+        return len(self._expires)
+
+    def remaining(self, symbol: str, signal_type: str, now: Optional[float] = None) -> float:
+        """
+        남은 쿨다운 (초, 쿨다운 중이 아니면 0)
+
+        Args:
+            symbol: 심볼
+            signal_type: 시그널 타입
+            now: 기준 시각 (epoch 초, 기본 현재)
+        """
+        if self.shared:
+            # 다른 인스턴스의 기록도 반영
+            with self._lock:
+                row = self._db.execute(
+                    'SELECT expires_at FROM alert_cooldown WHERE symbol = ? AND signal_type = ?',
+                    (symbol, signal_type)).fetchone()
+            expires_at = row[0] if row else None
+        else:
+            expires_at = self._expires.get((symbol, signal_type))
+        if expires_at is None:
+            return 0.0
+        return max(0.0, expires_at - (time.time() if now is None else now))
+
+    def record(self, symbol: str, signal_type: str, cooldown: float, now: Optional[float] = None) -> bool:
+        """
+        알림 기록 (쿨다운 시작)
+
+        쿨다운 확인과 기록을 한 쓰기 트랜잭션으로 처리하므로, 같은 파일을 쓰는 여러 인스턴스가
+        동시에 기록해도 한 곳만 성공한다.
+
+        Args:
+            symbol: 심볼
+            signal_type: 시그널 타입
+            cooldown: 쿨다운 (초)
+            now: 알림 시각 (epoch 초, 기본 현재)
+
+        Returns:
+            기록 여부 (이미 쿨다운 중이면 False)
+        """
+        now = time.time() if now is None else now
+        expires_at = now + cooldown
+        key = (symbol, signal_type)
+
+        with self._lock:
+            try:
+                self._db.execute('BEGIN IMMEDIATE')
+                row = self._db.execute(
+                    'SELECT expires_at FROM alert_cooldown WHERE symbol = ? AND signal_type = ?',
+                    (symbol, signal_type)).fetchone()
+                if row and row[0] > now:
+                    self._db.execute('COMMIT')
+                    return False
+
+                self._db.execute(
+                    'INSERT OR REPLACE INTO alert_cooldown (symbol, signal_type, alerted_at, expires_at) VALUES (?, ?, ?, ?)',
+                    (symbol, signal_type, now, expires_at))
+                self._db.execute(
+                    'INSERT INTO alert_history (alerted_at, symbol, signal_type) VALUES (?, ?, ?)',
+                    (now, symbol, signal_type))
+                self._db.execute('COMMIT')
+            except sqlite3.Error:
+                # 트랜잭션이 열린 채로 남으면 이후 BEGIN이 모두 실패하므로 되돌린 뒤 전달
+                if self._db.in_transaction:
+                    self._db.execute('ROLLBACK')
+                raise
+
+            # 커밋에 성공한 경우에만 메모리 인덱스 반영
+            self._expires[key] = expires_at
+            heapq.heappush(self._heap, (expires_at, key))
+
+        self.purge_expired(now)
+        return True
+
+    def purge_expired(self, now: Optional[float] = None) -> int:
+        """
+        만료된 쿨다운과 보관 기간이 지난 이력 삭제 (힙/인덱스로 만료된 항목만 처리)
+
+        Args:
+            now: 기준 시각 (epoch 초, 기본 현재)
+
+        Returns:
+            메모리에서 삭제한 쿨다운 수
+        """
+        now = time.time() if now is None else now
+        removed = 0
+
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                expires_at, key = heapq.heappop(self._heap)
+                # 다시 기록된 항목의 이전 만료 시각은 건너뜀
+                if self._expires.get(key) == expires_at:
+                    del self._expires[key]
+                    removed += 1
+
+            self._db.execute('DELETE FROM alert_cooldown WHERE expires_at <= ?', (now,))
+            self._db.execute('DELETE FROM alert_history WHERE alerted_at < ?', (now - self.history_seconds,))
+
+        return removed
+
+    def history(self, since: Optional[float] = None) -> List[Tuple[float, str, str]]:
+        """
+        알림 이력 조회
+
+        Args:
+            since: 이 시각 이후만 (epoch 초, None이면 전체)
+
+        Returns:
+            (알림 시각, 심볼, 시그널 타입) 리스트 (시간순)
+        """
+        with self._lock:
+            return self._db.execute(
+                'SELECT alerted_at, symbol, signal_type FROM alert_history WHERE alerted_at >= ? ORDER BY alerted_at',
+                (since or 0.0,)).fetchall()
+
+    def close(self):
+        """저장소 닫기"""
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,185 @@
+"""
+비동기 캔들 수집 모듈
+전체 심볼의 캔들을 동시 요청으로 수집 (동시성 제한 + 공용 레이트 리미터)
+"""
+import asyncio
+import time
+from typing import Dict, List, Optional
+import aiohttp
+import pandas as pd
+import logging
+from binance import AsyncClient
+from binance.exceptions import BinanceAPIException, BinanceRequestException
+from .binance_api import BinanceAPI
+from . import metrics
+from .kline_decoder import klines_to_frame
+from .rate_limiter import klines_weight
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncKlineFetcher:
+    """비동기 캔들 수집기"""
+
+    def __init__(self, api: BinanceAPI, api_key: str = "", api_secret: str = "", testnet: bool = False,
+                 concurrency: int = 10):
+        """
+        초기화
+
+        Args:
+            api: 캔들 캐시와 레이트 리미터를 공유할 BinanceAPI
+            api_key: API 키
+            api_secret: API 시크릿
+            testnet: 테스트넷 사용 여부
+            concurrency: 최대 동시 요청 수
+        """
+        self.api = api
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.testnet = testnet
+        self.concurrency = concurrency
+
+        # 스캔 간 keep-alive 연결을 유지하기 위해 이벤트 루프와 클라이언트를 재사용
+        self._loop = asyncio.new_event_loop()
+        self._client: Optional[AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        logger.info(f"비동기 캔들 수집기 초기화: 동시 요청 {concurrency}개")
+
+    async def _get_client(self) -> AsyncClient:
+        """비동기 클라이언트 (최초 1회 생성, 동시 요청 시작 전에 호출)"""
+        if self._client is None:
+            if self.api.futures_url:
+                # 로컬 대체 서버: ping/서버 시간 조회 생략
+                self._client = AsyncClient(self.api_key, self.api_secret)
+                self._client.FUTURES_URL = self.api.futures_url
+            else:
+                self._client = await AsyncClient.create(self.api_key, self.api_secret, testnet=self.testnet)
+        return self._client
+
+    async def _fetch_klines(self, symbol: str, interval: str, limit: int,
+                            start_time: Optional[int] = None) -> pd.DataFrame:
+        """
+        캔들 데이터 1회 요청
+
+        Args:
+            symbol: 심볼
+            interval: 시간 프레임
+            limit: 가져올 캔들 수
+            start_time: 시작 시각 (ms)
+
+        Returns:
+            OHLCV 데이터프레임 (실패 시 빈 데이터프레임)
+        """
+        params = {'symbol': symbol, 'interval': interval, 'limit': limit}
+        if start_time is not None:
+            params['startTime'] = start_time
+
+        limiter = self.api.rate_limiter
+        weight = klines_weight(limit)
+        await limiter.acquire_async(weight)
+        metrics.API_REQUEST_WEIGHT.inc(weight, endpoint='futures_klines')
+
+        async with self._semaphore:
+            start = time.perf_counter()
+            try:
+                client = self._client
+                klines = await client.futures_klines(**params)
+            except BinanceAPIException as e:
+                metrics.API_ERRORS.inc(endpoint='futures_klines', status=e.status_code)
+                response = getattr(e, 'response', None)
+                limiter.handle_error_status(e.status_code, getattr(response, 'headers', None))
+                logger.error(f"{symbol} 캔들 데이터 가져오기 실패: {e}")
+                return pd.DataFrame()
+            except (BinanceRequestException, aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.error(f"{symbol} 캔들 데이터 가져오기 실패: {e}")
+                return pd.DataFrame()
+            finally:
+                metrics.API_REQUEST_SECONDS.observe(time.perf_counter() - start, endpoint='futures_klines')
+
+            response = getattr(client, 'response', None)
+            limiter.update_from_headers(getattr(response, 'headers', None))
+
+        return klines_to_frame(klines)
+
+    async def _fetch_symbol(self, symbol: str, interval: str, limit: int) -> pd.DataFrame:
+        """
+        심볼 캔들 수집 (캐시가 있으면 증분 조회)
+
+        Args:
+            symbol: 심볼
+            interval: 시간 프레임
+            limit: 필요한 캔들 수
+
+        Returns:
+            OHLCV 데이터프레임
+        """
+        cache = self.api.kline_cache
+        plan = cache.plan_request(symbol, interval, limit)
+
+        if plan is not None:
+            df_new = await self._fetch_klines(symbol, interval, plan['limit'], plan['start_time'])
+            if df_new.empty:
+                return df_new
+
+            merged = cache.merge(symbol, interval, df_new, limit)
+            if merged is not None:
+                return merged
+
+        df = await self._fetch_klines(symbol, interval, limit)
+        return cache.store(symbol, interval, df, limit)
+
+    async def _fetch_all(self, symbols: List[str], interval: str, limit: int) -> Dict[str, pd.DataFrame]:
+        """전체 심볼 동시 수집"""
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+
+        # 요청마다 클라이언트를 만들지 않도록 동시 요청 전에 한 번만 생성
+        try:
+            await self._get_client()
+        except (BinanceAPIException, BinanceRequestException, aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"비동기 클라이언트 생성 실패: {e}")
+            return {}
+
+        results = await asyncio.gather(
+            *(self._fetch_symbol(symbol, interval, limit) for symbol in symbols),
+            return_exceptions=True
+        )
+
+        frames = {}
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, Exception):
+                logger.error(f"{symbol} 캔들 수집 중 오류: {result}")
+                continue
+            frames[symbol] = result
+
+        return frames
+
+    def fetch_all(self, symbols: List[str], interval: str, limit: int) -> Dict[str, pd.DataFrame]:
+        """
+        전체 심볼 캔들 수집
+
+        Args:
+            symbols: 심볼 리스트
+            interval: 시간 프레임
+            limit: 필요한 캔들 수
+
+        Returns:
+            {심볼: OHLCV 데이터프레임} (실패한 심볼은 제외)
+        """
+        start = self._loop.time()
+        frames = self._loop.run_until_complete(self._fetch_all(symbols, interval, limit))
+        elapsed = self._loop.time() - start
+
+        logger.info(f"캔들 수집 완료: {len(frames)}/{len(symbols)}개 심볼, {elapsed:.1f}초")
+        return frames
+
+    def close(self):
+        """연결 및 이벤트 루프 종료"""
+        if self._loop.is_closed():
+            return
+
+        if self._client is not None:
+            self._loop.run_until_complete(self._client.close_connection())
+            self._client = None
+
+        self._loop.close()
@@ -0,0 +1,407 @@
+"""
+백테스트 모듈
+SignalDetector 규칙을 전체 캔들 이력에 대해 NumPy 마스크로 한 번에 계산 (네트워크 사용 안 함)
+"""
+import os
+import glob
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+import logging
+from .candle_store import RECORD_DTYPE
+from .kline_cache import INTERVAL_MS, KLINE_COLUMNS
+from .signal_detector import (
+    NEAR_TOLERANCE_PCT,
+    MOMENTUM_FILTER_CANDLES,
+    MOMENTUM_FILTER_MIN_CHANGE_PCT,
+    MOMENTUM_FILTER_MIN_VOLUME,
+    timeframe_candles,
+)
+from .momentum_engine import MomentumWindow
+
+logger = logging.getLogger(__name__)
+
+# 역배열 판단에 사용하는 SMA (check_reverse_alignment_flexible과 동일)
+REVERSE_PERIODS = [120, 240, 480]
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    누적합으로 이동평균 계산 (window 미만 구간은 NaN)
+
+    Args:
+        values: 값 배열
+        window: 기간
+
+    Returns:
+        이동평균 배열
+    """
+    result = np.full(len(values), np.nan)
+    if window <= 0 or len(values) < window:
+        return result
+
+    cumsum = np.concatenate(([0.0], np.cumsum(values, dtype=np.float64)))
+    result[window - 1:] = (cumsum[window:] - cumsum[:-window]) / window
+    return result
+
+
+def rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    누적합으로 이동합계 계산 (window 미만 구간은 NaN)
+
+    Args:
+        values: 값 배열
+        window: 기간
+
+    Returns:
+        이동합계 배열
+    """
+    return rolling_mean(values, window) * window
+
+
+def pct_change(values: np.ndarray, periods: int) -> np.ndarray:
+    """
+    N개 캔들 전 대비 상승률 (%)
+
+    Args:
+        values: 종가 배열
+        periods: 비교할 캔들 수
+
+    Returns:
+        상승률 배열 (앞 periods개는 NaN)
+    """
+    result = np.full(len(values), np.nan)
+    if len(values) > periods:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result[periods:] = (values[periods:] - values[:-periods]) / values[:-periods] * 100
+    return result
+
+
+def apply_cooldown(timestamps: np.ndarray, mask: np.ndarray, cooldown_ms: int) -> np.ndarray:
+    """
+    쿨다운 적용 (마지막 알림 후 cooldown_ms 이내 후보 제거)
+    후보 사이를 searchsorted로 건너뛰므로 반복 횟수는 실제 알림 수와 같음
+
+    Args:
+        timestamps: 캔들 시각 배열 (ms, 오름차순)
+        mask: 조건 만족 여부
+        cooldown_ms: 쿨다운 (ms)
+
+    Returns:
+        알림 발생 여부 배열
+    """
+    candidates = np.flatnonzero(mask)
+    fired = np.zeros(len(mask), dtype=bool)
+    if len(candidates) == 0:
+        return fired
+
+    candidate_ts = timestamps[candidates]
+    i = 0
+    while i < len(candidates):
+        fired[candidates[i]] = True
+        # 경과 시간 >= 쿨다운인 첫 후보로 이동
+        i = int(np.searchsorted(candidate_ts, candidate_ts[i] + cooldown_ms, side='left'))
+
+    return fired
+
+
+def load_history(path: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    로컬 캔들 파일 읽기
+    - .bin: CandleStore 레코드 파일
+    - .csv: timestamp(ms 또는 날짜 문자열) + OHLCV (+ quote_volume 등) 컬럼
+
+    Args:
+        path: 파일 경로
+
+    Returns:
+        (캔들 시각 int64 배열(ms), KLINE_COLUMNS 순서의 float64 2차원 배열)
+        csv에 없는 컬럼은 NaN
+    """
+    if path.endswith('.bin'):
+        records = np.fromfile(path, dtype=RECORD_DTYPE)
+        timestamps = records['timestamp'].astype(np.int64)
+        values = np.column_stack([records[col] for col in KLINE_COLUMNS]).astype(np.float64)
+    else:
+        df = pd.read_csv(path)
+        ts = df['timestamp']
+        if pd.api.types.is_numeric_dtype(ts):
+            timestamps = ts.to_numpy(dtype=np.int64)
+        else:
+            timestamps = pd.to_datetime(ts).dt.as_unit('ms').astype('int64').to_numpy()
+        values = np.column_stack([
+            df[col].to_numpy(dtype=np.float64) if col in df.columns else np.full(len(df), np.nan)
+            for col in KLINE_COLUMNS
+        ])
+
+    order = np.argsort(timestamps, kind='stable')
+    return timestamps[order], values[order]
+
+
+def load_directory(directory: str, symbols: Optional[List[str]] = None) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """
+    디렉터리의 심볼별 캔들 파일 읽기 (파일 이름 = 심볼)
+
+    Args:
+        directory: 캔들 파일 디렉터리 (예: data/candles/15m)
+        symbols: 읽을 심볼 리스트 (None이면 전체)
+
+    Returns:
+        {심볼: (캔들 시각 배열, 값 배열)}
+    """
+    histories = {}
+    for path in sorted(glob.glob(os.path.join(directory, '*.bin')) + glob.glob(os.path.join(directory, '*.csv'))):
+        symbol = os.path.splitext(os.path.basename(path))[0]
+        if symbols is not None and symbol not in symbols:
+            continue
+        if symbol in histories:
+            logger.warning(f"{symbol}: 캔들 파일 중복, {os.path.basename(path)} 무시")
+            continue
+        histories[symbol] = load_history(path)
+
+    logger.info(f"백테스트 데이터 로드: {len(histories)}개 심볼 ({directory})")
+    return histories
+
+
+class Backtester:
+    """SignalDetector 규칙 벡터화 백테스트"""
+
+    def __init__(self, target_sma: int = 480, cooldown: int = 3600,
+                 momentum_timeframe: str = '24h', momentum_min_volume: float = 100_000_000,
+                 momentum_min_price_change: float = 15.0,
+                 momentum_windows: Optional[List[MomentumWindow]] = None,
+                 forward_candles: List[int] = [4, 16, 96], interval: str = '15m'):
+        """
+        초기화
+
+        Args:
+            target_sma: 역배열 기준 SMA 기간 (480만 지원)
+            cooldown: 같은 코인 재알림 대기 시간 (초)
+            momentum_timeframe: 모멘텀 시간 기준 (4h, 6h, 12h, 24h)
+            momentum_min_volume: 모멘텀 최소 거래대금 (USD)
+            momentum_min_price_change: 모멘텀 최소 상승률 (%)
+            momentum_windows: 모멘텀 구간 리스트 (주어지면 위 세 값 대신 사용, 여러 구간 동시 계산)
+            forward_candles: 시그널 이후 수익률을 계산할 캔들 수 리스트
+            interval: 캔들 시간 프레임
+        """
+        self.target_sma = target_sma
+        self.cooldown_ms = int(cooldown * 1000)
+        self.interval = interval
+        self.momentum_windows = momentum_windows or [MomentumWindow(
+            timeframe=momentum_timeframe,
+            candles=timeframe_candles(momentum_timeframe, interval),
+            min_volume_usd=momentum_min_volume,
+            min_price_change_pct=momentum_min_price_change,
+        )]
+        self.forward_candles = forward_candles
+
+    @staticmethod
+    def _quote_volume(values: np.ndarray) -> np.ndarray:
+        """캔들별 거래대금 (quote_volume이 없으면 거래량 × 종가)"""
+        close = values[:, KLINE_COLUMNS.index('close')]
+        quote_volume = values[:, KLINE_COLUMNS.index('quote_volume')]
+        estimated = values[:, KLINE_COLUMNS.index('volume')] * close
+        return np.where(np.isnan(quote_volume), estimated, quote_volume)
+
+    def hourly_momentum(self, timestamps: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        캔들별 24시간 상승률/거래대금 (1시간봉 24개 기준, analyze_signal 리샘플과 동일)
+
+        각 캔들이 속한 1시간봉을 진행 중인 마지막 봉으로 보고,
+        24개 봉 전 1시간봉 종가 대비 상승률과 최근 24개 봉 거래대금 합계를 계산한다.
+
+        Args:
+            timestamps: 캔들 시각 배열 (ms, 오름차순)
+            values: KLINE_COLUMNS 순서의 값 배열
+
+        Returns:
+            (상승률 배열, 거래대금 배열) (계산 불가 구간은 NaN)
+        """
+        close = values[:, KLINE_COLUMNS.index('close')]
+        quote_volume = self._quote_volume(values)
+        hour_ms = INTERVAL_MS['1h']
+
+        if INTERVAL_MS[self.interval] >= hour_ms:
+            candles = timeframe_candles('24h', self.interval)
+            return pct_change(close, candles), rolling_sum(quote_volume, candles)
+
+        # 최근 24개 1시간봉의 첫 봉 시작 시각과 그 첫 캔들 위치
+        window_start = timestamps - timestamps % hour_ms - (MOMENTUM_FILTER_CANDLES - 1) * hour_ms
+        start = np.searchsorted(timestamps, window_start, side='left')
+        past = start - 1
+
+        # 비교 기준 봉(24개 전)이 데이터 시작의 잘린 봉이면 계산하지 않음 (리샘플 시 버려지는 봉)
+        first = timestamps[0] if len(timestamps) else 0
+        first_complete = first if first % hour_ms == 0 else first - first % hour_ms + hour_ms
+        valid = (past >= 0) & (window_start - hour_ms >= first_complete)
+
+        cumsum = np.concatenate(([0.0], np.cumsum(quote_volume, dtype=np.float64)))
+        volume = np.full(len(close), np.nan)
+        change = np.full(len(close), np.nan)
+        rows = np.flatnonzero(valid)
+        volume[rows] = cumsum[rows + 1] - cumsum[start[rows]]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            change[rows] = (close[rows] - close[past[rows]]) / close[past[rows]] * 100
+
+        return change, volume
+
+    def reverse_near_mask(self, values: np.ndarray, timestamps: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        역배열 + target SMA 근처 + 24시간 모멘텀 조건 (analyze_signal과 동일)
+
+        Args:
+            values: KLINE_COLUMNS 순서의 값 배열
+            timestamps: 캔들 시각 배열 (ms, None이면 기본 간격의 연속 캔들로 가정)
+
+        Returns:
+            조건 만족 여부 배열
+        """
+        if self.target_sma != 480:
+            return np.zeros(len(values), dtype=bool)
+
+        close = values[:, KLINE_COLUMNS.index('close')]
+        sma = {period: rolling_mean(close, period) for period in REVERSE_PERIODS}
+        target = sma[self.target_sma]
+
+        with np.errstate(invalid='ignore'):
+            reverse = (sma[120] < target) & (sma[240] < target)
+            near = (
+                (close >= target * (1 - NEAR_TOLERANCE_PCT / 100))
+                & (close <= target * (1 + NEAR_TOLERANCE_PCT / 100))
+            )
+            if timestamps is None:
+                timestamps = np.arange(len(close), dtype=np.int64) * INTERVAL_MS[self.interval]
+            change, volume = self.hourly_momentum(timestamps, values)
+            momentum = (change >= MOMENTUM_FILTER_MIN_CHANGE_PCT) & (volume >= MOMENTUM_FILTER_MIN_VOLUME)
+
+        return reverse & near & momentum
+
+    def momentum_masks(self, values: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        모멘텀 조건 (analyze_momentum_readings와 동일, 구간별)
+        거래대금 누적합을 한 번만 계산해 모든 구간에 사용
+
+        Args:
+            values: KLINE_COLUMNS 순서의 값 배열
+
+        Returns:
+            {시그널 타입: 조건 만족 여부 배열}
+        """
+        close = values[:, KLINE_COLUMNS.index('close')]
+        cumsum = np.concatenate(([0.0], np.cumsum(self._quote_volume(values), dtype=np.float64)))
+
+        masks = {}
+        for window in self.momentum_windows:
+            candles = window.candles
+            volume = np.full(len(close), np.nan)
+            if 0 < candles <= len(close):
+                volume[candles - 1:] = cumsum[candles:] - cumsum[:-candles]
+
+            with np.errstate(invalid='ignore'):
+                change = pct_change(close, candles)
+                masks[f'STRONG_MOMENTUM_{window.timeframe.upper()}'] = (
+                    (change >= window.min_price_change_pct) & (volume >= window.min_volume_usd)
+                )
+
+        return masks
+
+    def forward_returns(self, close: np.ndarray, rows: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        시그널 이후 N캔들 수익률 (%)
+
+        Args:
+            close: 종가 배열
+            rows: 시그널 행 번호
+
+        Returns:
+            {'return_{N}': 수익률 배열 (데이터 부족 시 NaN)}
+        """
+        returns = {}
+        for n in self.forward_candles:
+            target = rows + n
+            valid = target < len(close)
+            result = np.full(len(rows), np.nan)
+            result[valid] = (close[target[valid]] - close[rows[valid]]) / close[rows[valid]] * 100
+            returns[f'return_{n}'] = result
+        return returns
+
+    def run_symbol(self, symbol: str, timestamps: np.ndarray, values: np.ndarray) -> pd.DataFrame:
+        """
+        단일 심볼 백테스트
+
+        Args:
+            symbol: 심볼
+            timestamps: 캔들 시각 배열 (ms, 오름차순)
+            values: KLINE_COLUMNS 순서의 값 배열
+
+        Returns:
+            시그널 데이터프레임 (symbol, timestamp, signal_type, price, return_N ...)
+        """
+        close = values[:, KLINE_COLUMNS.index('close')]
+        rules = {
+            f'REVERSE_ALIGNED_AND_NEAR_SMA{self.target_sma}': self.reverse_near_mask(values, timestamps),
+            **self.momentum_masks(values),
+        }
+
+        frames = []
+        for signal_type, mask in rules.items():
+            rows = np.flatnonzero(apply_cooldown(timestamps, mask, self.cooldown_ms))
+            if len(rows) == 0:
+                continue
+
+            frames.append(pd.DataFrame({
+                'symbol': symbol,
+                'timestamp': pd.to_datetime(timestamps[rows], unit='ms'),
+                'signal_type': signal_type,
+                'price': close[rows],
+                **self.forward_returns(close, rows),
+            }))
+
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+
+    def run(self, histories: Dict[str, Tuple[np.ndarray, np.ndarray]]) -> pd.DataFrame:
+        """
+        전체 심볼 백테스트
+
+        Args:
+            histories: {심볼: (캔들 시각 배열, 값 배열)}
+
+        Returns:
+            시그널 데이터프레임 (시각 순)
+        """
+        frames = [
+            self.run_symbol(symbol, timestamps, values)
+            for symbol, (timestamps, values) in histories.items()
+            if len(timestamps)
+        ]
+        frames = [frame for frame in frames if not frame.empty]
+
+        if not frames:
+            return pd.DataFrame()
+
+        signals = pd.concat(frames, ignore_index=True)
+        return signals.sort_values(['timestamp', 'symbol'], kind='stable').reset_index(drop=True)
+
+    def summarize(self, signals: pd.DataFrame) -> pd.DataFrame:
+        """
+        시그널 타입별 요약 (건수, 평균/중앙값 수익률, 승률)
+
+        Args:
+            signals: run() 결과
+
+        Returns:
+            요약 데이터프레임
+        """
+        if signals.empty:
+            return pd.DataFrame()
+
+        return_cols = [f'return_{n}' for n in self.forward_candles]
+        grouped = signals.groupby('signal_type')
+        summary = grouped.size().to_frame('count')
+        for col in return_cols:
+            summary[f'{col}_mean'] = grouped[col].mean()
+            summary[f'{col}_median'] = grouped[col].median()
+            summary[f'{col}_win_rate'] = grouped[col].apply(lambda r: (r.dropna() > 0).mean() * 100)
+        return summary
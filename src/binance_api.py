@@ -2,13 +2,22 @@
 Binance API 연결 모듈
 바이낸스 선물 시장 데이터 수집
 """
-import time
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
 from binance.client import Client
 from binance.exceptions import BinanceAPIException
+import numpy as np
 import pandas as pd
 import logging
-from datetime import datetime, timedelta
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from .kline_cache import INTERVAL_MS, KlineCache
+from . import kline_decoder, metrics
+from .candle_store import CandleStore
+from .daily_closes import DailyCloseTable
+from .market_snapshot import MarketSnapshot, parse_perpetual_symbols
+from .rate_limiter import WeightRateLimiter, request_weight
+from .resampler import KlineResampler
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +25,9 @@ logger = logging.getLogger(__name__)
 class BinanceAPI:
     """바이낸스 API 클라이언트"""
 
-    def __init__(self, api_key: str = "", api_secret: str = "", testnet: bool = False):
+    def __init__(self, api_key: str = "", api_secret: str = "", testnet: bool = False,
+                 weight_per_minute: int = 1800, snapshot_ttl: float = 300,
+                 candle_store: Optional[CandleStore] = None, futures_url: str = ""):
         """
         초기화
 
@@ -24,20 +35,113 @@ class BinanceAPI:
             api_key: API 키 (읽기 전용도 가능, 비어있어도 됨)
             api_secret: API 시크릿
             testnet: 테스트넷 사용 여부
+            weight_per_minute: 분당 사용할 최대 요청 웨이트
+            snapshot_ttl: 거래소 정보/24시간 티커 스냅샷 유지 시간 (초)
+            candle_store: 디스크 캔들 저장소 (재시작 시 캔들 복원용, None이면 사용 안 함)
+            futures_url: 선물 API 주소 (예: http://127.0.0.1:8765/fapi, 비어있으면 바이낸스 기본 주소)
         """
         try:
-            self.client = Client(api_key, api_secret, testnet=testnet)
-            logger.info(f"바이낸스 API 연결 완료 (Testnet: {testnet})")
-
-            # 거래대금 순위 캐시
-            self._volume_rank_cache: Optional[Dict[str, Dict]] = None
-            self._volume_rank_cache_time: Optional[datetime] = None
+            self.futures_url = futures_url.rstrip('/')
+            self.testnet = testnet
+
+            if self.futures_url:
+                # 로컬 대체 서버: 현물 API ping 생략, 선물 요청만 지정 주소로
+                self.client = Client(api_key, api_secret, ping=False)
+                self.client.FUTURES_URL = self.futures_url
+                logger.info(f"바이낸스 선물 API 주소 변경: {self.futures_url}")
+            else:
+                self.client = Client(api_key, api_secret, testnet=testnet)
+                logger.info(f"바이낸스 API 연결 완료 (Testnet: {testnet})")
+
+            # 거래소 정보 + 24시간 티커 스냅샷 (심볼 선정/순위 공용)
+            self._snapshot: Optional[MarketSnapshot] = None
+            self._snapshot_ttl = snapshot_ttl
+            self._snapshot_lock = threading.Lock()
+
+            # 거래대금 순위는 이보다 오래된 스냅샷도 허용
             self._volume_rank_cache_ttl = 3600  # 1시간 캐시
 
+            # 캔들 캐시 (증분 조회용, 저장소가 있으면 재시작 후에도 이어서 사용)
+            self.kline_cache = KlineCache(candle_store=candle_store)
+
+            # 캐시된 기본 캔들에서 만든 상위 시간 프레임 캔들 (1h, 4h, 1d ...)
+            self.resampler = KlineResampler()
+
+            # 완성된 일봉 종가 테이블 (N일 상승률 일괄 계산용, UTC 하루 1회 갱신)
+            self.daily_closes = DailyCloseTable()
+
+            # 전체 API 호출 공용 레이트 리미터
+            self.rate_limiter = WeightRateLimiter(weight_per_minute)
+
         except Exception as e:
             logger.error(f"바이낸스 API 연결 실패: {e}")
             raise
 
+    def _request(self, method: str, func: Optional[Callable] = None, **params):
+        """
+        레이트 리미터를 거쳐 클라이언트 메서드 호출
+
+        Args:
+            method: python-binance 클라이언트 메서드 이름 (웨이트/메트릭 기준)
+            func: 클라이언트 메서드 대신 호출할 함수 (None이면 method 호출)
+            **params: 요청 파라미터
+
+        Returns:
+            API 응답
+        """
+        weight = request_weight(method, params)
+        self.rate_limiter.acquire(weight)
+        metrics.API_REQUEST_WEIGHT.inc(weight, endpoint=method)
+
+        start = time.perf_counter()
+        try:
+            result = (func or getattr(self.client, method))(**params)
+        except BinanceAPIException as e:
+            metrics.API_ERRORS.inc(endpoint=method, status=e.status_code)
+            response = getattr(e, 'response', None)
+            self.rate_limiter.handle_error_status(e.status_code, getattr(response, 'headers', None))
+            raise
+        finally:
+            metrics.API_REQUEST_SECONDS.observe(time.perf_counter() - start, endpoint=method)
+
+        response = getattr(self.client, 'response', None)
+        self.rate_limiter.update_from_headers(getattr(response, 'headers', None))
+
+        return result
+
+    def get_market_snapshot(self, max_age: Optional[float] = None) -> MarketSnapshot:
+        """
+        거래소 정보 + 24시간 티커 스냅샷 가져오기 (TTL 내에는 재사용)
+
+        Args:
+            max_age: 허용할 최대 스냅샷 나이 (초, None이면 기본 TTL)
+
+        Returns:
+            시장 스냅샷
+
+        Raises:
+            BinanceAPIException: 갱신 실패 및 이전 스냅샷 없음
+        """
+        max_age = self._snapshot_ttl if max_age is None else max_age
+
+        with self._snapshot_lock:
+            if self._snapshot is not None and self._snapshot.age <= max_age:
+                return self._snapshot
+
+            try:
+                exchange_info = self._request('futures_exchange_info')
+                tickers = self._request('futures_ticker')
+            except BinanceAPIException as e:
+                if self._snapshot is None:
+                    raise
+                logger.warning(f"시장 스냅샷 갱신 실패, 이전 스냅샷 사용 ({self._snapshot.age:.0f}초 전): {e}")
+                return self._snapshot
+
+            self._snapshot = MarketSnapshot(parse_perpetual_symbols(exchange_info), tickers)
+            logger.debug(f"시장 스냅샷 갱신: 티커 {len(self._snapshot)}개, "
+                         f"USDT 무기한 선물 {len(self._snapshot.perpetual_symbols)}개")
+            return self._snapshot
+
     def get_futures_symbols(self) -> List[str]:
         """
         USDT 선물 마켓의 모든 심볼 가져오기
@@ -46,14 +150,7 @@ class BinanceAPI:
             USDT 선물 심볼 리스트
         """
         try:
-            exchange_info = self.client.futures_exchange_info()
-            symbols = [
-                s['symbol']
-                for s in exchange_info['symbols']
-                if s['symbol'].endswith('USDT')
-                   and s['status'] == 'TRADING'
-                   and s['contractType'] == 'PERPETUAL'
-            ]
+            symbols = list(self.get_market_snapshot().perpetual_list)
             logger.info(f"총 {len(symbols)}개 USDT 선물 심볼 발견")
             return symbols
         except BinanceAPIException as e:
@@ -75,51 +172,18 @@ class BinanceAPI:
             필터링된 심볼 리스트
         """
         try:
-            # 거래소 정보 가져오기 (contractType 확인용)
-            exchange_info = self.client.futures_exchange_info()
-            perpetual_symbols = {
-                s['symbol']
-                for s in exchange_info['symbols']
-                if s['symbol'].endswith('USDT')
-                   and s['status'] == 'TRADING'
-                   and s['contractType'] == 'PERPETUAL'
-            }
-            logger.debug(f"USDT 무기한 선물 계약: {len(perpetual_symbols)}개")
-
-            # 24시간 티커 데이터 가져오기
-            tickers = self.client.futures_ticker()
-
-            filtered_symbols = []
-
-            for ticker in tickers:
-                symbol = ticker['symbol']
-
-                # 1. USDT PERPETUAL 선물만 필터링
-                if symbol not in perpetual_symbols:
-                    continue
-
-                try:
-                    quote_volume = float(ticker.get('quoteVolume', 0))
-                    price_change_pct = float(ticker.get('priceChangePercent', 0))
-
-                    # 2. 거래량 필터 (100M USD 초과)
-                    if quote_volume < min_volume_usd:
-                        continue
-
-                    # 3. 상승률 필터 (7% 이상)
-                    if price_change_pct < min_price_change_pct:
-                        continue
-
-                    filtered_symbols.append(symbol)
-                    logger.debug(f"{symbol}: 거래량=${quote_volume:,.0f}, 상승률={price_change_pct:+.2f}%")
-
-                except (ValueError, TypeError) as e:
-                    logger.debug(f"{symbol} 데이터 파싱 오류: {e}")
-                    continue
+            snapshot = self.get_market_snapshot()
+            logger.debug(f"USDT 무기한 선물 계약: {len(snapshot.perpetual_symbols)}개")
+
+            # 1. USDT PERPETUAL 선물만, 2. 거래량 필터 (100M USD 초과), 3. 상승률 필터 (7% 이상)
+            mask = (
+                snapshot.is_perpetual
+                & (snapshot.quote_volume >= min_volume_usd)
+                & (snapshot.price_change_pct >= min_price_change_pct)
+            )
 
             # 거래량 기준으로 정렬 (많은 순)
-            tickers_dict = {t['symbol']: float(t.get('quoteVolume', 0)) for t in tickers if t['symbol'] in filtered_symbols}
-            filtered_symbols = sorted(filtered_symbols, key=lambda s: tickers_dict.get(s, 0), reverse=True)
+            filtered_symbols = snapshot.select(mask, sort_by=snapshot.quote_volume)
 
             logger.info(f"사전필터 통과: {len(filtered_symbols)}개 심볼 "
                        f"(USD-M PERPETUAL, 거래량≥${min_volume_usd/1_000_000:.0f}M, 상승률≥{min_price_change_pct:+.0f}%)")
@@ -144,22 +208,11 @@ class BinanceAPI:
             심볼 리스트
         """
         try:
-            tickers = self.client.futures_ticker()
-
-            # USDT 선물만 필터링
-            usdt_tickers = [
-                t for t in tickers
-                if t['symbol'].endswith('USDT')
-            ]
-
-            # 거래량(USDT) 기준 정렬
-            sorted_tickers = sorted(
-                usdt_tickers,
-                key=lambda x: float(x.get('quoteVolume', 0)),
-                reverse=True
-            )
+            snapshot = self.get_market_snapshot()
 
-            symbols = [t['symbol'] for t in sorted_tickers[:top_n]]
+            # USDT 선물만, 거래량(USDT) 기준 정렬
+            mask = snapshot.is_usdt & ~np.isnan(snapshot.quote_volume)
+            symbols = snapshot.select(mask, sort_by=snapshot.quote_volume)[:top_n]
             logger.info(f"거래량 상위 {top_n}개 심볼: {symbols[:5]}...")
 
             return symbols
@@ -168,7 +221,8 @@ class BinanceAPI:
             logger.error(f"거래량 상위 심볼 가져오기 실패: {e}")
             return []
 
-    def get_klines(self, symbol: str, interval: str = '5m', limit: int = 1000) -> pd.DataFrame:
+    def get_klines(self, symbol: str, interval: str = '5m', limit: int = 1000,
+                   start_time: Optional[int] = None) -> pd.DataFrame:
         """
         K라인(캔들) 데이터 가져오기
 
@@ -176,37 +230,175 @@ class BinanceAPI:
             symbol: 심볼 (예: BTCUSDT)
             interval: 시간 프레임 (1m, 3m, 5m, 15m, 1h, 4h, 1d 등)
             limit: 가져올 캔들 수 (최대 1500)
+            start_time: 시작 시각 (ms, 지정 시 해당 캔들부터 조회)
 
         Returns:
-            OHLCV 데이터프레임
+            캔들 데이터프레임 (OHLCV + quote_volume, taker_buy_base, taker_buy_quote)
         """
         try:
-            klines = self.client.futures_klines(
-                symbol=symbol,
-                interval=interval,
-                limit=limit
-            )
-
-            # DataFrame으로 변환
-            df = pd.DataFrame(klines, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_volume', 'trades', 'taker_buy_base',
-                'taker_buy_quote', 'ignore'
-            ])
+            params = {'symbol': symbol, 'interval': interval, 'limit': limit}
+            if start_time is not None:
+                params['startTime'] = start_time
 
-            # 데이터 타입 변환
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            for col in ['open', 'high', 'low', 'close', 'volume']:
-                df[col] = df[col].astype(float)
+            klines = self._fetch_klines(params)
 
-            df.set_index('timestamp', inplace=True)
-
-            return df[['open', 'high', 'low', 'close', 'volume']]
+            return kline_decoder.klines_to_frame(klines)
 
         except BinanceAPIException as e:
             logger.error(f"{symbol} 캔들 데이터 가져오기 실패: {e}")
             return pd.DataFrame()
 
+    def _fetch_klines(self, params: Dict) -> List[List]:
+        """
+        캔들 원본 응답 조회
+        orjson이 설치되어 있으면 응답 본문을 직접 받아 orjson으로 파싱한다 (주소/웨이트/에러 처리는 futures_klines와 동일).
+
+        Args:
+            params: futures_klines 요청 파라미터
+
+        Returns:
+            캔들 원본 응답
+        """
+        url = self._klines_url()
+        if kline_decoder.orjson is None or url is None:
+            return self._request('futures_klines', **params)
+
+        return self._request('futures_klines', func=lambda **p: self._get_klines_body(url, **p), **params)
+
+    def _klines_url(self) -> Optional[str]:
+        """
+        orjson 직접 조회용 캔들 주소
+        설정한 선물 주소(없으면 클라이언트의 공개 기본 주소, 테스트넷 포함)에 /v1/klines를 붙인다.
+
+        Returns:
+            캔들 주소 (클라이언트에 주소나 세션이 없으면 None → futures_klines 사용)
+        """
+        if not hasattr(self.client, 'session'):
+            return None
+
+        base = self.futures_url
+        if not base:
+            base = getattr(self.client, 'FUTURES_TESTNET_URL' if self.testnet else 'FUTURES_URL', None)
+        if not base:
+            return None
+
+        return f"{base.rstrip('/')}/v1/klines"
+
+    def _get_klines_body(self, url: str, **params) -> List[List]:
+        """캔들 주소로 직접 요청하고 본문만 orjson으로 파싱 (에러 처리는 futures_klines와 동일)"""
+        response = self.client.session.get(
+            url,
+            params=params,
+            timeout=getattr(self.client, 'REQUEST_TIMEOUT', 10),
+            **(getattr(self.client, '_requests_params', None) or {})
+        )
+        self.client.response = response
+
+        if not (200 <= response.status_code < 300):
+            raise BinanceAPIException(response, response.status_code, response.text)
+
+        return kline_decoder.loads(response.content)
+
+    def get_klines_cached(self, symbol: str, interval: str = '5m', limit: int = 1000) -> pd.DataFrame:
+        """
+        K라인(캔들) 데이터 가져오기 (캐시 사용)
+        - 캐시가 있으면 마지막 캔들 이후의 새 캔들만 조회
+        - 진행 중이던 마지막 캔들은 최신 값으로 교체
+
+        Args:
+            symbol: 심볼 (예: BTCUSDT)
+            interval: 시간 프레임 (1m, 3m, 5m, 15m, 1h, 4h, 1d 등)
+            limit: 필요한 캔들 수 (최대 1500)
+
+        Returns:
+            OHLCV 데이터프레임
+        """
+        plan = self.kline_cache.plan_request(symbol, interval, limit)
+
+        if plan is not None:
+            df_new = self.get_klines(symbol, interval=interval, limit=plan['limit'],
+                                     start_time=plan['start_time'])
+            if df_new.empty:
+                return df_new
+
+            merged = self.kline_cache.merge(symbol, interval, df_new, limit)
+            if merged is not None:
+                logger.debug(f"{symbol} {interval}: 증분 조회 {len(df_new)}개 캔들")
+                return merged
+
+        # 전체 조회
+        df = self.get_klines(symbol, interval=interval, limit=limit)
+        return self.kline_cache.store(symbol, interval, df, limit)
+
+    def get_resampled_klines(self, symbol: str, base_interval: str, interval: str,
+                             df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """
+        기본 시간 프레임 캔들에서 상위 시간 프레임 캔들 만들기 (추가 조회 없음)
+
+        Args:
+            symbol: 심볼
+            base_interval: 기본 시간 프레임 (예: 15m)
+            interval: 목표 시간 프레임 (예: 1h, 4h, 1d)
+            df: 기본 캔들 (None이면 캔들 캐시 사용)
+
+        Returns:
+            OHLCV 데이터프레임 (마지막 행은 진행 중, 캐시가 없으면 빈 데이터프레임)
+        """
+        if df is None:
+            df = self.kline_cache.get(symbol, base_interval)
+        return self.resampler.resample(symbol, df, base_interval, interval)
+
+    def _local_daily_klines(self, symbol: str) -> Optional[pd.DataFrame]:
+        """
+        캐시된 캔들로 만든 일봉 (오늘 캔들까지 이어진 캐시가 있을 때만)
+
+        Args:
+            symbol: 심볼
+
+        Returns:
+            일봉 데이터프레임 또는 None
+        """
+        today = pd.Timestamp(datetime.now(timezone.utc).date())
+
+        for interval, interval_ms in INTERVAL_MS.items():
+            if interval_ms >= INTERVAL_MS['1d']:
+                break
+
+            df = self.kline_cache.get(symbol, interval)
+            if df is None or df.empty or df.index[-1] < today:
+                continue
+
+            return self.get_resampled_klines(symbol, interval, '1d', df)
+
+        return None
+
+    def get_server_time(self) -> Optional[int]:
+        """
+        바이낸스 선물 서버 시각 가져오기
+
+        Returns:
+            서버 시각 (epoch ms)
+        """
+        try:
+            return int(self._request('futures_time')['serverTime'])
+        except BinanceAPIException as e:
+            logger.error(f"서버 시각 가져오기 실패: {e}")
+            return None
+
+    def get_all_prices(self) -> Dict[str, float]:
+        """
+        전체 심볼 현재 가격 가져오기 (/fapi/v2/ticker/price 1회 조회)
+
+        Returns:
+            {심볼: 현재 가격} (실패 시 빈 딕셔너리)
+        """
+        try:
+            tickers = self._request('futures_symbol_ticker')
+            return {ticker['symbol']: float(ticker['price']) for ticker in tickers}
+        except BinanceAPIException as e:
+            logger.error(f"전체 현재 가격 가져오기 실패: {e}")
+            return {}
+
     def get_current_price(self, symbol: str) -> Optional[float]:
         """
         현재 가격 가져오기
@@ -218,7 +410,7 @@ class BinanceAPI:
             현재 가격
         """
         try:
-            ticker = self.client.futures_symbol_ticker(symbol=symbol)
+            ticker = self._request('futures_symbol_ticker', symbol=symbol)
             return float(ticker['price'])
         except BinanceAPIException as e:
             logger.error(f"{symbol} 현재 가격 가져오기 실패: {e}")
@@ -235,7 +427,7 @@ class BinanceAPI:
             24시간 통계 딕셔너리
         """
         try:
-            stats = self.client.futures_ticker(symbol=symbol)
+            stats = self._request('futures_ticker', symbol=symbol)
             return {
                 'price_change_percent': float(stats['priceChangePercent']),
                 'volume': float(stats['volume']),
@@ -257,9 +449,18 @@ class BinanceAPI:
         Returns:
             볼륨 변화율 (%) 또는 None
         """
+        # 캐시된 캔들로 만든 일봉이 있으면 조회 생략
+        daily = self._local_daily_klines(symbol)
+        if daily is not None and len(daily) >= 2:
+            yesterday_volume = daily['quote_volume'].iloc[-2]
+            if not yesterday_volume:
+                return None
+            return (daily['quote_volume'].iloc[-1] - yesterday_volume) / yesterday_volume * 100
+
         try:
             # 1일봉 3개 가져오기 (오늘 진행중, 어제, 그저께)
-            klines = self.client.futures_klines(
+            klines = self._request(
+                'futures_klines',
                 symbol=symbol,
                 interval='1d',
                 limit=3
@@ -294,9 +495,15 @@ class BinanceAPI:
         Returns:
             3일 상승률 (%) 또는 None
         """
+        # 캐시된 캔들로 만든 일봉이 있으면 조회 생략
+        daily = self._local_daily_klines(symbol)
+        if daily is not None and len(daily) >= 4 and daily['close'].iloc[-4] != 0:
+            return (daily['close'].iloc[-1] - daily['close'].iloc[-4]) / daily['close'].iloc[-4] * 100
+
         try:
             # 일봉 4개 가져오기 (3일 전 + 오늘)
-            klines = self.client.futures_klines(
+            klines = self._request(
+                'futures_klines',
                 symbol=symbol,
                 interval='1d',
                 limit=4
@@ -321,6 +528,55 @@ class BinanceAPI:
             logger.debug(f"{symbol} 3일 상승률 계산 실패: {e}")
             return None
 
+    def get_nday_price_changes(self, symbols: List[str], days: int = 3) -> Dict[str, float]:
+        """
+        N일 누적 상승률 일괄 계산 (N일 전 일봉 종가 → 현재가)
+        - 완성된 일봉 종가는 UTC 하루 1회만 심볼별로 조회 (캐시된 캔들이 있으면 로컬 일봉 사용)
+        - 현재가는 시장 스냅샷(24시간 티커)에서 가져옴
+
+        Args:
+            symbols: 심볼 리스트
+            days: N (일, 최대 DailyCloseTable.days)
+
+        Returns:
+            {심볼: N일 상승률(%)} (계산 불가 심볼은 제외)
+        """
+        missing = self.daily_closes.missing(symbols)
+        if missing:
+            logger.info(f"일봉 종가 테이블 갱신: {len(missing)}개 심볼")
+
+        for symbol in missing:
+            daily = self._local_daily_klines(symbol)
+            if daily is not None and len(daily) > days:
+                self.daily_closes.update_from_frame(symbol, daily)
+                continue
+
+            try:
+                klines = self._request(
+                    'futures_klines',
+                    symbol=symbol,
+                    interval='1d',
+                    limit=self.daily_closes.days + 1
+                )
+                self.daily_closes.update_from_klines(symbol, klines)
+            except (BinanceAPIException, IndexError, ValueError) as e:
+                logger.debug(f"{symbol} 일봉 종가 조회 실패: {e}")
+
+        snapshot = self.get_market_snapshot()
+        prices = np.full(len(symbols), np.nan)
+        for i, symbol in enumerate(symbols):
+            row = snapshot.index_of(symbol)
+            if row is not None:
+                prices[i] = snapshot.last_price[row]
+
+        changes = self.daily_closes.change_pct(symbols, prices, days)
+
+        return {
+            symbol: float(change)
+            for symbol, change in zip(symbols, changes)
+            if not np.isnan(change)
+        }
+
     def get_filtered_symbols_by_momentum(self, min_volume_usd: float = 2_000_000, min_3day_change_pct: float = 8.0) -> List[str]:
         """
         3일 상승률 기반 필터링
@@ -335,47 +591,22 @@ class BinanceAPI:
             필터링된 심볼 리스트
         """
         try:
-            # 1단계: 거래소 정보 가져오기
-            exchange_info = self.client.futures_exchange_info()
-            perpetual_symbols = {
-                s['symbol']
-                for s in exchange_info['symbols']
-                if s['symbol'].endswith('USDT')
-                   and s['status'] == 'TRADING'
-                   and s['contractType'] == 'PERPETUAL'
-            }
-
-            # 2단계: 24시간 거래량 필터
-            tickers = self.client.futures_ticker()
-            volume_filtered = []
-
-            for ticker in tickers:
-                symbol = ticker['symbol']
-                if symbol not in perpetual_symbols:
-                    continue
-
-                try:
-                    quote_volume = float(ticker.get('quoteVolume', 0))
-                    if quote_volume >= min_volume_usd:
-                        volume_filtered.append(symbol)
-                except (ValueError, TypeError):
-                    continue
+            # 1단계: 24시간 거래량 필터 (USDT 무기한 선물)
+            snapshot = self.get_market_snapshot()
+            mask = snapshot.is_perpetual & (snapshot.quote_volume >= min_volume_usd)
+            volume_filtered = snapshot.select(mask)
 
             logger.info(f"1단계 필터 (거래량≥${min_volume_usd/1_000_000:.1f}M): {len(volume_filtered)}개 심볼")
 
-            # 3단계: 3일 상승률 필터
+            # 2단계: 3일 상승률 필터 (일봉 종가 테이블 + 스냅샷 현재가로 일괄 계산)
+            changes = self.get_nday_price_changes(volume_filtered, days=3)
             momentum_filtered = []
 
-            for symbol in volume_filtered:
-                price_change = self.get_3day_price_change(symbol)
-
-                if price_change is not None and price_change >= min_3day_change_pct:
+            for symbol, price_change in changes.items():
+                if price_change >= min_3day_change_pct:
                     momentum_filtered.append((symbol, price_change))
                     logger.debug(f"{symbol}: 3일 상승률 {price_change:+.1f}%")
 
-                # API 레이트 리밋 방지
-                time.sleep(0.05)
-
             # 상승률 높은 순으로 정렬
             momentum_filtered.sort(key=lambda x: x[1], reverse=True)
             filtered_symbols = [s[0] for s in momentum_filtered]
@@ -391,55 +622,6 @@ class BinanceAPI:
             logger.error(f"모멘텀 필터링 실패: {e}")
             return []
 
-    def _update_volume_rank_cache(self):
-        """
-        거래대금 순위 캐시 업데이트
-        """
-        try:
-            # 거래소 정보 가져오기
-            exchange_info = self.client.futures_exchange_info()
-            perpetual_symbols = {
-                s['symbol']
-                for s in exchange_info['symbols']
-                if s['symbol'].endswith('USDT')
-                   and s['status'] == 'TRADING'
-                   and s['contractType'] == 'PERPETUAL'
-            }
-
-            # 24시간 티커 데이터 가져오기
-            tickers = self.client.futures_ticker()
-
-            # USDT PERPETUAL 선물만 필터링 및 거래대금으로 정렬
-            usdt_tickers = []
-            for ticker in tickers:
-                if ticker['symbol'] in perpetual_symbols:
-                    try:
-                        quote_volume = float(ticker.get('quoteVolume', 0))
-                        usdt_tickers.append({
-                            'symbol': ticker['symbol'],
-                            'quote_volume': quote_volume
-                        })
-                    except (ValueError, TypeError):
-                        continue
-
-            # 거래대금 기준 내림차순 정렬
-            usdt_tickers.sort(key=lambda x: x['quote_volume'], reverse=True)
-
-            # 캐시 생성: {심볼: {rank, quote_volume}}
-            cache = {}
-            for rank, ticker in enumerate(usdt_tickers, start=1):
-                cache[ticker['symbol']] = {
-                    'rank': rank,
-                    'quote_volume': ticker['quote_volume']
-                }
-
-            self._volume_rank_cache = cache
-            self._volume_rank_cache_time = datetime.now()
-            logger.info(f"거래대금 순위 캐시 업데이트 완료 ({len(cache)}개 심볼)")
-
-        except BinanceAPIException as e:
-            logger.error(f"거래대금 순위 캐시 업데이트 실패: {e}")
-
     def get_volume_rank(self, symbol: str) -> Optional[Dict]:
         """
         특정 심볼의 거래대금 순위 및 거래대금 가져오기 (캐싱 사용)
@@ -451,18 +633,9 @@ class BinanceAPI:
             {'rank': 순위, 'quote_volume': 거래대금(USD)} 또는 None
         """
         try:
-            # 캐시가 없거나 만료된 경우 업데이트
-            now = datetime.now()
-            if (self._volume_rank_cache is None or
-                self._volume_rank_cache_time is None or
-                (now - self._volume_rank_cache_time).total_seconds() > self._volume_rank_cache_ttl):
-                self._update_volume_rank_cache()
-
-            # 캐시에서 조회
-            if self._volume_rank_cache and symbol in self._volume_rank_cache:
-                return self._volume_rank_cache[symbol]
-
-            return None
+            # 1시간 이내 스냅샷이면 재사용 (순위는 스냅샷에서 1회만 계산)
+            snapshot = self.get_market_snapshot(max_age=self._volume_rank_cache_ttl)
+            return snapshot.volume_rank().get(symbol)
 
         except Exception as e:
             logger.error(f"{symbol} 거래대금 순위 조회 실패: {e}")
@@ -0,0 +1,154 @@
+"""
+디스크 캔들 저장소 모듈
+심볼/시간 프레임별 마감된 캔들을 고정 길이 레코드 파일에 추가 저장하고 memmap으로 읽기
+"""
+import os
+import threading
+from typing import Dict, Optional, Tuple
+import numpy as np
+import pandas as pd
+import logging
+from .kline_cache import INTERVAL_MS, KLINE_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+# 레코드 형식: 캔들 시작 시각(ms) + KLINE_COLUMNS (float64)
+RECORD_DTYPE = np.dtype([('timestamp', '<i8')] + [(col, '<f8') for col in KLINE_COLUMNS])
+
+
+class CandleStore:
+    """디스크 캔들 저장소 (마감된 캔들만 저장)"""
+
+    def __init__(self, path: str = 'data/candles', max_candles: int = 5000):
+        """
+        초기화
+
+        Args:
+            path: 저장 디렉터리
+            max_candles: 파일당 최대 보관 캔들 수 (초과 시 뒷부분만 남기고 다시 씀)
+        """
+        self.path = path
+        self.max_candles = max_candles
+        self._last_timestamps: Dict[Tuple[str, str], Optional[int]] = {}
+        self._lock = threading.Lock()
+
+        os.makedirs(path, exist_ok=True)
+        logger.info(f"캔들 저장소 초기화: {path} (최대 {max_candles}개/심볼)")
+
+    def _file(self, symbol: str, interval: str) -> str:
+        directory = os.path.join(self.path, interval)
+        os.makedirs(directory, exist_ok=True)
+        return os.path.join(directory, f"{symbol}.bin")
+
+    def _open_records(self, path: str) -> Optional[np.ndarray]:
+        """
+        레코드 파일을 memmap으로 열기 (중간에 끊긴 마지막 레코드는 잘라냄)
+
+        Args:
+            path: 파일 경로
+
+        Returns:
+            레코드 배열 (파일이 없거나 비었으면 None)
+        """
+        if not os.path.exists(path):
+            return None
+
+        size = os.path.getsize(path)
+        count = size // RECORD_DTYPE.itemsize
+
+        if size % RECORD_DTYPE.itemsize:
+            logger.warning(f"{path}: 불완전한 레코드 정리")
+            with open(path, 'r+b') as f:
+                f.truncate(count * RECORD_DTYPE.itemsize)
+
+        if count == 0:
+            return None
+
+        return np.memmap(path, dtype=RECORD_DTYPE, mode='r', shape=(count,))
+
+    def _last_timestamp(self, symbol: str, interval: str) -> Optional[int]:
+        """저장된 마지막 캔들 시각 (ms)"""
+        key = (symbol, interval)
+        if key not in self._last_timestamps:
+            records = self._open_records(self._file(symbol, interval))
+            self._last_timestamps[key] = int(records['timestamp'][-1]) if records is not None else None
+        return self._last_timestamps[key]
+
+    def load(self, symbol: str, interval: str, limit: int) -> pd.DataFrame:
+        """
+        저장된 캔들 중 최근 limit개 읽기
+
+        Args:
+            symbol: 심볼
+            interval: 시간 프레임
+            limit: 읽을 캔들 수
+
+        Returns:
+            OHLCV 데이터프레임 (없으면 빈 데이터프레임)
+        """
+        with self._lock:
+            records = self._open_records(self._file(symbol, interval))
+
+        if records is None:
+            return pd.DataFrame()
+
+        tail = np.array(records[-limit:])
+        index = pd.DatetimeIndex(pd.to_datetime(tail['timestamp'], unit='ms'), name='timestamp')
+        return pd.DataFrame({col: tail[col] for col in KLINE_COLUMNS}, index=index)
+
+    def _rewrite(self, path: str, records: np.ndarray):
+        """파일 전체 다시 쓰기 (임시 파일 후 교체)"""
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(records.tobytes())
+        os.replace(tmp_path, path)
+
+    def append(self, symbol: str, interval: str, df: pd.DataFrame):
+        """
+        마감된 캔들 추가 저장 (이미 저장된 시각 이후만)
+        - 저장된 마지막 캔들과 이어지지 않으면 새 데이터로 다시 씀
+
+        Args:
+            symbol: 심볼
+            interval: 시간 프레임
+            df: 마감된 캔들만 담긴 OHLCV 데이터프레임
+        """
+        if df.empty:
+            return
+
+        timestamps = df.index.as_unit('ms').asi8
+
+        with self._lock:
+            last_ts = self._last_timestamp(symbol, interval)
+            new_rows = timestamps > last_ts if last_ts is not None else np.ones(len(df), dtype=bool)
+
+            if not new_rows.any():
+                return
+
+            records = np.empty(int(new_rows.sum()), dtype=RECORD_DTYPE)
+            records['timestamp'] = timestamps[new_rows]
+            for col in KLINE_COLUMNS:
+                records[col] = df[col].to_numpy(dtype=np.float64)[new_rows]
+
+            path = self._file(symbol, interval)
+            interval_ms = INTERVAL_MS.get(interval)
+            contiguous = (
+                last_ts is not None
+                and interval_ms is not None
+                and int(records['timestamp'][0]) == last_ts + interval_ms
+            )
+
+            if contiguous:
+                with open(path, 'ab') as f:
+                    f.write(records.tobytes())
+
+                stored = os.path.getsize(path) // RECORD_DTYPE.itemsize
+                if stored > self.max_candles * 2:
+                    existing = np.fromfile(path, dtype=RECORD_DTYPE)
+                    self._rewrite(path, existing[-self.max_candles:])
+            else:
+                if last_ts is not None:
+                    logger.debug(f"{symbol} {interval}: 저장된 캔들과 이어지지 않아 다시 저장")
+                self._rewrite(path, records[-self.max_candles:])
+
+            self._last_timestamps[(symbol, interval)] = int(records['timestamp'][-1])
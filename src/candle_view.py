@@ -0,0 +1,111 @@
+"""
+캔들 배열 뷰 모듈
+캔들 데이터프레임의 컬럼을 복사 없이 읽기 전용 NumPy 뷰로 꺼내 SMA/시그널 계산에 사용
+"""
+from typing import Optional
+import numpy as np
+import pandas as pd
+
+
+def column_view(df: pd.DataFrame, name: str) -> np.ndarray:
+    """
+    컬럼의 읽기 전용 float64 뷰 (같은 dtype이면 복사 없음)
+
+    Args:
+        df: 캔들 데이터프레임
+        name: 컬럼 이름
+
+    Returns:
+        읽기 전용 1차원 배열
+    """
+    values = df[name].to_numpy(dtype=np.float64, copy=False).view()
+    values.flags.writeable = False
+    return values
+
+
+class CandleView:
+    """캔들 데이터프레임 한 개에 대한 읽기 전용 배열 접근 (컬럼별 뷰를 처음 쓸 때 한 번만 생성)"""
+
+    __slots__ = ('df', '_columns')
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        초기화
+
+        Args:
+            df: 캔들 데이터프레임 (수정하지 않음)
+        """
+        self.df = df
+        self._columns = {}
+
+    def __len__(self) -> int:
+        return len(self.df)
+
+    def column(self, name: str) -> np.ndarray:
+        """컬럼 뷰 (캐시)"""
+        values = self._columns.get(name)
+        if values is None:
+            values = self._columns[name] = column_view(self.df, name)
+        return values
+
+    def has(self, name: str) -> bool:
+        """컬럼 존재 여부"""
+        return name in self.df.columns
+
+    @property
+    def close(self) -> np.ndarray:
+        return self.column('close')
+
+    @property
+    def high(self) -> np.ndarray:
+        return self.column('high')
+
+    @property
+    def low(self) -> np.ndarray:
+        return self.column('low')
+
+    def last_timestamp(self) -> pd.Timestamp:
+        """마지막 캔들 시작 시각"""
+        return self.df.index[-1]
+
+    def close_at(self, position: int) -> float:
+        """
+        위치의 종가 (음수면 뒤에서부터)
+
+        Args:
+            position: 행 위치
+        """
+        return float(self.close[position])
+
+    def quote_volume_sum(self, candles: int) -> float:
+        """
+        최근 N개 캔들 거래대금 합계
+        - quote_volume 컬럼이 있으면 그대로 사용, 없으면 거래량 × 종가로 추정 (임시 배열 없이 내적)
+
+        Args:
+            candles: 합산할 캔들 수
+
+        Returns:
+            거래대금 합계 (USDT)
+        """
+        if candles <= 0:
+            return 0.0
+        if self.has('quote_volume'):
+            return float(self.column('quote_volume')[-candles:].sum())
+        return float(np.dot(self.column('volume')[-candles:], self.close[-candles:]))
+
+    def change_pct(self, candles: int) -> Optional[float]:
+        """
+        N개 캔들 전 종가 대비 현재 종가 상승률
+
+        Args:
+            candles: 비교할 캔들 수
+
+        Returns:
+            상승률 (%, 데이터가 부족하면 None)
+        """
+        if len(self.df) < candles + 1:
+            return None
+        close = self.close
+        past = close[-(candles + 1)]
+        return float((close[-1] - past) / past * 100)
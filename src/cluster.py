@@ -0,0 +1,198 @@
+"""
+다중 인스턴스 심볼 분할 모듈
+공유 SQLite 파일의 임대(lease)로 살아 있는 인스턴스를 추적하고, 일관 해싱으로 심볼을 나눔
+"""
+import bisect
+import hashlib
+import os
+import socket
+import sqlite3
+import threading
+import time
+from typing import List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cluster_member (
+    instance_id TEXT PRIMARY KEY,
+    host TEXT NOT NULL,
+    pid INTEGER NOT NULL,
+    started_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+def _hash(key: str) -> int:
+    """프로세스/호스트와 무관한 64비트 해시"""
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), 'big')
+
+
+class HashRing:
+    """일관 해싱 링 (인스턴스가 바뀌면 해당 구간의 심볼만 이동)"""
+
+    def __init__(self, nodes: List[str], virtual_nodes: int = 64):
+        """
+        초기화
+
+        Args:
+            nodes: 인스턴스 ID 리스트
+            virtual_nodes: 인스턴스당 링 위치 수 (많을수록 고르게 분배)
+        """
+        points = sorted((_hash(f"{node}#{i}"), node) for node in nodes for i in range(virtual_nodes))
+        self._keys = [point for point, _ in points]
+        self._nodes = [node for _, node in points]
+
+    def node_for(self, key: str) -> Optional[str]:
+        """
+        키를 담당하는 인스턴스
+
+        Args:
+            key: 심볼
+
+        Returns:
+            인스턴스 ID (링이 비어 있으면 None)
+        """
+        if not self._keys:
+            return None
+        index = bisect.bisect(self._keys, _hash(key)) % len(self._keys)
+        return self._nodes[index]
+
+
+class ClusterMembership:
+    """인스턴스 임대 관리 및 심볼 분할"""
+
+    def __init__(self, path: str, instance_id: str = '', lease_ttl: float = 30.0, virtual_nodes: int = 64):
+        """
+        초기화
+
+        Args:
+            path: 공유 SQLite 파일 경로 (모든 인스턴스가 같은 파일 사용)
+            instance_id: 인스턴스 ID (빈 값이면 호스트명-PID)
+            lease_ttl: 임대 유효 시간 (초, 이 시간 동안 갱신이 없으면 죽은 인스턴스로 간주)
+            virtual_nodes: 인스턴스당 해시 링 위치 수
+        """
+        self.path = path
+        self.instance_id = instance_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.lease_ttl = lease_ttl
+        self.virtual_nodes = virtual_nodes
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._db = sqlite3.connect(path, timeout=10.0, check_same_thread=False, isolation_level=None)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+        self._members: Tuple[str, ...] = ()
+        self._ring = HashRing([], virtual_nodes)
+        self._started_at = time.time()
+
+        # 임대 갱신 스레드 (스캔이 길어져도 임대가 만료되지 않도록)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def members(self) -> Tuple[str, ...]:
+        """마지막 갱신 시점의 살아 있는 인스턴스 ID (정렬)"""
+        return self._members
+
+    @property
+    def joined(self) -> bool:
+        """임대를 등록하고 갱신 중인지 여부"""
+        return self._thread is not None
+
+    def start(self) -> 'ClusterMembership':
+        """임대 등록 후 갱신 스레드 시작"""
+        self.heartbeat()
+        self._thread = threading.Thread(target=self._renew_loop, name='cluster-lease', daemon=True)
+        self._thread.start()
+        logger.info(f"클러스터 참여: {self.instance_id} (인스턴스 {len(self._members)}개, 임대 {self.lease_ttl:.0f}초)")
+        return self
+
+    def _renew_loop(self):
+        while not self._stop.wait(self.lease_ttl / 3):
+            try:
+                self.heartbeat()
+            except sqlite3.Error as e:
+                logger.warning(f"클러스터 임대 갱신 실패: {e}")
+
+    def heartbeat(self, now: Optional[float] = None) -> Tuple[str, ...]:
+        """
+        임대 갱신, 만료된 인스턴스 정리 후 살아 있는 인스턴스 조회
+
+        Args:
+            now: 기준 시각 (epoch 초, 기본 현재)
+
+        Returns:
+            살아 있는 인스턴스 ID (정렬)
+        """
+        now = time.time() if now is None else now
+
+        with self._lock:
+            try:
+                self._db.execute('BEGIN IMMEDIATE')
+                self._db.execute(
+                    'INSERT OR REPLACE INTO cluster_member (instance_id, host, pid, started_at, expires_at) '
+                    'VALUES (?, ?, ?, ?, ?)',
+                    (self.instance_id, socket.gethostname(), os.getpid(), self._started_at, now + self.lease_ttl))
+                self._db.execute('DELETE FROM cluster_member WHERE expires_at <= ?', (now,))
+                members = tuple(row[0] for row in self._db.execute(
+                    'SELECT instance_id FROM cluster_member ORDER BY instance_id'))
+                self._db.execute('COMMIT')
+            except sqlite3.Error:
+                # 트랜잭션이 열린 채로 남으면 다음 갱신도 실패하므로 되돌린 뒤 전달
+                if self._db.in_transaction:
+                    self._db.execute('ROLLBACK')
+                raise
+
+        if members != self._members:
+            if self._members:
+                logger.info(f"클러스터 구성 변경: {len(self._members)}개 → {len(members)}개 인스턴스")
+            self._ring = HashRing(list(members), self.virtual_nodes)
+            self._members = members
+
+        return members
+
+    def owns(self, symbol: str) -> bool:
+        """
+        이 인스턴스가 심볼을 담당하는지 확인
+
+        Args:
+            symbol: 심볼
+        """
+        return self._ring.node_for(symbol) == self.instance_id
+
+    def partition(self, symbols: List[str]) -> List[str]:
+        """
+        전체 심볼 중 이 인스턴스 담당 심볼 (순서 유지)
+
+        Args:
+            symbols: 전체 심볼 리스트
+
+        Returns:
+            담당 심볼 리스트
+        """
+        return [symbol for symbol in symbols if self.owns(symbol)]
+
+    def close(self):
+        """갱신 중단 후 임대 반납 (남은 인스턴스가 바로 재분배하도록)"""
+        joined = self.joined
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+        with self._lock:
+            if joined:
+                try:
+                    self._db.execute('DELETE FROM cluster_member WHERE instance_id = ?', (self.instance_id,))
+                except sqlite3.Error as e:
+                    logger.warning(f"클러스터 임대 반납 실패: {e}")
+            self._db.close()
+        if joined:
+            logger.info(f"클러스터 탈퇴: {self.instance_id}")
@@ -0,0 +1,103 @@
+"""
+일봉 종가 테이블 모듈
+심볼별 완성된 일봉 종가를 UTC 하루 1회만 받아 두고 N일 상승률을 일괄 계산
+"""
+import time
+from datetime import datetime, timezone, date
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class DailyCloseTable:
+    """심볼별 완성된 일봉 종가 테이블"""
+
+    def __init__(self, days: int = 7):
+        """
+        초기화
+
+        Args:
+            days: 보관할 완성 일봉 수 (계산 가능한 최대 N)
+        """
+        self.days = days
+        self._day: Optional[date] = None  # 테이블 기준 UTC 날짜
+        self._closes: Dict[str, np.ndarray] = {}  # {심볼: 종가 배열 (오래된 순, 마지막 = 어제)}
+
+    @staticmethod
+    def _utc_today() -> date:
+        return datetime.now(timezone.utc).date()
+
+    def _roll_day(self):
+        """UTC 날짜가 바뀌었으면 테이블 초기화"""
+        today = self._utc_today()
+        if self._day != today:
+            if self._day is not None:
+                logger.info(f"일봉 종가 테이블 초기화 (UTC {today})")
+            self._day = today
+            self._closes = {}
+
+    def missing(self, symbols: List[str]) -> List[str]:
+        """
+        오늘 기준 종가가 없는 심볼
+
+        Args:
+            symbols: 심볼 리스트
+
+        Returns:
+            조회가 필요한 심볼 리스트
+        """
+        self._roll_day()
+        return [s for s in symbols if s not in self._closes]
+
+    def update_from_klines(self, symbol: str, klines: List[List]):
+        """
+        futures_klines(1d) 응답에서 완성된 일봉 종가만 저장
+
+        Args:
+            symbol: 심볼
+            klines: 일봉 원본 응답 (진행 중인 오늘 캔들 포함 가능)
+        """
+        self._roll_day()
+        now_ms = int(time.time() * 1000)
+        closes = [float(k[4]) for k in klines if int(k[6]) < now_ms]
+        self._closes[symbol] = np.asarray(closes[-self.days:], dtype=np.float64)
+
+    def update_from_frame(self, symbol: str, daily: pd.DataFrame):
+        """
+        로컬 리샘플한 일봉에서 완성된 일봉 종가만 저장
+
+        Args:
+            symbol: 심볼
+            daily: 일봉 데이터프레임 (진행 중인 오늘 캔들 포함 가능)
+        """
+        self._roll_day()
+        today = pd.Timestamp(self._day)
+        closes = daily.loc[daily.index < today, 'close'].to_numpy(dtype=np.float64)
+        self._closes[symbol] = closes[-self.days:]
+
+    def change_pct(self, symbols: List[str], prices: np.ndarray, days: int) -> np.ndarray:
+        """
+        N일 상승률 일괄 계산 (N일 전 일봉 종가 → 현재가)
+
+        Args:
+            symbols: 심볼 리스트
+            prices: 심볼별 현재가 (symbols와 같은 순서)
+            days: N (일)
+
+        Returns:
+            상승률 배열 (%, 계산 불가 시 NaN)
+        """
+        self._roll_day()
+        base = np.full(len(symbols), np.nan)
+        for i, symbol in enumerate(symbols):
+            closes = self._closes.get(symbol)
+            if closes is not None and len(closes) >= days:
+                base[i] = closes[-days]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            change = (np.asarray(prices, dtype=np.float64) - base) / base * 100
+        change[~np.isfinite(change)] = np.nan
+        return change
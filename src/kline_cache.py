@@ -0,0 +1,228 @@
+"""
+K라인(캔들) 캐시 모듈
+심볼/시간 프레임별 최근 캔들을 보관하고 새 캔들만 증분 조회
+"""
+import time
+from typing import Dict, List, Optional, Tuple
+import pandas as pd
+import logging
+from .kline_decoder import KLINE_FIELDS
+
+logger = logging.getLogger(__name__)
+
+# 캐시에 보관하는 컬럼
+KLINE_COLUMNS = KLINE_FIELDS
+
+# futures_klines 1회 최대 조회 수
+MAX_KLINES_LIMIT = 1500
+
+# 시간 프레임별 캔들 길이 (밀리초)
+INTERVAL_MS = {
+    '1m': 60_000,
+    '3m': 3 * 60_000,
+    '5m': 5 * 60_000,
+    '15m': 15 * 60_000,
+    '30m': 30 * 60_000,
+    '1h': 60 * 60_000,
+    '2h': 2 * 60 * 60_000,
+    '4h': 4 * 60 * 60_000,
+    '6h': 6 * 60 * 60_000,
+    '8h': 8 * 60 * 60_000,
+    '12h': 12 * 60 * 60_000,
+    '1d': 24 * 60 * 60_000,
+    '3d': 3 * 24 * 60 * 60_000,
+    '1w': 7 * 24 * 60 * 60_000,
+}
+
+
+class KlineCache:
+    """심볼/시간 프레임별 캔들 캐시"""
+
+    def __init__(self, candle_store=None):
+        """
+        초기화
+
+        Args:
+            candle_store: 디스크 캔들 저장소 (CandleStore, None이면 메모리만 사용)
+        """
+        # {(심볼, 시간 프레임): OHLCV 데이터프레임} - 마지막 행은 진행 중인 캔들
+        self._frames: Dict[Tuple[str, str], pd.DataFrame] = {}
+        self.candle_store = candle_store
+
+    def _save(self, symbol: str, interval: str, frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        메모리 캐시 갱신 + 디스크 저장소에 마감된 캔들 추가
+
+        마지막 행은 진행 중일 수 있으므로 저장하지 않는다 (다음 갱신 때 저장됨).
+        """
+        self._frames[(symbol, interval)] = frame
+
+        if self.candle_store is not None and len(frame) > 1:
+            try:
+                self.candle_store.append(symbol, interval, frame.iloc[:-1])
+            except OSError as e:
+                logger.warning(f"{symbol} {interval}: 캔들 저장 실패: {e}")
+
+        return frame
+
+    def _load(self, symbol: str, interval: str, limit: int) -> Optional[pd.DataFrame]:
+        """메모리에 없으면 디스크 저장소에서 불러오기"""
+        cached = self._frames.get((symbol, interval))
+
+        if cached is None and self.candle_store is not None:
+            try:
+                loaded = self.candle_store.load(symbol, interval, limit)
+            except (OSError, ValueError) as e:
+                logger.warning(f"{symbol} {interval}: 저장된 캔들 읽기 실패: {e}")
+                return None
+
+            if not loaded.empty:
+                logger.debug(f"{symbol} {interval}: 저장소에서 {len(loaded)}개 캔들 복원")
+                self._frames[(symbol, interval)] = loaded
+                cached = loaded
+
+        return cached
+
+    def get(self, symbol: str, interval: str) -> Optional[pd.DataFrame]:
+        """
+        캐시된 캔들 가져오기
+
+        Args:
+            symbol: 심볼
+            interval: 시간 프레임
+
+        Returns:
+            OHLCV 데이터프레임 (없으면 None)
+        """
+        return self._frames.get((symbol, interval))
+
+    def plan_request(self, symbol: str, interval: str, limit: int) -> Optional[Dict]:
+        """
+        증분 조회 파라미터 계산
+
+        캐시된 마지막 캔들(진행 중이던 캔들)부터 현재까지의 캔들만 요청한다.
+
+        Args:
+            symbol: 심볼
+            interval: 시간 프레임
+            limit: 호출자가 필요로 하는 캔들 수
+
+        Returns:
+            {'start_time': 시작 시각(ms), 'limit': 조회 수} 또는 None (전체 조회 필요)
+        """
+        cached = self._load(symbol, interval, limit)
+        interval_ms = INTERVAL_MS.get(interval)
+
+        # 저장소에서 복원한 캐시는 진행 중인 캔들이 없으므로 1개 적어도 됨
+        if cached is None or cached.empty or interval_ms is None or len(cached) < limit - 1:
+            return None
+
+        last_open_ms = cached.index[-1].value // 1_000_000
+        now_ms = int(time.time() * 1000)
+
+        # 마지막 캔들 교체분 + 새로 생긴 캔들 수 (시계 오차 여유 2개)
+        needed = (now_ms - last_open_ms) // interval_ms + 3
+
+        # 공백이 너무 크면 전체 조회가 더 싸다
+        if needed >= limit or needed > MAX_KLINES_LIMIT:
+            return None
+
+        return {'start_time': int(last_open_ms), 'limit': int(needed)}
+
+    def store(self, symbol: str, interval: str, df: pd.DataFrame, limit: int) -> pd.DataFrame:
+        """
+        전체 조회 결과 저장
+
+        Args:
+            symbol: 심볼
+            interval: 시간 프레임
+            df: OHLCV 데이터프레임
+            limit: 보관할 캔들 수
+
+        Returns:
+            저장된 데이터프레임
+        """
+        if df.empty:
+            return df
+
+        return self._save(symbol, interval, df[KLINE_COLUMNS].tail(limit))
+
+    def merge(self, symbol: str, interval: str, df_new: pd.DataFrame, limit: int) -> Optional[pd.DataFrame]:
+        """
+        증분 조회 결과 병합 (진행 중이던 마지막 캔들은 새 값으로 교체)
+
+        Args:
+            symbol: 심볼
+            interval: 시간 프레임
+            df_new: 증분 조회된 OHLCV 데이터프레임
+            limit: 보관할 캔들 수
+
+        Returns:
+            병합된 데이터프레임 (연속성이 깨졌으면 None → 전체 조회 필요)
+        """
+        cached = self._frames.get((symbol, interval))
+
+        if cached is None or df_new.empty:
+            return None
+
+        # 새 데이터의 첫 캔들은 캐시의 마지막 캔들과 같아야 한다
+        if df_new.index[0] != cached.index[-1]:
+            logger.debug(f"{symbol} {interval}: 캔들 연속성 불일치, 전체 조회 필요")
+            return None
+
+        merged = pd.concat([cached.iloc[:-1], df_new[KLINE_COLUMNS]])
+        return self._save(symbol, interval, merged.tail(limit))
+
+    def apply_kline(self, symbol: str, interval: str, open_time_ms: int,
+                    values: Dict[str, float], limit: int) -> Optional[pd.DataFrame]:
+        """
+        스트림으로 받은 캔들 1개 반영
+        - 캐시 마지막 캔들과 같은 시각이면 교체, 바로 다음 캔들이면 추가
+
+        Args:
+            symbol: 심볼
+            interval: 시간 프레임
+            open_time_ms: 캔들 시작 시각 (ms)
+            values: KLINE_COLUMNS 컬럼별 값
+            limit: 보관할 캔들 수
+
+        Returns:
+            반영된 데이터프레임 (캐시가 없거나 공백이 있으면 None → REST 복구 필요)
+        """
+        cached = self._frames.get((symbol, interval))
+        interval_ms = INTERVAL_MS.get(interval)
+
+        if cached is None or cached.empty or interval_ms is None:
+            return None
+
+        last_open_ms = cached.index[-1].value // 1_000_000
+        row = pd.DataFrame(
+            [[float(values[c]) for c in KLINE_COLUMNS]],
+            columns=KLINE_COLUMNS,
+            index=pd.DatetimeIndex([pd.to_datetime(open_time_ms, unit='ms')], name=cached.index.name)
+        )
+
+        if open_time_ms == last_open_ms:
+            merged = pd.concat([cached.iloc[:-1], row])
+        elif open_time_ms == last_open_ms + interval_ms:
+            merged = pd.concat([cached, row])
+        else:
+            logger.debug(f"{symbol} {interval}: 스트림 캔들 공백 발생, REST 복구 필요")
+            return None
+
+        return self._save(symbol, interval, merged.tail(limit))
+
+    def retain(self, symbols: List[str]):
+        """
+        모니터링 대상이 아닌 심볼의 캐시 삭제
+
+        Args:
+            symbols: 유지할 심볼 리스트
+        """
+        keep = set(symbols)
+        for key in list(self._frames):
+            if key[0] not in keep:
+                del self._frames[key]
+
+    def __len__(self) -> int:
+        return len(self._frames)
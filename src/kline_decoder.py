@@ -0,0 +1,89 @@
+"""
+캔들 응답 디코딩 모듈
+futures_klines 원본(문자열 리스트)을 float64/int64 배열로 바로 변환
+"""
+import json
+from typing import List, Tuple
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+# 디코딩해서 보관하는 컬럼 (순서 = 배열 열 순서)
+KLINE_FIELDS = [
+    'open', 'high', 'low', 'close', 'volume',
+    'quote_volume', 'taker_buy_base', 'taker_buy_quote',
+]
+
+# 원본 응답에서 각 컬럼의 위치
+# [open_time, open, high, low, close, volume, close_time, quote_volume, trades, taker_buy_base, taker_buy_quote, ignore]
+_RAW_INDEX = [1, 2, 3, 4, 5, 7, 9, 10]
+
+
+def loads(data: bytes):
+    """
+    JSON 파싱 (orjson이 설치되어 있으면 사용)
+
+    Args:
+        data: 응답 본문
+
+    Returns:
+        파싱된 객체
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def decode_klines(klines: List[List]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    캔들 원본 응답을 배열로 변환
+
+    Args:
+        klines: futures_klines 원본 응답
+
+    Returns:
+        (캔들 시작 시각 int64 배열(ms), KLINE_FIELDS 순서의 float64 2차원 배열)
+    """
+    if not klines:
+        return np.empty(0, dtype=np.int64), np.empty((0, len(KLINE_FIELDS)), dtype=np.float64)
+
+    raw = np.array(klines, dtype=object)
+    timestamps = raw[:, 0].astype(np.int64)
+    values = raw[:, _RAW_INDEX].astype(np.float64)
+
+    return timestamps, values
+
+
+def frame_from_arrays(timestamps: np.ndarray, values: np.ndarray) -> pd.DataFrame:
+    """
+    디코딩된 배열로 데이터프레임 생성 (복사 없이 하나의 float64 블록 사용)
+
+    Args:
+        timestamps: 캔들 시작 시각 int64 배열 (ms)
+        values: KLINE_FIELDS 순서의 float64 2차원 배열
+
+    Returns:
+        캔들 데이터프레임
+    """
+    index = pd.DatetimeIndex(timestamps.astype('datetime64[ms]'), name='timestamp')
+    return pd.DataFrame(values, index=index, columns=KLINE_FIELDS, copy=False)
+
+
+def klines_to_frame(klines: List[List]) -> pd.DataFrame:
+    """
+    futures_klines 응답을 캔들 데이터프레임으로 변환
+
+    Args:
+        klines: futures_klines 원본 응답
+
+    Returns:
+        캔들 데이터프레임 (빈 응답이면 빈 데이터프레임)
+    """
+    if not klines:
+        return pd.DataFrame()
+
+    return frame_from_arrays(*decode_klines(klines))
@@ -0,0 +1,142 @@
+"""
+웹소켓 캔들 스트림 모듈
+바이낸스 선물 combined <symbol>@kline_<interval> 스트림 구독 및 캔들 마감 이벤트 전달
+"""
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional
+import logging
+import websockets
+from .kline_decoder import loads
+
+logger = logging.getLogger(__name__)
+
+# 바이낸스 USD-M 선물 combined 스트림 주소
+DEFAULT_STREAM_URL = "wss://fstream.binance.com/stream"
+
+# 연결당 최대 스트림 수
+MAX_STREAMS_PER_CONNECTION = 200
+
+
+class KlineStream:
+    """캔들 웹소켓 스트림"""
+
+    def __init__(self, symbols: List[str], interval: str,
+                 on_candle_close: Callable[[str, Dict], Awaitable[None]],
+                 url: str = DEFAULT_STREAM_URL,
+                 on_reconnect: Optional[Callable[[List[str]], Awaitable[None]]] = None,
+                 reconnect_delay: float = 5.0):
+        """
+        초기화
+
+        Args:
+            symbols: 구독할 심볼 리스트
+            interval: 시간 프레임 (15m 등)
+            on_candle_close: 캔들 마감(x=true) 시 호출할 코루틴 (심볼, kline 딕셔너리)
+            url: combined 스트림 주소 (로컬 테스트 서버 지정 가능)
+            on_reconnect: 재연결 직후 호출할 코루틴 (해당 연결의 심볼 리스트, 공백 복구용, 수신 전에 대기하므로 작업은 큐에 넣고 바로 반환)
+            reconnect_delay: 재연결 대기 시간 (초)
+        """
+        self.symbols = symbols
+        self.interval = interval
+        self.on_candle_close = on_candle_close
+        self.on_reconnect = on_reconnect
+        self.url = url.rstrip('/')
+        self.reconnect_delay = reconnect_delay
+        self._stopped = asyncio.Event()
+
+    def _stream_url(self, symbols: List[str]) -> str:
+        """combined 스트림 URL 생성"""
+        streams = '/'.join(f"{s.lower()}@kline_{self.interval}" for s in symbols)
+        return f"{self.url}?streams={streams}"
+
+    async def _handle_message(self, raw: str):
+        """
+        스트림 메시지 처리 (마감된 캔들만 전달)
+
+        Args:
+            raw: 원본 메시지
+        """
+        try:
+            message = loads(raw)
+        except ValueError:
+            logger.debug(f"스트림 메시지 파싱 실패: {raw[:100]}")
+            return
+
+        data = message.get('data', message)
+        kline = data.get('k')
+
+        if not kline or not kline.get('x'):
+            return
+
+        await self.on_candle_close(kline['s'], kline)
+
+    async def _run_connection(self, symbols: List[str]):
+        """
+        연결 1개 유지 (끊기면 재연결)
+
+        Args:
+            symbols: 이 연결에서 구독할 심볼 리스트
+        """
+        url = self._stream_url(symbols)
+        connected_before = False
+
+        while not self._stopped.is_set():
+            try:
+                async with websockets.connect(url, max_size=None) as ws:
+                    logger.info(f"캔들 스트림 연결: {len(symbols)}개 심볼")
+
+                    if connected_before and self.on_reconnect is not None:
+                        await self.on_reconnect(symbols)
+                    connected_before = True
+
+                    while not self._stopped.is_set():
+                        receive = asyncio.ensure_future(ws.recv())
+                        stop = asyncio.ensure_future(self._stopped.wait())
+                        done, _ = await asyncio.wait({receive, stop}, return_when=asyncio.FIRST_COMPLETED)
+
+                        if receive not in done:
+                            receive.cancel()
+                            break
+
+                        stop.cancel()
+                        await self._handle_message(receive.result())
+
+            except (websockets.WebSocketException, OSError, asyncio.TimeoutError) as e:
+                if self._stopped.is_set():
+                    break
+                logger.warning(f"캔들 스트림 연결 끊김: {e}. {self.reconnect_delay:.0f}초 후 재연결")
+                try:
+                    await asyncio.wait_for(self._stopped.wait(), timeout=self.reconnect_delay)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def run(self, duration: Optional[float] = None):
+        """
+        스트림 실행
+
+        Args:
+            duration: 실행 시간 (초, None이면 stop() 호출 전까지)
+        """
+        self._stopped.clear()
+
+        chunks = [
+            self.symbols[i:i + MAX_STREAMS_PER_CONNECTION]
+            for i in range(0, len(self.symbols), MAX_STREAMS_PER_CONNECTION)
+        ]
+        tasks = [asyncio.ensure_future(self._run_connection(chunk)) for chunk in chunks]
+
+        try:
+            if duration is not None:
+                try:
+                    await asyncio.wait_for(self._stopped.wait(), timeout=duration)
+                except asyncio.TimeoutError:
+                    pass
+                self.stop()
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def stop(self):
+        """스트림 중단"""
+        self._stopped.set()
@@ -0,0 +1,121 @@
+"""
+시장 스냅샷 모듈
+거래소 정보(무기한 선물 목록) + 24시간 티커를 한 번에 받아 숫자 배열로 보관
+"""
+import time
+from typing import Dict, List, Optional, Set
+import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _to_float(value) -> float:
+    """티커 문자열 값을 float로 변환 (실패 시 NaN)"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def parse_perpetual_symbols(exchange_info: Dict) -> List[str]:
+    """
+    거래 중인 USDT 무기한 선물 심볼 추출
+
+    Args:
+        exchange_info: futures_exchange_info 응답
+
+    Returns:
+        심볼 리스트 (거래소 정보 순서)
+    """
+    return [
+        s['symbol']
+        for s in exchange_info['symbols']
+        if s['symbol'].endswith('USDT')
+           and s['status'] == 'TRADING'
+           and s['contractType'] == 'PERPETUAL'
+    ]
+
+
+class MarketSnapshot:
+    """거래소 정보 + 24시간 티커 스냅샷"""
+
+    def __init__(self, perpetual_symbols: List[str], tickers: List[Dict]):
+        """
+        초기화
+
+        Args:
+            perpetual_symbols: USDT 무기한 선물 심볼 리스트
+            tickers: futures_ticker() 전체 응답
+        """
+        self.created_at = time.monotonic()
+        self.perpetual_list = perpetual_symbols
+        self.perpetual_symbols: Set[str] = set(perpetual_symbols)
+
+        # 티커 숫자 테이블 (행 = 티커 순서)
+        n = len(tickers)
+        self.symbols = np.array([t['symbol'] for t in tickers], dtype=object)
+        self.quote_volume = np.fromiter((_to_float(t.get('quoteVolume', 0)) for t in tickers), dtype=np.float64, count=n)
+        self.price_change_pct = np.fromiter((_to_float(t.get('priceChangePercent', 0)) for t in tickers), dtype=np.float64, count=n)
+        self.last_price = np.fromiter((_to_float(t.get('lastPrice', np.nan)) for t in tickers), dtype=np.float64, count=n)
+        self.volume = np.fromiter((_to_float(t.get('volume', 0)) for t in tickers), dtype=np.float64, count=n)
+
+        self.is_perpetual = np.fromiter((s in self.perpetual_symbols for s in self.symbols), dtype=bool, count=n)
+        self.is_usdt = np.fromiter((s.endswith('USDT') for s in self.symbols), dtype=bool, count=n)
+
+        self._index: Dict[str, int] = {s: i for i, s in enumerate(self.symbols)}
+        self._volume_rank: Optional[Dict[str, Dict]] = None
+
+    @property
+    def age(self) -> float:
+        """스냅샷 생성 후 경과 시간 (초)"""
+        return time.monotonic() - self.created_at
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def index_of(self, symbol: str) -> Optional[int]:
+        """
+        심볼의 티커 테이블 행 번호
+
+        Args:
+            symbol: 심볼
+
+        Returns:
+            행 번호 또는 None
+        """
+        return self._index.get(symbol)
+
+    def select(self, mask: np.ndarray, sort_by: Optional[np.ndarray] = None) -> List[str]:
+        """
+        조건을 만족하는 심볼 선택 (sort_by 기준 내림차순)
+
+        Args:
+            mask: 행별 선택 여부
+            sort_by: 정렬 기준 배열 (None이면 티커 순서 유지)
+
+        Returns:
+            심볼 리스트
+        """
+        rows = np.flatnonzero(mask)
+        if sort_by is not None and len(rows):
+            # 안정 정렬로 동률은 티커 순서 유지
+            rows = rows[np.argsort(-sort_by[rows], kind='stable')]
+        return self.symbols[rows].tolist()
+
+    def volume_rank(self) -> Dict[str, Dict]:
+        """
+        USDT 무기한 선물 거래대금 순위 (최초 호출 시 계산)
+
+        Returns:
+            {심볼: {'rank': 순위, 'quote_volume': 거래대금}}
+        """
+        if self._volume_rank is None:
+            valid = self.is_perpetual & ~np.isnan(self.quote_volume)
+            rows = np.flatnonzero(valid)
+            rows = rows[np.argsort(-self.quote_volume[rows], kind='stable')]
+            self._volume_rank = {
+                self.symbols[row]: {'rank': rank, 'quote_volume': float(self.quote_volume[row])}
+                for rank, row in enumerate(rows, start=1)
+            }
+        return self._volume_rank
@@ -0,0 +1,265 @@
+"""
+메트릭 모듈
+단계별/엔드포인트별 처리 시간 히스토그램과 스캔 지표를 모아 Prometheus 텍스트 형식으로 노출
+"""
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Sequence, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 기본 히스토그램 구간 (초)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                   1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ''
+    parts = [f'{key}="{str(value)}"'.replace('\n', ' ') for key, value in labels.items()]
+    return '{' + ','.join(parts) + '}'
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value))
+
+
+class _Metric:
+    """메트릭 공통 (라벨 조합별 값 보관)"""
+
+    type_name = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def _labels(self, key: Tuple[str, ...]) -> Dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+
+
+class Counter(_Metric):
+    """증가만 하는 카운터"""
+
+    type_name = 'counter'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        with self._lock:
+            for key, value in self._values.items():
+                lines.append(f"{self.name}{_format_labels(self._labels(key))} {_format_value(value)}")
+        return lines
+
+
+class Gauge(_Metric):
+    """현재 값"""
+
+    type_name = 'gauge'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = float(value)
+
+    def value(self, **labels) -> Optional[float]:
+        with self._lock:
+            return self._values.get(self._key(labels))
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        with self._lock:
+            for key, value in self._values.items():
+                lines.append(f"{self.name}{_format_labels(self._labels(key))} {_format_value(value)}")
+        return lines
+
+
+class Histogram(_Metric):
+    """구간별 누적 분포 + 합계/건수"""
+
+    type_name = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+        # {라벨: [구간별 건수, 합계, 건수]}
+        self._values: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """with 블록 실행 시간 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels) -> int:
+        with self._lock:
+            entry = self._values.get(self._key(labels))
+            return entry[2] if entry else 0
+
+    def sum(self, **labels) -> float:
+        with self._lock:
+            entry = self._values.get(self._key(labels))
+            return entry[1] if entry else 0.0
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        with self._lock:
+            for key, (counts, total, count) in self._values.items():
+                labels = self._labels(key)
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets, counts):
+                    cumulative += bucket_count
+                    bucket_labels = _format_labels({**labels, 'le': _format_value(bound)})
+                    lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+                lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(total)}")
+                lines.append(f"{self.name}_count{_format_labels(labels)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """메트릭 모음"""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 (0.0.4)"""
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = MetricsRegistry()
+
+# 처리 단계별 시간 (fetch, sma, signal, notify, symbol_list, notify.telegram ...)
+STAGE_SECONDS = REGISTRY.register(Histogram(
+    'sma_monitor_stage_seconds', '처리 단계별 소요 시간 (초)', ['stage']))
+
+# API 엔드포인트별 요청 시간
+API_REQUEST_SECONDS = REGISTRY.register(Histogram(
+    'sma_monitor_api_request_seconds', 'API 엔드포인트별 요청 시간 (초)', ['endpoint']))
+API_REQUEST_WEIGHT = REGISTRY.register(Counter(
+    'sma_monitor_api_request_weight_total', 'API 엔드포인트별 요청 웨이트 합계', ['endpoint']))
+API_ERRORS = REGISTRY.register(Counter(
+    'sma_monitor_api_errors_total', 'API 오류 응답 수', ['endpoint', 'status']))
+API_USED_WEIGHT = REGISTRY.register(Gauge(
+    'sma_monitor_api_used_weight_1m', '서버가 알려준 현재 분 사용 웨이트 (X-MBX-USED-WEIGHT-1M)'))
+
+# 스캔 지표
+SCAN_SECONDS = REGISTRY.register(Histogram(
+    'sma_monitor_scan_seconds', '전체 스캔 소요 시간 (초)'))
+SCAN_INTERVAL_RATIO = REGISTRY.register(Gauge(
+    'sma_monitor_scan_interval_ratio', '마지막 스캔 소요 시간 / INTERVAL (1 이상이면 주기 초과)'))
+SCAN_SYMBOLS = REGISTRY.register(Gauge(
+    'sma_monitor_scan_symbols', '마지막 스캔 심볼 수'))
+SCAN_SKIPPED_SYMBOLS = REGISTRY.register(Gauge(
+    'sma_monitor_scan_skipped_symbols', '마지막 스캔에서 우선순위로 생략한 심볼 수'))
+SCAN_PRESCREENED_SYMBOLS = REGISTRY.register(Gauge(
+    'sma_monitor_scan_prescreened_symbols', '마지막 스캔에서 현재가 사전 선별로 제외한 심볼 수'))
+SCAN_SYMBOLS_PER_SECOND = REGISTRY.register(Gauge(
+    'sma_monitor_scan_symbols_per_second', '마지막 스캔 처리량 (심볼/초)'))
+CANDLE_CLOSE_LAG_SECONDS = REGISTRY.register(Histogram(
+    'sma_monitor_candle_close_lag_seconds', '캔들 마감부터 스캔 시작/알림/스캔 종료까지 시간 (서버 시각 기준, 초)',
+    ['event'], buckets=(0.5, 1, 2, 3, 5, 10, 15, 30, 60, 120, 300, 900)))
+SERVER_CLOCK_OFFSET_SECONDS = REGISTRY.register(Gauge(
+    'sma_monitor_server_clock_offset_seconds', '바이낸스 서버 시각 - 로컬 시각 (초)'))
+SIGNALS = REGISTRY.register(Counter(
+    'sma_monitor_signals_total', '발생한 시그널 수', ['signal_type']))
+
+# 알림 전송 지표 (백그라운드 디스패처)
+NOTIFY_DELIVERY_SECONDS = REGISTRY.register(Histogram(
+    'sma_monitor_notify_delivery_seconds', '채널별 알림 전달 시간 (대기열 대기 + 전송, 초)', ['channel']))
+NOTIFY_FAILED = REGISTRY.register(Counter(
+    'sma_monitor_notify_failed_total', '채널별 알림 전송 실패 수', ['channel']))
+NOTIFY_DROPPED = REGISTRY.register(Counter(
+    'sma_monitor_notify_dropped_total', '대기열 초과로 버린 알림 수', ['channel']))
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """/metrics 요청 처리"""
+
+    registry: MetricsRegistry = REGISTRY
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.split('?')[0] != '/metrics':
+            self.send_error(404)
+            return
+
+        body = self.registry.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def start_http_server(port: int = 9108, host: str = '127.0.0.1',
+                      registry: MetricsRegistry = REGISTRY) -> ThreadingHTTPServer:
+    """
+    /metrics HTTP 엔드포인트 시작 (백그라운드 스레드)
+
+    Args:
+        port: 포트
+        host: 바인드 주소
+        registry: 노출할 메트릭 모음
+
+    Returns:
+        HTTP 서버 (shutdown()으로 중단)
+    """
+    handler = type('MetricsHandler', (_MetricsHandler,), {'registry': registry})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    logger.info(f"메트릭 엔드포인트 시작: http://{host}:{port}/metrics")
+    return server
@@ -0,0 +1,296 @@
+"""
+다중 구간 모멘텀 엔진 모듈
+심볼별 최근 종가와 거래대금 누적합(prefix sum)을 보관해, 설정된 모든 모멘텀 구간(4h/6h/12h/24h)을
+추가 조회/재계산 없이 구간당 O(1)로 계산
+"""
+from typing import Dict, List, NamedTuple, Optional
+import numpy as np
+import pandas as pd
+import logging
+from .candle_view import CandleView
+from .signal_detector import timeframe_candles
+
+logger = logging.getLogger(__name__)
+
+
+class MomentumWindow(NamedTuple):
+    """모멘텀 시그널 구간과 기준"""
+    timeframe: str  # 시간 기준 (4h, 6h, 12h, 24h)
+    candles: int  # 구간 캔들 수
+    min_volume_usd: float  # 최소 거래대금 (USD)
+    min_price_change_pct: float  # 최소 상승률 (%)
+
+
+class MomentumReading(NamedTuple):
+    """구간별 상승률/거래대금"""
+    window: MomentumWindow
+    price_change_pct: float
+    quote_volume: float
+
+
+def momentum_windows_from_config(momentum_config: Dict, interval: str) -> List[MomentumWindow]:
+    """
+    SIGNAL.MOMENTUM 설정에서 모멘텀 구간 리스트 생성
+
+    TIMEFRAMES 항목은 "4h" 같은 문자열 또는 {TIMEFRAME, MIN_VOLUME_USD, MIN_PRICE_CHANGE_PCT}
+    (빠진 기준은 MOMENTUM의 값 사용). TIMEFRAMES가 없으면 TIMEFRAME 하나 (기본 24h).
+
+    Args:
+        momentum_config: SIGNAL.MOMENTUM 설정
+        interval: 분석 캔들 시간 프레임
+
+    Returns:
+        구간 리스트 (짧은 구간 순, 같은 시간 기준은 하나만)
+    """
+    min_volume = momentum_config.get('MIN_VOLUME_USD', 100_000_000)
+    min_price_change = momentum_config.get('MIN_PRICE_CHANGE_PCT', 15.0)
+    entries = momentum_config.get('TIMEFRAMES') or [momentum_config.get('TIMEFRAME', '24h')]
+
+    windows: Dict[str, MomentumWindow] = {}
+    for entry in entries:
+        if isinstance(entry, str):
+            entry = {'TIMEFRAME': entry}
+        timeframe = entry['TIMEFRAME']
+        windows[timeframe] = MomentumWindow(
+            timeframe=timeframe,
+            candles=timeframe_candles(timeframe, interval),
+            min_volume_usd=entry.get('MIN_VOLUME_USD', min_volume),
+            min_price_change_pct=entry.get('MIN_PRICE_CHANGE_PCT', min_price_change),
+        )
+
+    return sorted(windows.values(), key=lambda window: window.candles)
+
+
+class StreamingMomentum:
+    """
+    심볼별 증분 모멘텀 상태
+    - 최근 (최대 구간 + 1)개 캔들의 종가/거래대금/거래대금 누적합 링 버퍼
+    - 캔들 추가/교체 O(1), 구간별 상승률/거래대금 O(1)
+    """
+
+    def __init__(self, max_candles: int):
+        """
+        초기화
+
+        Args:
+            max_candles: 가장 긴 구간의 캔들 수
+        """
+        self.size = max_candles + 1
+
+        self._closes = [0.0] * self.size
+        self._volumes = [0.0] * self.size
+        self._prefix = [0.0] * self.size  # 보관 중인 가장 오래된 캔들부터의 거래대금 누적합
+        self._pos = 0  # 다음에 쓸 위치
+        self._count = 0  # 지금까지 추가된 캔들 수
+        self._pushes_since_rebase = 0
+        self.last_timestamp: Optional[pd.Timestamp] = None
+
+    def _rebase(self):
+        """누적합을 보관 중인 캔들부터 다시 계산 (누적합이 커지며 생기는 오차 방지)"""
+        n = min(self._count, self.size)
+        total = 0.0
+        for i in range(n, 0, -1):
+            index = (self._pos - i) % self.size
+            total += self._volumes[index]
+            self._prefix[index] = total
+        self._pushes_since_rebase = 0
+
+    def push(self, close: float, quote_volume: float, timestamp: Optional[pd.Timestamp] = None):
+        """
+        새 캔들 추가
+
+        Args:
+            close: 종가
+            quote_volume: 거래대금
+            timestamp: 캔들 시작 시각
+        """
+        base = self._prefix[(self._pos - 1) % self.size] if self._count else 0.0
+
+        self._closes[self._pos] = float(close)
+        self._volumes[self._pos] = float(quote_volume)
+        self._prefix[self._pos] = base + float(quote_volume)
+        self._pos = (self._pos + 1) % self.size
+        self._count += 1
+        self.last_timestamp = timestamp
+
+        # 버퍼를 한 바퀴 돌 때마다 한 번 재계산 (분할 상환 O(1))
+        self._pushes_since_rebase += 1
+        if self._pushes_since_rebase >= self.size:
+            self._rebase()
+
+    def replace_last(self, close: float, quote_volume: float):
+        """
+        마지막 캔들 교체 (진행 중인 캔들 갱신)
+
+        Args:
+            close: 새 종가
+            quote_volume: 새 거래대금
+        """
+        if self._count == 0:
+            return
+
+        last = (self._pos - 1) % self.size
+        base = self._prefix[(self._pos - 2) % self.size] if self._count >= 2 else 0.0
+
+        self._closes[last] = float(close)
+        self._volumes[last] = float(quote_volume)
+        self._prefix[last] = base + float(quote_volume)
+
+    def reset(self):
+        """상태 초기화"""
+        self._closes = [0.0] * self.size
+        self._volumes = [0.0] * self.size
+        self._prefix = [0.0] * self.size
+        self._pos = 0
+        self._count = 0
+        self._pushes_since_rebase = 0
+        self.last_timestamp = None
+
+    def update(self, df: pd.DataFrame):
+        """
+        캔들 데이터프레임과 동기화
+        - 마지막으로 반영한 캔들 이후만 추가 (같은 캔들은 교체)
+        - 이어지지 않으면 최근 캔들로 다시 적재
+
+        Args:
+            df: OHLCV 데이터프레임
+        """
+        if df.empty:
+            return
+
+        view = CandleView(df)
+        closes = view.close
+        quote_volumes = view.column('quote_volume') if view.has('quote_volume') else None
+        volumes = view.column('volume') if quote_volumes is None else None
+        index = df.index
+        start = 0
+
+        def quote_volume_at(i: int) -> float:
+            # quote_volume 컬럼이 없으면 거래량 × 종가로 추정
+            return quote_volumes[i] if quote_volumes is not None else volumes[i] * closes[i]
+
+        if self.last_timestamp is not None:
+            pos = index.searchsorted(self.last_timestamp)
+            if pos < len(index) and index[pos] == self.last_timestamp:
+                self.replace_last(closes[pos], quote_volume_at(pos))
+                start = pos + 1
+            else:
+                self.reset()
+
+        # 버퍼보다 오래된 캔들은 다시 밀려나므로 건너뜀
+        if self.last_timestamp is None:
+            start = max(start, len(closes) - self.size)
+
+        for i in range(start, len(closes)):
+            self.push(closes[i], quote_volume_at(i), index[i])
+
+    def reading(self, window: MomentumWindow) -> Optional[MomentumReading]:
+        """
+        구간 상승률/거래대금
+
+        Args:
+            window: 모멘텀 구간
+
+        Returns:
+            구간 결과 (데이터가 부족하면 None)
+        """
+        n = window.candles
+        if n >= self.size or self._count < n + 1:
+            return None
+
+        last = (self._pos - 1) % self.size
+        past = (self._pos - 1 - n) % self.size
+        current_price = self._closes[last]
+        past_price = self._closes[past]
+
+        return MomentumReading(
+            window=window,
+            price_change_pct=(current_price - past_price) / past_price * 100,
+            quote_volume=self._prefix[last] - self._prefix[past],
+        )
+
+
+class MomentumEngine:
+    """설정된 모든 모멘텀 구간을 한 번에 계산하는 엔진 (심볼별 증분 상태)"""
+
+    def __init__(self, windows: List[MomentumWindow]):
+        """
+        초기화
+
+        Args:
+            windows: 모멘텀 구간 리스트
+        """
+        self.windows = list(windows)
+        self.max_candles = max((window.candles for window in self.windows), default=0)
+
+        # 심볼별 증분 모멘텀 상태
+        self._streams: Dict[str, StreamingMomentum] = {}
+
+        logger.info(f"모멘텀 엔진 초기화: 구간 {[window.timeframe for window in self.windows]}")
+
+    def update(self, symbol: str, df: pd.DataFrame) -> List[MomentumReading]:
+        """
+        새 캔들만 반영 후 모든 구간 계산
+
+        Args:
+            symbol: 심볼
+            df: OHLCV 데이터프레임
+
+        Returns:
+            구간 결과 리스트 (데이터가 부족한 구간은 제외)
+        """
+        if df.empty or not self.windows:
+            return []
+
+        stream = self._streams.get(symbol)
+        if stream is None:
+            stream = self._streams[symbol] = StreamingMomentum(self.max_candles)
+
+        stream.update(df)
+        return [reading for reading in map(stream.reading, self.windows) if reading is not None]
+
+    def evaluate(self, df: pd.DataFrame) -> List[MomentumReading]:
+        """
+        상태 없이 모든 구간 계산 (최근 캔들 거래대금 누적합 1회 후 구간당 O(1), 프로세스 풀용)
+
+        Args:
+            df: OHLCV 데이터프레임
+
+        Returns:
+            구간 결과 리스트 (데이터가 부족한 구간은 제외)
+        """
+        if df.empty or not self.windows:
+            return []
+
+        view = CandleView(df)
+        tail = min(len(df), self.max_candles + 1)
+        closes = view.close[-tail:]
+        if view.has('quote_volume'):
+            prefix = np.cumsum(view.column('quote_volume')[-tail:])
+        else:
+            prefix = np.cumsum(view.column('volume')[-tail:] * closes)
+
+        readings = []
+        for window in self.windows:
+            n = window.candles
+            if tail < n + 1:
+                continue
+            past_price = closes[-(n + 1)]
+            readings.append(MomentumReading(
+                window=window,
+                price_change_pct=float((closes[-1] - past_price) / past_price * 100),
+                quote_volume=float(prefix[-1] - prefix[-(n + 1)]),
+            ))
+        return readings
+
+    def retain(self, symbols: List[str]):
+        """
+        모니터링 대상이 아닌 심볼의 상태 삭제
+
+        Args:
+            symbols: 유지할 심볼 리스트
+        """
+        keep = set(symbols)
+        for symbol in list(self._streams):
+            if symbol not in keep:
+                del self._streams[symbol]
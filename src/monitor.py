@@ -2,13 +2,29 @@
 메인 모니터링 모듈
 실시간 모니터링 및 시그널 감지
 """
+import asyncio
 import time
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
+import pandas as pd
 import logging
 from .binance_api import BinanceAPI
+from .alert_store import AlertStore
+from .candle_store import CandleStore
+from .candle_view import column_view
+from .cluster import ClusterMembership
+from .async_fetcher import AsyncKlineFetcher
+from .kline_cache import INTERVAL_MS
+from .kline_stream import KlineStream, DEFAULT_STREAM_URL
+from .momentum_engine import MomentumEngine, momentum_windows_from_config
 from .sma_calculator import SMACalculator
-from .signal_detector import SignalDetector
+from .signal_detector import SignalDetector, NEAR_TOLERANCE_PCT
 from .notifier import Notifier
+from .parallel_scan import ParallelAnalyzer
+from .prescreen import PriceScreen
+from .scan_scheduler import CandleCloseScheduler, ServerClock
+from .symbol_priority import DEFAULT_TIERS, PriorityScheduler
+from . import metrics
 
 logger = logging.getLogger(__name__)
 
@@ -25,19 +41,59 @@ class SMAMonitor:
         """
         self.config = config
 
+        # 디스크 캔들 저장소 (재시작 시 캔들 복원)
+        monitor_config = config.get('MONITOR', {})
+        store_config = monitor_config.get('CANDLE_STORE', {})
+        candle_store = None
+        if store_config.get('ENABLED', False):
+            candle_store = CandleStore(
+                path=store_config.get('PATH', 'data/candles'),
+                max_candles=store_config.get('MAX_CANDLES', 5000)
+            )
+
         # Binance API 초기화
         binance_config = config.get('BINANCE', {})
         self.api = BinanceAPI(
             api_key=binance_config.get('API_KEY', ''),
             api_secret=binance_config.get('API_SECRET', ''),
-            testnet=binance_config.get('TESTNET', False)
+            testnet=binance_config.get('TESTNET', False),
+            weight_per_minute=binance_config.get('WEIGHT_PER_MINUTE', 1800),
+            snapshot_ttl=binance_config.get('SNAPSHOT_TTL', 300),
+            candle_store=candle_store,
+            futures_url=binance_config.get('FUTURES_URL', '')
         )
 
         # 모니터링 설정
-        monitor_config = config.get('MONITOR', {})
         self.interval = monitor_config.get('INTERVAL', 60)
         self.timeframe = monitor_config.get('TIMEFRAME', '15m')
 
+        # 실행 모드: POLLING (REST 주기 조회), STREAMING (웹소켓 캔들 마감 이벤트)
+        self.mode = monitor_config.get('MODE', 'POLLING')
+        stream_config = monitor_config.get('STREAM', {})
+        self.stream_url = stream_config.get('URL', DEFAULT_STREAM_URL)
+        self.stream_symbol_refresh = stream_config.get('SYMBOL_REFRESH', self.interval * 10)
+
+        # 스캔 시점: INTERVAL (스캔 후 INTERVAL초 대기), CANDLE_CLOSE (서버 시각 기준 캔들 마감 직후)
+        schedule_config = monitor_config.get('SCHEDULE', {})
+        self.scheduler: Optional[CandleCloseScheduler] = None
+        if schedule_config.get('MODE', 'INTERVAL') == 'CANDLE_CLOSE':
+            clock = ServerClock(self.api.get_server_time,
+                                resync_interval=schedule_config.get('CLOCK_SYNC_INTERVAL', 600))
+            self.scheduler = CandleCloseScheduler(INTERVAL_MS[self.timeframe], clock,
+                                                  settle_delay=schedule_config.get('SETTLE_DELAY', 2.0))
+
+        # 비동기 캔들 수집 설정
+        async_fetch_config = monitor_config.get('ASYNC_FETCH', {})
+        self.fetcher: Optional[AsyncKlineFetcher] = None
+        if async_fetch_config.get('ENABLED', False):
+            self.fetcher = AsyncKlineFetcher(
+                self.api,
+                api_key=binance_config.get('API_KEY', ''),
+                api_secret=binance_config.get('API_SECRET', ''),
+                testnet=binance_config.get('TESTNET', False),
+                concurrency=async_fetch_config.get('CONCURRENCY', 10)
+            )
+
         # 코인 필터 설정
         coin_filter = monitor_config.get('COIN_FILTER', {})
         self.coin_filter_mode = coin_filter.get('MODE', 'FILTERED')
@@ -54,63 +110,194 @@ class SMAMonitor:
         # 시그널 감지기
         signal_config = config.get('SIGNAL', {})
         breakout_config = signal_config.get('BREAKOUT', {})
+        # 알림 쿨다운 저장소 (재시작/run_once 실행 간 쿨다운 유지)
+        alert_store_config = signal_config.get('ALERT_STORE', {})
+        # 다중 인스턴스 모드면 모든 인스턴스가 같은 저장소 파일로 중복 알림을 막음
+        cluster_config = monitor_config.get('CLUSTER', {})
+        cluster_enabled = cluster_config.get('ENABLED', False)
+        alert_store = None
+        if alert_store_config.get('ENABLED', False) or cluster_enabled:
+            alert_store = AlertStore(
+                path=alert_store_config.get('PATH', 'data/alerts.db'),
+                history_days=alert_store_config.get('HISTORY_DAYS', 30),
+                shared=cluster_enabled
+            )
+
         self.signal_detector = SignalDetector(
             target_sma=breakout_config.get('TARGET_SMA', 960),
             confirm_candles=breakout_config.get('CONFIRM_CANDLES', 1),
-            cooldown=signal_config.get('COOLDOWN', 3600)
+            cooldown=signal_config.get('COOLDOWN', 3600),
+            alert_store=alert_store,
+            interval=self.timeframe
         )
         self.breakout_type = breakout_config.get('TYPE', 'CLOSE')
 
         # 모멘텀 설정
         momentum_config = signal_config.get('MOMENTUM', {})
         self.momentum_enabled = momentum_config.get('ENABLED', False)
-        self.momentum_timeframe = momentum_config.get('TIMEFRAME', '24h')  # 4h, 6h, 12h, 24h
-        self.momentum_min_volume = momentum_config.get('MIN_VOLUME_USD', 100_000_000)
-        self.momentum_min_price_change = momentum_config.get('MIN_PRICE_CHANGE_PCT', 15.0)
+        # 모멘텀 구간 (4h, 6h, 12h, 24h, 여러 개 동시 사용 가능) - 같은 캔들에서 한 번에 계산
+        self.momentum_windows = momentum_windows_from_config(momentum_config, self.timeframe)
+        self.momentum_engine = MomentumEngine(self.momentum_windows)
+
+        # 현재가 사전 선별 (전체 현재가 1회 조회 + 캐시된 캔들로 시그널 불가능한 심볼의 캔들 조회 생략)
+        prescreen_config = monitor_config.get('PRESCREEN', {})
+        self.prescreen: Optional[PriceScreen] = None
+        if prescreen_config.get('ENABLED', False):
+            self.prescreen = PriceScreen(
+                interval_ms=INTERVAL_MS[self.timeframe],
+                tolerance_pct=NEAR_TOLERANCE_PCT,
+                momentum_windows=[
+                    (window.candles, window.min_price_change_pct) for window in self.momentum_windows
+                ] if self.momentum_enabled else None,
+                margin_pct=prescreen_config.get('MARGIN_PCT', 1.0),
+                max_move_pct=prescreen_config.get('MAX_MOVE_PCT', 30.0),
+                max_unknown_candles=prescreen_config.get('MAX_UNKNOWN_CANDLES', 12)
+            )
+
+        # 프로세스 풀 분석 (심볼을 여러 프로세스에 나눠 SMA/시그널 계산)
+        pool_config = monitor_config.get('PROCESS_POOL', {})
+        self.analyzer: Optional[ParallelAnalyzer] = None
+        if pool_config.get('ENABLED', False):
+            self.analyzer = ParallelAnalyzer({
+                'periods': sma_periods,
+                'target_sma': self.signal_detector.target_sma,
+                'confirm_candles': self.signal_detector.confirm_candles,
+                'interval': self.timeframe,
+                'breakout_type': self.breakout_type,
+                'momentum_enabled': self.momentum_enabled,
+                'momentum_windows': self.momentum_windows,
+            }, workers=pool_config.get('WORKERS', 0))
 
         # 알림기
         notification_config = config.get('NOTIFICATION', {})
         self.notifier = Notifier(notification_config)
 
-        # 모니터링할 심볼 리스트
+        # 다중 인스턴스 심볼 분할 (공유 파일 임대 + 일관 해싱, 임대 등록은 run()에서)
+        self.cluster: Optional[ClusterMembership] = None
+        if cluster_enabled:
+            self.cluster = ClusterMembership(
+                path=cluster_config.get('PATH', 'data/cluster.db'),
+                instance_id=cluster_config.get('INSTANCE_ID', ''),
+                lease_ttl=cluster_config.get('LEASE_TTL', 30),
+                virtual_nodes=cluster_config.get('VIRTUAL_NODES', 64)
+            )
+        self._assigned_members: Tuple[str, ...] = ()
+
+        # 전체 대상 심볼 / 이 인스턴스가 모니터링할 심볼 리스트
+        self.universe: List[str] = []
         self.symbols: List[str] = []
 
+        # 심볼별 마지막 분석 시 종가와 target SMA의 거리 (%, 작을수록 먼저 스캔), 모멘텀 구간 상승률 (%)
+        self.sma_distance: Dict[str, float] = {}
+        self.momentum_change: Dict[str, float] = {}
+
+        # 우선순위 스캔 (target SMA 밴드에서 먼 심볼은 여러 스캔에 한 번만 조회)
+        priority_config = monitor_config.get('PRIORITY', {})
+        self.priority: Optional[PriorityScheduler] = None
+        if priority_config.get('ENABLED', False):
+            tiers = priority_config.get('TIERS')
+            self.priority = PriorityScheduler(
+                tiers=[(tier['MAX_DISTANCE_PCT'], tier['EVERY']) for tier in tiers] if tiers else DEFAULT_TIERS,
+                cold_every=priority_config.get('COLD_EVERY', 8),
+                momentum_hot_pct=priority_config.get('MOMENTUM_HOT_PCT', 5.0)
+            )
+        # 진행 중인 스캔의 캔들 마감 시각 (epoch ms, 캔들 마감 정렬 모드)
+        self._candle_close_ms: Optional[int] = None
+        self._closed = False
+
         logger.info("SMA 모니터 초기화 완료")
 
+    @property
+    def kline_limit(self) -> int:
+        """심볼당 필요한 캔들 수 (SMA 계산에 충분한 양)"""
+        return self.sma_calculator.max_period + 100
+
     def update_symbol_list(self):
         """모니터링할 심볼 리스트 업데이트"""
+        with metrics.STAGE_SECONDS.time(stage='symbol_list'):
+            self._update_symbol_list()
+
+    def _update_symbol_list(self):
         logger.info("심볼 리스트 업데이트 중...")
 
         if self.coin_filter_mode == 'ALL':
             # ALL 모드: 3일 상승률 기반 필터 사용
-            self.symbols = self.api.get_filtered_symbols_by_momentum(
+            symbols = self.api.get_filtered_symbols_by_momentum(
                 min_volume_usd=2_000_000,
                 min_3day_change_pct=8.0
             )
         elif self.coin_filter_mode == 'TOP_VOLUME':
-            self.symbols = self.api.get_top_volume_symbols(self.top_n)
+            symbols = self.api.get_top_volume_symbols(self.top_n)
         elif self.coin_filter_mode == 'FILTERED':
-            self.symbols = self.api.get_filtered_symbols(
+            symbols = self.api.get_filtered_symbols(
                 min_volume_usd=self.min_volume_usd,
                 min_price_change_pct=self.min_price_change_pct
             )
         elif self.coin_filter_mode == 'SPECIFIC':
-            self.symbols = self.specific_coins
+            symbols = self.specific_coins
         else:
             logger.warning(f"알 수 없는 필터 모드: {self.coin_filter_mode}. 3일 모멘텀 필터 사용")
-            self.symbols = self.api.get_filtered_symbols_by_momentum(
+            symbols = self.api.get_filtered_symbols_by_momentum(
                 min_volume_usd=2_000_000,
                 min_3day_change_pct=8.0
             )
 
-        logger.info(f"모니터링 대상: {len(self.symbols)}개 심볼")
+        self.universe = symbols
+        self._assign_symbols()
+
+    def _assign_symbols(self):
+        """전체 대상 심볼 중 이 인스턴스 담당 심볼 결정 (클러스터에 참여하지 않았으면 전체)"""
+        if self.cluster is not None and self.cluster.joined:
+            self._assigned_members = self.cluster.members
+            self.symbols = self.cluster.partition(self.universe)
+        else:
+            self.symbols = self.universe
+
+        # 대상에서 빠진 심볼의 캔들 캐시/SMA 엔진 정리
+        self.api.kline_cache.retain(self.symbols)
+        self.api.resampler.retain(self.symbols)
+        self.sma_calculator.retain_streams(self.symbols)
+        self.momentum_engine.retain(self.symbols)
+        keep = set(self.symbols)
+        self.sma_distance = {symbol: d for symbol, d in self.sma_distance.items() if symbol in keep}
+        self.momentum_change = {symbol: c for symbol, c in self.momentum_change.items() if symbol in keep}
+        if self.priority is not None:
+            self.priority.retain(self.symbols)
+
+        if self.cluster is not None and self.cluster.joined:
+            logger.info(f"모니터링 대상: {len(self.symbols)}/{len(self.universe)}개 심볼 "
+                        f"(인스턴스 {len(self._assigned_members)}개 중 {self.cluster.instance_id})")
+        else:
+            logger.info(f"모니터링 대상: {len(self.symbols)}개 심볼")
+
+    def rebalance(self) -> bool:
+        """
+        클러스터 구성이 바뀌었으면 담당 심볼 다시 분배
+
+        Returns:
+            재분배 여부
+        """
+        if self.cluster is None or not self.cluster.joined or self.cluster.members == self._assigned_members:
+            return False
+
+        self._assign_symbols()
+        return True
+
+    def join_cluster(self):
+        """
+        클러스터 임대 등록 (상시 실행 모드에서만)
+        --status, --test 같은 일회성 실행이 살아 있는 인스턴스로 잡혀 다른 인스턴스의 담당 심볼을 가져가지 않도록
+        """
+        if self.cluster is not None and not self.cluster.joined:
+            self.cluster.start()
 
-    def analyze_symbol(self, symbol: str) -> bool:
+    def analyze_symbol(self, symbol: str, df: Optional[pd.DataFrame] = None) -> bool:
         """
         단일 심볼 분석
 
         Args:
             symbol: 심볼
+            df: 미리 수집한 캔들 데이터 (None이면 직접 조회)
 
         Returns:
             시그널 발생 여부
@@ -120,17 +307,18 @@ class SMAMonitor:
         try:
             # 1. 역배열 시그널 체크
             # 캔들 데이터 가져오기 (SMA 계산에 충분한 양)
-            limit = self.sma_calculator.max_period + 100
-            df = self.api.get_klines(symbol, interval=self.timeframe, limit=limit)
+            if df is None:
+                with metrics.STAGE_SECONDS.time(stage='fetch'):
+                    df = self.api.get_klines_cached(symbol, interval=self.timeframe, limit=self.kline_limit)
 
             if df.empty:
                 logger.debug(f"{symbol}: 데이터 없음")
             else:
-                # SMA 계산
-                df_with_sma = self.sma_calculator.calculate_all_smas(df)
-
-                # 현재 SMA 값들
-                sma_values = self.sma_calculator.get_current_sma_values(df_with_sma)
+                with metrics.STAGE_SECONDS.time(stage='sma'):
+                    # 현재 SMA 값들 (증분 엔진, 돌파 확인에 필요한 캔들 수만큼 값 유지, 캔들 데이터 복사 없음)
+                    sma_values = self.sma_calculator.update_streaming(
+                        symbol, df, history=self.signal_detector.confirm_candles + 1
+                    )
 
                 if sma_values:
                     # 사용 가능한 target SMA 결정 (960만)
@@ -141,60 +329,60 @@ class SMAMonitor:
                         reverse_aligned, reverse_type = self.sma_calculator.check_reverse_alignment_flexible(sma_values, actual_target_sma)
 
                         # 디버그: target SMA 근처 체크
-                        current_price = df_with_sma.iloc[-1]['close']
+                        current_price = float(column_view(df, 'close')[-1])
                         target_sma_value = sma_values.get(actual_target_sma)
                         if target_sma_value:
                             diff_pct = ((current_price - target_sma_value) / target_sma_value) * 100
+                            self.sma_distance[symbol] = abs(float(diff_pct))
                             lower_bound = target_sma_value * 0.95
                             upper_bound = target_sma_value * 1.05
                             if lower_bound <= current_price <= upper_bound:
                                 reverse_label = f"✅({reverse_type})" if reverse_aligned else "❌"
                                 logger.info(f"{symbol}: SMA{actual_target_sma} 근처! 종가={current_price:.4f}, SMA{actual_target_sma}={target_sma_value:.4f}, 차이={diff_pct:+.2f}%, 역배열={reverse_label}")
 
+                        # 24시간 모멘텀 필터용 1시간봉 (기본 캔들에서 증분 리샘플, 추가 조회 없음)
+                        hourly_df = None
+                        if reverse_aligned and INTERVAL_MS.get(self.timeframe, 0) < INTERVAL_MS['1h']:
+                            with metrics.STAGE_SECONDS.time(stage='resample'):
+                                hourly_df = self.api.get_resampled_klines(symbol, self.timeframe, '1h', df)
+
                         # 역배열 시그널 분석
-                        signal_info = self.signal_detector.analyze_signal(
-                            symbol=symbol,
-                            df=df_with_sma,
-                            sma_values=sma_values,
-                            reverse_aligned=reverse_aligned,
-                            reverse_type=reverse_type,
-                            actual_target_sma=actual_target_sma,
-                            breakout_type=self.breakout_type
-                        )
+                        with metrics.STAGE_SECONDS.time(stage='signal.reverse'):
+                            signal_info = self.signal_detector.analyze_signal(
+                                symbol=symbol,
+                                df=df,
+                                sma_values=sma_values,
+                                reverse_aligned=reverse_aligned,
+                                reverse_type=reverse_type,
+                                actual_target_sma=actual_target_sma,
+                                breakout_type=self.breakout_type,
+                                hourly_df=hourly_df
+                            )
 
                         if signal_info:
-                            # 거래대금 순위 및 거래대금 추가
-                            volume_info = self.api.get_volume_rank(symbol)
-                            if volume_info:
-                                signal_info['volume_rank'] = volume_info['rank']
-                                signal_info['quote_volume'] = volume_info['quote_volume']
-
                             # 역배열 시그널 발생!
-                            summary = self.signal_detector.get_signal_summary(signal_info)
-                            self.notifier.send_signal_alert(signal_info, summary)
+                            self._publish_signal(signal_info)
                             signal_detected = True
 
-            # 2. 모멘텀 시그널 체크 (활성화된 경우)
-            if self.momentum_enabled and not df.empty:
-                momentum_signal = self.signal_detector.analyze_momentum_signal_rolling(
-                    symbol=symbol,
-                    df=df,
-                    timeframe=self.momentum_timeframe,
-                    min_volume_usd=self.momentum_min_volume,
-                    min_price_change_pct=self.momentum_min_price_change
-                )
+            # 2. 모멘텀 구간별 상승률/거래대금 (새 캔들만 누적합에 반영, 설정된 모든 구간을 한 번에)
+            with metrics.STAGE_SECONDS.time(stage='signal.momentum'):
+                readings = self.momentum_engine.update(symbol, df)
+
+                # 우선순위 스캔용 모멘텀 구간 상승률 (구간 중 최대)
+                if readings:
+                    self.momentum_change[symbol] = max(reading.price_change_pct for reading in readings)
 
-                if momentum_signal:
-                    # 거래대금 순위 및 거래대금 추가
-                    volume_info = self.api.get_volume_rank(symbol)
-                    if volume_info:
-                        momentum_signal['volume_rank'] = volume_info['rank']
-                        momentum_signal['quote_volume'] = volume_info['quote_volume']
+                # 모멘텀 시그널 체크 (활성화된 경우)
+                momentum_signals = []
+                if self.momentum_enabled and readings:
+                    momentum_signals = self.signal_detector.analyze_momentum_readings(
+                        symbol, readings, float(column_view(df, 'close')[-1]), df.index[-1]
+                    )
 
-                    # 모멘텀 시그널 발생!
-                    summary = self.signal_detector.get_signal_summary(momentum_signal)
-                    self.notifier.send_signal_alert(momentum_signal, summary)
-                    signal_detected = True
+            for momentum_signal in momentum_signals:
+                # 모멘텀 시그널 발생!
+                self._publish_signal(momentum_signal)
+                signal_detected = True
 
             return signal_detected
 
@@ -202,29 +390,331 @@ class SMAMonitor:
             logger.error(f"{symbol} 분석 중 오류: {e}")
             return False
 
-    def scan_all_symbols(self) -> int:
+    def ordered_symbols(self) -> List[str]:
+        """
+        스캔 순서 (마지막 분석에서 target SMA에 가까웠던 심볼 먼저, 분석 전인 심볼은 맨 앞)
+
+        Returns:
+            정렬된 심볼 리스트
+        """
+        return sorted(self.symbols, key=lambda symbol: self.sma_distance.get(symbol, 0.0))
+
+    def scan_all_symbols(self, candle_close_ms: Optional[int] = None) -> int:
         """
         모든 심볼 스캔
 
+        Args:
+            candle_close_ms: 이 스캔이 처리하는 캔들 마감 시각 (epoch ms, 마감 후 지연 측정용)
+
         Returns:
             발견된 시그널 수
         """
+        # 다른 인스턴스가 합류/종료했으면 담당 심볼 재분배
+        self.rebalance()
+
         logger.info(f"{len(self.symbols)}개 심볼 스캔 시작...")
 
-        signal_count = 0
+        started = time.perf_counter()
+        self._candle_close_ms = candle_close_ms
+        self._observe_close_lag('scan_start')
+        symbols = self.ordered_symbols()
+
+        # 우선순위 스캔: 이번 스캔 차례가 아닌 먼 심볼은 캔들 조회/분석 생략
+        if self.priority is not None:
+            symbols = self.priority.select(symbols, self.sma_distance, self.momentum_change)
+            skipped = len(self.symbols) - len(symbols)
+            metrics.SCAN_SKIPPED_SYMBOLS.set(skipped)
+            if skipped:
+                logger.info(f"우선순위 스캔: {len(symbols)}개 조회, {skipped}개 생략")
+
+        # 현재가 사전 선별: 이번 스캔에 시그널이 불가능한 심볼은 캔들 조회 생략
+        if self.prescreen is not None:
+            symbols = self._prescreen_symbols(symbols)
+
+        # 비동기 모드: 전체 심볼 캔들을 먼저 동시 수집
+        frames = None
+        if self.fetcher is not None:
+            with metrics.STAGE_SECONDS.time(stage='fetch_all'):
+                frames = self.fetcher.fetch_all(symbols, self.timeframe, self.kline_limit)
+
+        # 텔레그램 요약 전송이 켜져 있으면 스캔 동안의 시그널을 모아서 전송
+        self.notifier.begin_batch()
+        try:
+            if self.analyzer is not None:
+                signal_count = self._scan_parallel(symbols, frames)
+            else:
+                signal_count = self._scan_sequential(symbols, frames)
+        finally:
+            self.notifier.end_batch()
+            self._observe_close_lag('scan_end')
+            self._candle_close_ms = None
+
+        elapsed = time.perf_counter() - started
+        metrics.SCAN_SECONDS.observe(elapsed)
+        metrics.SCAN_SYMBOLS.set(len(symbols))
+        if elapsed > 0:
+            metrics.SCAN_SYMBOLS_PER_SECOND.set(len(symbols) / elapsed)
+        if self.interval:
+            metrics.SCAN_INTERVAL_RATIO.set(elapsed / self.interval)
+
+        logger.info(f"스캔 완료: {signal_count}개 시그널 발견 ({elapsed:.1f}초)")
+        return signal_count
 
-        for i, symbol in enumerate(self.symbols, 1):
-            logger.debug(f"[{i}/{len(self.symbols)}] {symbol} 분석 중...")
+    def _prescreen_symbols(self, symbols: List[str]) -> List[str]:
+        """
+        전체 현재가로 시그널이 가능한 심볼만 남기기
 
-            if self.analyze_symbol(symbol):
-                signal_count += 1
+        Args:
+            symbols: 스캔 대상 심볼 리스트
 
-            # API 레이트 리밋 방지
-            time.sleep(0.1)
+        Returns:
+            캔들을 조회할 심볼 리스트 (순서 유지)
+        """
+        with metrics.STAGE_SECONDS.time(stage='prescreen'):
+            prices = self.api.get_all_prices()
+            if not prices:
+                return symbols
+
+            interval_ms = INTERVAL_MS[self.timeframe]
+            now_ms = self.scheduler.clock.now_ms() if self.scheduler is not None else time.time() * 1000
+            live_open_ms = int(now_ms // interval_ms * interval_ms)
+
+            survivors = []
+            for symbol in symbols:
+                df = self.api.kline_cache.get(symbol, self.timeframe)
+                price = prices.get(symbol)
+                if self.prescreen.can_signal(df, price, live_open_ms):
+                    survivors.append(symbol)
+                    continue
+
+                # 제외한 심볼도 스캔 순서/우선순위용 거리는 추정치로 갱신
+                distance = self.prescreen.estimate_distance(df, price, live_open_ms)
+                if distance is not None:
+                    self.sma_distance[symbol] = distance
+
+        excluded = len(symbols) - len(survivors)
+        metrics.SCAN_PRESCREENED_SYMBOLS.set(excluded)
+        logger.info(f"사전 선별: {len(survivors)}개 조회, {excluded}개 제외 (현재가 기준 시그널 불가)")
+        return survivors
+
+    def _observe_close_lag(self, event: str):
+        """캔들 마감 이후 경과 시간 기록 (캔들 마감 정렬 스캔일 때만)"""
+        if self.scheduler is not None and self._candle_close_ms is not None:
+            metrics.CANDLE_CLOSE_LAG_SECONDS.observe(self.scheduler.lag(self._candle_close_ms), event=event)
+
+    def _scan_sequential(self, symbols: List[str], frames: Optional[Dict[str, pd.DataFrame]]) -> int:
+        """
+        심볼을 순서대로 분석
+
+        Args:
+            symbols: 스캔 순서대로 정렬한 심볼 리스트
+            frames: 미리 수집한 심볼별 캔들 (None이면 심볼마다 조회)
+
+        Returns:
+            시그널이 발생한 심볼 수
+        """
+        signal_count = 0
+        for i, symbol in enumerate(symbols, 1):
+            logger.debug(f"[{i}/{len(symbols)}] {symbol} 분석 중...")
 
-        logger.info(f"스캔 완료: {signal_count}개 시그널 발견")
+            # 레이트 리밋은 BinanceAPI 공용 리미터가 처리
+            df = frames.get(symbol, pd.DataFrame()) if frames is not None else None
+            if self.analyze_symbol(symbol, df=df):
+                signal_count += 1
         return signal_count
 
+    def _scan_parallel(self, symbols: List[str], frames: Optional[Dict[str, pd.DataFrame]]) -> int:
+        """
+        프로세스 풀로 심볼 분석 (쿨다운 확인/기록과 알림은 여기서 처리)
+
+        Args:
+            symbols: 스캔 순서대로 정렬한 심볼 리스트
+            frames: 미리 수집한 심볼별 캔들 (None이면 여기서 조회)
+
+        Returns:
+            시그널이 발생한 심볼 수
+        """
+        if frames is None:
+            frames = {}
+            with metrics.STAGE_SECONDS.time(stage='fetch'):
+                for symbol in symbols:
+                    frames[symbol] = self.api.get_klines_cached(symbol, interval=self.timeframe, limit=self.kline_limit)
+
+        with metrics.STAGE_SECONDS.time(stage='analyze.pool'):
+            signals, states = self.analyzer.analyze({symbol: frames.get(symbol) for symbol in symbols})
+        for symbol, state in states.items():
+            if 'distance' in state:
+                self.sma_distance[symbol] = state['distance']
+            if 'momentum' in state:
+                self.momentum_change[symbol] = state['momentum']
+
+        signaled = set()
+        for signal_info in signals:
+            symbol = signal_info['symbol']
+            # 워커는 쿨다운 없이 계산하므로 부모의 저장소로 확인/기록
+            if not self.signal_detector.should_send_alert(symbol, signal_info['signal_type']):
+                continue
+            if not self.signal_detector.record_alert(symbol, signal_info['signal_type']):
+                continue
+            self._publish_signal(signal_info)
+            signaled.add(symbol)
+
+        return len(signaled)
+
+    def _publish_signal(self, signal_info: Dict):
+        """
+        시그널에 거래대금 순위를 붙여 알림 전송
+
+        Args:
+            signal_info: 시그널 정보
+        """
+        # 거래대금 순위 및 거래대금 추가
+        volume_info = self.api.get_volume_rank(signal_info['symbol'])
+        if volume_info:
+            signal_info['volume_rank'] = volume_info['rank']
+            signal_info['quote_volume'] = volume_info['quote_volume']
+
+        metrics.SIGNALS.inc(signal_type=signal_info['signal_type'])
+        self._observe_close_lag('alert')
+        summary = self.signal_detector.get_signal_summary(signal_info)
+        self.notifier.send_signal_alert(signal_info, summary)
+
+    def warm_up(self):
+        """스트리밍 시작 전 REST로 캔들 캐시와 SMA 엔진 채우기"""
+        logger.info(f"{len(self.symbols)}개 심볼 캔들 웜업 중...")
+
+        if self.fetcher is not None:
+            frames = self.fetcher.fetch_all(self.symbols, self.timeframe, self.kline_limit)
+        else:
+            frames = {
+                symbol: self.api.get_klines_cached(symbol, interval=self.timeframe, limit=self.kline_limit)
+                for symbol in self.symbols
+            }
+
+        for symbol, df in frames.items():
+            if not df.empty:
+                self.sma_calculator.update_streaming(
+                    symbol, df, history=self.signal_detector.confirm_candles + 1
+                )
+
+    def on_candle_close(self, symbol: str, kline: Dict) -> bool:
+        """
+        스트림 캔들 마감 처리 (해당 심볼만 분석)
+
+        Args:
+            symbol: 심볼
+            kline: 스트림 kline 딕셔너리 (t, o, h, l, c, v, q, V, Q ...)
+
+        Returns:
+            시그널 발생 여부
+        """
+        values = {
+            'open': kline['o'],
+            'high': kline['h'],
+            'low': kline['l'],
+            'close': kline['c'],
+            'volume': kline['v'],
+            'quote_volume': kline['q'],
+            'taker_buy_base': kline['V'],
+            'taker_buy_quote': kline['Q'],
+        }
+        df = self.api.kline_cache.apply_kline(symbol, self.timeframe, int(kline['t']), values, self.kline_limit)
+
+        if df is None:
+            # 캐시 공백 → REST로 복구
+            logger.info(f"{symbol}: 캔들 공백 REST 복구")
+            df = self.api.get_klines_cached(symbol, interval=self.timeframe, limit=self.kline_limit)
+
+        return self.analyze_symbol(symbol, df=df)
+
+    def repair_gaps(self, symbols: List[str]):
+        """
+        재연결 후 끊긴 동안의 캔들을 REST로 복구
+
+        Args:
+            symbols: 복구할 심볼 리스트
+        """
+        logger.info(f"{len(symbols)}개 심볼 캔들 공백 복구 중...")
+        for symbol in symbols:
+            self.api.get_klines_cached(symbol, interval=self.timeframe, limit=self.kline_limit)
+
+    async def stream_symbols(self, duration: Optional[float] = None) -> bool:
+        """
+        현재 심볼 리스트의 캔들 스트림 구독 및 마감 이벤트 처리
+
+        Args:
+            duration: 구독 시간 (초, None이면 무한)
+
+        Returns:
+            클러스터 구성 변경으로 담당 심볼이 바뀌어 일찍 끝났는지 여부
+        """
+        # 캔들 마감 분석과 재연결 공백 복구가 모두 캔들 캐시/SMA/모멘텀 상태를 바꾸므로
+        # 같은 큐에 넣어 전용 스레드 하나에서 순서대로 처리
+        queue: asyncio.Queue = asyncio.Queue()
+        worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix='stream-worker')
+        loop = asyncio.get_running_loop()
+
+        async def on_close(symbol: str, kline: Dict):
+            queue.put_nowait((self.on_candle_close, (symbol, kline), f"{symbol} 캔들 마감 처리"))
+
+        async def on_reconnect(symbols: List[str]):
+            # 수신을 막지 않도록 큐에만 넣고 바로 반환 (이후 마감 캔들은 복구 뒤에 처리됨)
+            queue.put_nowait((self.repair_gaps, (symbols,), f"{len(symbols)}개 심볼 캔들 공백 복구"))
+
+        async def consume():
+            # 분석은 스트림 수신을 막지 않도록 별도 스레드에서 순차 처리
+            while True:
+                handler, args, label = await queue.get()
+                try:
+                    await loop.run_in_executor(worker, handler, *args)
+                except Exception as e:
+                    logger.error(f"{label} 중 오류: {e}")
+                finally:
+                    queue.task_done()
+
+        stream = KlineStream(self.symbols, self.timeframe, on_close, url=self.stream_url, on_reconnect=on_reconnect)
+        rebalanced = False
+
+        async def watch_cluster():
+            # 죽은 인스턴스의 심볼을 심볼 리스트 갱신까지 기다리지 않고 임대 만료 직후 넘겨받도록
+            # 임대 갱신 주기마다 구성 확인 (담당 심볼 변경도 캐시/SMA 상태를 바꾸므로 같은 스레드에서)
+            nonlocal rebalanced
+            while True:
+                await asyncio.sleep(self.cluster.lease_ttl / 3)
+                if await loop.run_in_executor(worker, self.rebalance):
+                    logger.info("클러스터 구성 변경, 담당 심볼로 다시 구독")
+                    rebalanced = True
+                    stream.stop()
+                    return
+
+        consumer = asyncio.ensure_future(consume())
+        watcher = asyncio.ensure_future(watch_cluster()) if self.cluster is not None else None
+
+        try:
+            await stream.run(duration)
+            await queue.join()
+        finally:
+            if watcher is not None:
+                watcher.cancel()
+            consumer.cancel()
+            worker.shutdown(wait=True)
+
+        return rebalanced
+
+    def run_streaming(self):
+        """스트리밍 모드 루프 (심볼 리스트 갱신 주기 또는 클러스터 재분배 시 재구독)"""
+        refresh_at = 0.0
+        while True:
+            now = time.monotonic()
+            if now >= refresh_at:
+                self.update_symbol_list()
+                refresh_at = now + self.stream_symbol_refresh
+            self.warm_up()
+
+            remaining = max(0.0, refresh_at - time.monotonic())
+            logger.info(f"캔들 스트림 구독 시작 ({remaining:.0f}초 후 심볼 리스트 갱신)")
+            asyncio.run(self.stream_symbols(remaining))
+
     def run(self):
         """메인 모니터링 루프"""
         logger.info("=" * 60)
@@ -233,31 +723,41 @@ class SMAMonitor:
 
         self.notifier.send_system_message("모니터링 시작!", "INFO")
 
-        # 초기 심볼 리스트 업데이트
-        self.update_symbol_list()
+        try:
+            self.join_cluster()
 
-        iteration = 0
+            if self.mode == 'STREAMING':
+                self.run_streaming()
+                return
+
+            # 초기 심볼 리스트 업데이트
+            self.update_symbol_list()
+
+            iteration = 0
+            candle_close_ms = None
 
-        try:
             while True:
                 iteration += 1
                 logger.info(f"\n[반복 #{iteration}] 스캔 시작...")
 
-                # 주기적으로 심볼 리스트 업데이트 (매 10회)
-                if iteration % 10 == 0:
-                    self.update_symbol_list()
-
                 # 전체 스캔
-                signal_count = self.scan_all_symbols()
+                signal_count = self.scan_all_symbols(candle_close_ms=candle_close_ms)
 
                 if signal_count > 0:
                     logger.info(f"✓ {signal_count}개 시그널 발견 및 알림 전송 완료")
                 else:
                     logger.info("시그널 없음")
 
-                # 대기
-                logger.info(f"{self.interval}초 대기 중...")
-                time.sleep(self.interval)
+                # 주기적으로 심볼 리스트 업데이트 (매 10회, 캔들 마감 직후 스캔이 늦어지지 않도록 스캔 뒤에)
+                if iteration % 10 == 0:
+                    self.update_symbol_list()
+
+                # 대기 (캔들 마감 정렬 모드는 직전 스캔 시간과 무관하게 다음 마감 직후에 시작)
+                if self.scheduler is not None:
+                    candle_close_ms = self.scheduler.wait()
+                else:
+                    logger.info(f"{self.interval}초 대기 중...")
+                    time.sleep(self.interval)
 
         except KeyboardInterrupt:
             logger.info("\n사용자에 의해 중단됨")
@@ -266,6 +766,24 @@ class SMAMonitor:
             logger.error(f"오류 발생: {e}")
             self.notifier.send_system_message(f"오류 발생: {e}", "ERROR")
             raise
+        finally:
+            self.close()
+
+    def close(self):
+        """리소스 정리 (여러 번 호출해도 한 번만 정리)"""
+        if self._closed:
+            return
+        self._closed = True
+
+        if self.fetcher is not None:
+            self.fetcher.close()
+        if self.analyzer is not None:
+            self.analyzer.close()
+        if self.cluster is not None:
+            self.cluster.close()
+        # 대기 중인 알림 전송 완료 후 종료
+        self.notifier.close()
+        self.signal_detector.alert_store.close()
 
     def test_single_symbol(self, symbol: str):
         """
@@ -286,10 +804,21 @@ class SMAMonitor:
         print("모니터링 상태")
         print("=" * 60)
         print(f"모니터링 심볼 수: {len(self.symbols)}")
-        print(f"체크 주기: {self.interval}초")
+        if self.scheduler is not None:
+            print(f"체크 주기: 캔들 마감 후 {self.scheduler.settle_ms / 1000:.1f}초")
+        else:
+            print(f"체크 주기: {self.interval}초")
         print(f"시간 프레임: {self.timeframe}")
         print(f"SMA 기간: {self.sma_calculator.periods}")
         print(f"돌파 기준: SMA{self.signal_detector.target_sma}")
         print(f"쿨다운: {self.signal_detector.cooldown}초")
-        print(f"알림 이력: {len(self.signal_detector.last_alert_time)}개")
+        print(f"쿨다운 중인 알림: {len(self.signal_detector.alert_store)}개")
+        if self.priority is not None:
+            counts = self.priority.tier_counts(self.symbols, self.sma_distance, self.momentum_change)
+            print("우선순위 스캔: " + ", ".join(f"{every}회마다 {count}개" for every, count in counts.items()))
+        if self.cluster is not None and self.cluster.joined:
+            print(f"클러스터: {self.cluster.instance_id} (인스턴스 {len(self.cluster.members)}개, "
+                  f"담당 {len(self.symbols)}/{len(self.universe)}개 심볼)")
+        elif self.cluster is not None:
+            print(f"클러스터: 미참여 (상시 실행 시 {self.cluster.instance_id}로 참여, 위 심볼은 분할 전 전체)")
         print("=" * 60 + "\n")
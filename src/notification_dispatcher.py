@@ -0,0 +1,157 @@
+"""
+알림 전송 디스패처 모듈
+채널별 백그라운드 큐/스레드로 알림을 전송해 스캔 루프가 네트워크 전송을 기다리지 않도록 함
+"""
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+import logging
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+# 작업 종료 표시
+_STOP = object()
+
+
+class NotificationDispatcher:
+    """채널별 백그라운드 알림 전송기 (채널 간 병렬, 채널 내 순서 유지)"""
+
+    def __init__(self, send: Callable[[str, Tuple], bool], channels: List[str], queue_size: int = 1000,
+                 send_batch: Optional[Callable[[str, List[Tuple]], bool]] = None,
+                 batch_sizes: Optional[Dict[str, int]] = None):
+        """
+        초기화
+
+        Args:
+            send: 실제 전송 함수 (채널, 전송 인자) → 성공 여부
+            channels: 전송 채널 리스트 (telegram, discord, email ...)
+            queue_size: 채널별 대기 알림 최대 수 (초과 시 버림)
+            send_batch: 묶음 전송 함수 (채널, 전송 인자 리스트) → 성공 여부
+            batch_sizes: 묶음 전송할 채널별 최대 묶음 크기 (대기열에 쌓인 만큼 한 번에 전송)
+        """
+        self._send = send
+        self._send_batch = send_batch
+        self._batch_sizes = batch_sizes or {}
+        self._queues: Dict[str, queue.Queue] = {channel: queue.Queue(maxsize=queue_size) for channel in channels}
+        self._threads: Dict[str, threading.Thread] = {}
+        self._closed = False
+
+        # 채널별 마지막 전송 지연 (큐 대기 + 전송, 초)
+        self.last_latency: Dict[str, float] = {}
+
+        for channel in channels:
+            thread = threading.Thread(target=self._worker, args=(channel,), name=f"notify-{channel}", daemon=True)
+            thread.start()
+            self._threads[channel] = thread
+
+        logger.info(f"알림 디스패처 시작: {', '.join(channels)} (채널별 대기 최대 {queue_size}개)")
+
+    @property
+    def channels(self) -> List[str]:
+        return list(self._queues)
+
+    def submit(self, messages: Dict[str, Tuple]):
+        """
+        알림 전송 예약 (즉시 반환)
+
+        Args:
+            messages: {채널: 전송 인자}
+        """
+        enqueued_at = time.perf_counter()
+        for channel, args in messages.items():
+            channel_queue = self._queues.get(channel)
+            if channel_queue is None:
+                continue
+            try:
+                channel_queue.put_nowait((enqueued_at, args))
+            except queue.Full:
+                metrics.NOTIFY_DROPPED.inc(channel=channel)
+                logger.error(f"{channel} 알림 대기열이 가득 차 알림을 버림")
+
+    def _worker(self, channel: str):
+        """채널 전송 스레드"""
+        channel_queue = self._queues[channel]
+        batch_size = self._batch_sizes.get(channel, 1) if self._send_batch is not None else 1
+
+        while True:
+            items = [channel_queue.get()]
+
+            # 묶음 전송 채널은 이미 쌓인 알림을 함께 꺼냄
+            while len(items) < batch_size and items[-1] is not _STOP:
+                try:
+                    items.append(channel_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            jobs = [item for item in items if item is not _STOP]
+            try:
+                if jobs:
+                    self._process(channel, jobs)
+            finally:
+                for _ in items:
+                    channel_queue.task_done()
+
+            if items[-1] is _STOP:
+                return
+
+    def _process(self, channel: str, jobs: List[Tuple[float, Tuple]]):
+        """알림 전송 및 전달 시간 기록"""
+        try:
+            if len(jobs) > 1:
+                success = self._send_batch(channel, [args for _, args in jobs])
+            else:
+                success = self._send(channel, jobs[0][1])
+        except Exception as e:
+            success = False
+            logger.error(f"{channel} 알림 전송 중 오류: {e}")
+
+        done = time.perf_counter()
+        for enqueued_at, _ in jobs:
+            latency = done - enqueued_at
+            self.last_latency[channel] = latency
+            metrics.NOTIFY_DELIVERY_SECONDS.observe(latency, channel=channel)
+            if not success:
+                metrics.NOTIFY_FAILED.inc(channel=channel)
+
+        logger.debug(f"{channel} 알림 {len(jobs)}건 처리: {'성공' if success else '실패'} (대기 포함 {done - jobs[0][0]:.2f}초)")
+
+    def pending(self) -> Dict[str, int]:
+        """채널별 미전송 알림 수"""
+        return {channel: q.unfinished_tasks for channel, q in self._queues.items()}
+
+    def flush(self, timeout: float = 30.0) -> bool:
+        """
+        대기 중인 알림 전송 완료까지 대기
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            모두 전송했으면 True
+        """
+        deadline = time.monotonic() + timeout
+        while any(self.pending().values()):
+            if time.monotonic() >= deadline:
+                logger.warning(f"알림 전송 대기 시간 초과: 남은 알림 {self.pending()}")
+                return False
+            time.sleep(0.05)
+        return True
+
+    def close(self, timeout: float = 30.0):
+        """
+        남은 알림 전송 후 스레드 종료
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        self.flush(timeout)
+        for channel, channel_queue in self._queues.items():
+            channel_queue.put(_STOP)
+        for thread in self._threads.values():
+            thread.join(timeout=1.0)
@@ -3,12 +3,88 @@
 콘솔, 텔레그램, 디스코드, 이메일 알림 지원
 """
 import logging
-from typing import Dict, List
+import threading
+from typing import Dict, List, Optional, Tuple
 import requests
 from datetime import datetime
+from email.mime.text import MIMEText
+from email.mime.multipart import MIMEMultipart
+from . import metrics
+from .notification_dispatcher import NotificationDispatcher
+from .rate_limiter import WeightRateLimiter
+from .smtp_session import SMTPSession
 
 logger = logging.getLogger(__name__)
 
+# 텔레그램 메시지 최대 길이
+TELEGRAM_MESSAGE_LIMIT = 4096
+
+# 요약 메시지 머리글 여유 길이
+DIGEST_HEADER_RESERVE = 64
+
+
+def split_message(message: str, limit: int = TELEGRAM_MESSAGE_LIMIT) -> List[str]:
+    """
+    긴 메시지를 줄 단위로 limit 이하 조각으로 분할 (한 줄이 limit보다 길면 강제 분할)
+
+    Args:
+        message: 메시지
+        limit: 조각 최대 길이
+
+    Returns:
+        메시지 조각 리스트
+    """
+    if len(message) <= limit:
+        return [message]
+
+    parts = []
+    current = ''
+    for line in message.split('\n'):
+        while len(line) > limit:
+            if current:
+                parts.append(current)
+                current = ''
+            parts.append(line[:limit])
+            line = line[limit:]
+
+        if current and len(current) + 1 + len(line) > limit:
+            parts.append(current)
+            current = line
+        else:
+            current = f"{current}\n{line}" if current else line
+
+    if current:
+        parts.append(current)
+    return parts
+
+
+def pack_messages(messages: List[str], limit: int = TELEGRAM_MESSAGE_LIMIT, separator: str = '\n\n') -> List[str]:
+    """
+    여러 메시지를 limit 이하 묶음으로 합치기 (순서 유지)
+
+    Args:
+        messages: 메시지 리스트
+        limit: 묶음 최대 길이
+        separator: 메시지 구분자
+
+    Returns:
+        묶음 메시지 리스트
+    """
+    chunks = []
+    current = ''
+    for message in messages:
+        for part in split_message(message, limit):
+            if current and len(current) + len(separator) + len(part) <= limit:
+                current += separator + part
+            else:
+                if current:
+                    chunks.append(current)
+                current = part
+
+    if current:
+        chunks.append(current)
+    return chunks
+
 
 class Notifier:
     """알림 전송기"""
@@ -39,6 +115,17 @@ class Notifier:
                 logger.warning("텔레그램 설정이 불완전합니다. 텔레그램 알림이 비활성화됩니다.")
                 self.telegram_enabled = False
 
+            # 스캔 단위 요약 전송, 채팅별 전송 속도 제한 (429 시 retry_after만큼 대기 후 재시도)
+            self.telegram_digest = telegram_config.get('DIGEST', False)
+            self.telegram_max_retries = telegram_config.get('MAX_RETRIES', 3)
+            self.telegram_limiter = WeightRateLimiter(
+                telegram_config.get('MESSAGES_PER_MINUTE', 20), name='텔레그램', unit='메시지'
+            )
+
+        # 스캔 중 모은 텔레그램 메시지 (None이면 바로 전송)
+        self._telegram_batch: Optional[List[str]] = None
+        self._batch_lock = threading.Lock()
+
         # 디스코드 설정
         if self.discord_enabled:
             discord_config = config.get('DISCORD', {})
@@ -48,9 +135,52 @@ class Notifier:
                 logger.warning("디스코드 웹훅 URL이 없습니다. 디스코드 알림이 비활성화됩니다.")
                 self.discord_enabled = False
 
+        # 이메일 설정 (SMTP 세션은 알림 간에 재사용)
+        self.smtp: Optional[SMTPSession] = None
+        if self.email_enabled:
+            email_config = config.get('EMAIL', {})
+            smtp_server = email_config.get('SMTP_SERVER')
+            smtp_port = email_config.get('SMTP_PORT')
+            self.email_sender = email_config.get('SENDER_EMAIL')
+            self.email_receiver = email_config.get('RECEIVER_EMAIL')
+            self.email_batch_size = email_config.get('BATCH_SIZE', 20)
+
+            if not all([smtp_server, smtp_port, self.email_sender, self.email_receiver]):
+                logger.warning("이메일 설정이 불완전합니다. 이메일 알림이 비활성화됩니다.")
+                self.email_enabled = False
+            else:
+                self.smtp = SMTPSession(
+                    smtp_server, smtp_port,
+                    username=self.email_sender,
+                    password=email_config.get('SENDER_PASSWORD'),
+                    starttls=email_config.get('STARTTLS', True),
+                    timeout=email_config.get('TIMEOUT', 30),
+                    idle_timeout=email_config.get('IDLE_TIMEOUT', 240),
+                )
+
         enabled_methods = [m for m, enabled in self.methods.items() if enabled]
         logger.info(f"알림 방법 활성화: {', '.join(enabled_methods)}")
 
+        # 채널별 HTTP 세션 (연결 재사용)
+        self._sessions = {'telegram': requests.Session(), 'discord': requests.Session()}
+
+        # 백그라운드 전송 (스캔 루프를 막지 않음)
+        self.dispatcher = None
+        dispatcher_config = config.get('DISPATCHER', {})
+        if dispatcher_config.get('ENABLED', True):
+            channels = [channel for channel, enabled in (
+                ('telegram', self.telegram_enabled),
+                ('discord', self.discord_enabled),
+                ('email', self.email_enabled),
+            ) if enabled]
+            if channels:
+                self.dispatcher = NotificationDispatcher(
+                    self._send_channel, channels,
+                    queue_size=dispatcher_config.get('QUEUE_SIZE', 1000),
+                    send_batch=self._send_channel_batch,
+                    batch_sizes={'email': self.email_batch_size} if self.email_enabled else None,
+                )
+
     def send_console(self, message: str):
         """콘솔에 메시지 출력"""
         if not self.console_enabled:
@@ -60,10 +190,10 @@ class Notifier:
         print(message)
         print("=" * 60 + "\n")
 
-    def send_telegram(self, message: str):
+    def send_telegram(self, message: str) -> bool:
         """텔레그램으로 메시지 전송"""
         if not self.telegram_enabled:
-            return
+            return False
 
         try:
             url = f"https://api.telegram.org/bot{self.telegram_bot_token}/sendMessage"
@@ -73,84 +203,204 @@ class Notifier:
                 'parse_mode': 'HTML'
             }
 
-            response = requests.post(url, data=data, timeout=10)
-            response.raise_for_status()
+            for attempt in range(self.telegram_max_retries + 1):
+                self.telegram_limiter.acquire(1)
+                response = self._sessions['telegram'].post(url, data=data, timeout=10)
 
-            logger.info("텔레그램 알림 전송 성공")
+                if response.status_code == 429:
+                    retry_after = self._telegram_retry_after(response)
+                    logger.warning(f"텔레그램 전송 제한 (429), {retry_after:.0f}초 후 재시도 ({attempt + 1}/{self.telegram_max_retries})")
+                    self.telegram_limiter.block(retry_after)
+                    continue
+
+                response.raise_for_status()
+
+                logger.info("텔레그램 알림 전송 성공")
+                return True
+
+            logger.error(f"텔레그램 알림 전송 실패: 재시도 {self.telegram_max_retries}회 초과")
+            return False
 
         except Exception as e:
             logger.error(f"텔레그램 알림 전송 실패: {e}")
+            return False
 
-    def send_discord(self, message: str):
+    @staticmethod
+    def _telegram_retry_after(response: requests.Response) -> float:
+        """429 응답의 재시도 대기 시간 (parameters.retry_after, 없으면 Retry-After 헤더)"""
+        try:
+            return float(response.json()['parameters']['retry_after'])
+        except (ValueError, KeyError, TypeError):
+            pass
+
+        try:
+            return float(response.headers.get('Retry-After', 5))
+        except (TypeError, ValueError):
+            return 5.0
+
+    def send_discord(self, message: str) -> bool:
         """디스코드로 메시지 전송"""
         if not self.discord_enabled:
-            return
+            return False
 
         try:
             data = {
                 'content': message
             }
 
-            response = requests.post(self.discord_webhook_url, json=data, timeout=10)
+            response = self._sessions['discord'].post(self.discord_webhook_url, json=data, timeout=10)
             response.raise_for_status()
 
             logger.info("디스코드 알림 전송 성공")
+            return True
 
         except Exception as e:
             logger.error(f"디스코드 알림 전송 실패: {e}")
+            return False
 
-    def send_email(self, subject: str, message: str):
+    def send_email(self, subject: str, message: str) -> bool:
         """이메일로 메시지 전송"""
-        if not self.email_enabled:
-            return
+        return self.send_emails([(subject, message)])
 
-        try:
-            import smtplib
-            from email.mime.text import MIMEText
-            from email.mime.multipart import MIMEMultipart
+    def send_emails(self, emails: List[Tuple[str, str]]) -> bool:
+        """
+        이메일 여러 통을 한 SMTP 연결로 전송
 
-            email_config = self.config.get('EMAIL', {})
-            smtp_server = email_config.get('SMTP_SERVER')
-            smtp_port = email_config.get('SMTP_PORT')
-            sender = email_config.get('SENDER_EMAIL')
-            password = email_config.get('SENDER_PASSWORD')
-            receiver = email_config.get('RECEIVER_EMAIL')
+        Args:
+            emails: (제목, 본문) 리스트
 
-            if not all([smtp_server, smtp_port, sender, password, receiver]):
-                logger.warning("이메일 설정이 불완전합니다.")
-                return
+        Returns:
+            모두 전송했으면 True
+        """
+        if not self.email_enabled:
+            return False
 
-            msg = MIMEMultipart()
-            msg['From'] = sender
-            msg['To'] = receiver
-            msg['Subject'] = subject
+        try:
+            messages = []
+            for subject, message in emails:
+                msg = MIMEMultipart()
+                msg['From'] = self.email_sender
+                msg['To'] = self.email_receiver
+                msg['Subject'] = subject
 
-            msg.attach(MIMEText(message, 'plain'))
+                msg.attach(MIMEText(message, 'plain'))
+                messages.append(msg)
 
-            with smtplib.SMTP(smtp_server, smtp_port) as server:
-                server.starttls()
-                server.login(sender, password)
-                server.send_message(msg)
+            sent = self.smtp.send(messages)
 
-            logger.info("이메일 알림 전송 성공")
+            logger.info(f"이메일 알림 전송 성공 ({sent}통)")
+            return True
 
         except Exception as e:
             logger.error(f"이메일 알림 전송 실패: {e}")
+            return False
+
+    def _send_channel(self, channel: str, args: Tuple) -> bool:
+        """채널 하나로 전송 (채널별 전송 시간 기록)"""
+        with metrics.STAGE_SECONDS.time(stage=f'notify.{channel}'):
+            return getattr(self, f'send_{channel}')(*args)
+
+    def _send_channel_batch(self, channel: str, args_list: List[Tuple]) -> bool:
+        """채널 하나로 여러 알림 전송 (이메일은 한 연결로 묶어서 전송)"""
+        if channel == 'email':
+            with metrics.STAGE_SECONDS.time(stage='notify.email'):
+                return self.send_emails(args_list)
+
+        results = [self._send_channel(channel, args) for args in args_list]
+        return all(results)
+
+    def _deliver(self, messages: Dict[str, Tuple]):
+        """
+        채널별 메시지 전송 (디스패처가 있으면 대기열에 넣고 즉시 반환)
+
+        Args:
+            messages: {채널: 전송 인자}
+        """
+        if self.dispatcher is not None:
+            self.dispatcher.submit(messages)
+            return
+
+        for channel, args in messages.items():
+            self._send_channel(channel, args)
+
+    def begin_batch(self):
+        """스캔 시작: 텔레그램 요약 전송이 켜져 있으면 이후 시그널 메시지를 모음"""
+        if self.telegram_enabled and self.telegram_digest:
+            with self._batch_lock:
+                self._telegram_batch = []
+
+    def end_batch(self):
+        """스캔 종료: 모은 텔레그램 메시지를 4096자 이하 요약 메시지로 묶어 전송"""
+        with self._batch_lock:
+            batch, self._telegram_batch = self._telegram_batch, None
+
+        if not batch:
+            return
+
+        if len(batch) == 1:
+            self._deliver({'telegram': (batch[0],)})
+            return
+
+        chunks = pack_messages(batch, TELEGRAM_MESSAGE_LIMIT - DIGEST_HEADER_RESERVE)
+        for i, chunk in enumerate(chunks, 1):
+            header = f"<b>📋 시그널 {len(batch)}건</b>"
+            if len(chunks) > 1:
+                header += f" ({i}/{len(chunks)})"
+            self._deliver({'telegram': (f"{header}\n\n{chunk}",)})
+
+        logger.info(f"텔레그램 요약 전송: 시그널 {len(batch)}건 → 메시지 {len(chunks)}개")
+
+    def _add_to_batch(self, message: str) -> bool:
+        """요약 전송 중이면 텔레그램 메시지를 모으고 True 반환"""
+        with self._batch_lock:
+            if self._telegram_batch is None:
+                return False
+            self._telegram_batch.append(message)
+            return True
+
+    def flush(self, timeout: float = 30.0) -> bool:
+        """
+        대기 중인 알림 전송 완료까지 대기
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            모두 전송했으면 True
+        """
+        if self.dispatcher is None:
+            return True
+        return self.dispatcher.flush(timeout)
+
+    def close(self, timeout: float = 30.0):
+        """남은 알림 전송 후 정리"""
+        if self.dispatcher is not None:
+            self.dispatcher.close(timeout)
+        for session in self._sessions.values():
+            session.close()
+        if self.smtp is not None:
+            self.smtp.close()
 
     def send_signal_alert(self, signal_info: Dict, summary: str):
         """
-        시그널 알림 전송
+        시그널 알림 전송 (채널 전송은 디스패처 대기열에 넣고 즉시 반환)
 
         Args:
             signal_info: 시그널 정보
             summary: 시그널 요약 메시지
         """
+        with metrics.STAGE_SECONDS.time(stage='notify'):
+            self._send_signal_alert(signal_info, summary)
+
+    def _send_signal_alert(self, signal_info: Dict, summary: str):
         symbol = signal_info['symbol']
         signal_type = signal_info.get('signal_type', 'UNKNOWN')
 
         # 콘솔 출력
         self.send_console(summary)
 
+        messages: Dict[str, Tuple] = {}
+
         # 텔레그램 (HTML 포맷)
         if self.telegram_enabled:
             # 모멘텀 시그널
@@ -222,11 +472,12 @@ class Notifier:
 
                 telegram_msg += f"\n<b>시간:</b> {time_str}\n"
 
-            self.send_telegram(telegram_msg.strip())
+            if not self._add_to_batch(telegram_msg.strip()):
+                messages['telegram'] = (telegram_msg.strip(),)
 
         # 디스코드
         if self.discord_enabled:
-            self.send_discord(summary)
+            messages['discord'] = (summary,)
 
         # 이메일
         if self.email_enabled:
@@ -235,7 +486,9 @@ class Notifier:
                 subject = f"[Binance Alert] {symbol} {timeframe} 강력한 모멘텀!"
             else:
                 subject = f"[Binance Alert] {symbol} SMA480 근처!"
-            self.send_email(subject, summary)
+            messages['email'] = (subject, summary)
+
+        self._deliver(messages)
 
     def send_system_message(self, message: str, level: str = "INFO"):
         """
@@ -253,7 +506,7 @@ class Notifier:
 
         # 에러는 텔레그램으로도 전송
         if level == "ERROR" and self.telegram_enabled:
-            self.send_telegram(f"⚠️ <b>시스템 에러</b>\n\n{message}")
+            self._deliver({'telegram': (f"⚠️ <b>시스템 에러</b>\n\n{message}",)})
 
     def _format_sma_values_html(self, sma_values: Dict[int, float], target_sma_period: int = 480) -> str:
         """SMA 값들을 HTML 포맷으로 변환"""
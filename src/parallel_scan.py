@@ -0,0 +1,228 @@
+"""
+프로세스 풀 분석 모듈
+심볼을 여러 프로세스에 나눠 SMA/시그널 계산 (캔들 배열은 공유 메모리로 전달)
+쿨다운 확인/기록과 알림은 부모 프로세스에서 처리
+"""
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Tuple
+import numpy as np
+import pandas as pd
+from .candle_view import column_view
+from .kline_cache import KLINE_COLUMNS
+from .momentum_engine import MomentumEngine
+from .sma_calculator import SMACalculator
+from .signal_detector import SignalDetector
+
+logger = logging.getLogger(__name__)
+
+# 워커 프로세스별 분석기 (initializer에서 생성)
+_worker_state: Dict = {}
+
+
+def _init_worker(options: Dict, log_level: int):
+    """워커 프로세스 초기화 (분석기 생성)"""
+    logging.basicConfig(level=log_level, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    _worker_state['sma'] = SMACalculator(periods=options['periods'])
+    # 쿨다운은 부모가 확인하므로 워커에서는 항상 통과
+    _worker_state['detector'] = SignalDetector(
+        target_sma=options['target_sma'],
+        confirm_candles=options['confirm_candles'],
+        cooldown=0,
+        interval=options['interval'],
+    )
+    _worker_state['momentum'] = MomentumEngine(options['momentum_windows'])
+    _worker_state['options'] = options
+
+
+def evaluate_symbol(symbol: str, df: pd.DataFrame, sma_calculator: SMACalculator,
+                    signal_detector: SignalDetector, momentum_engine: MomentumEngine,
+                    options: Dict) -> Tuple[List[Dict], Dict[str, float]]:
+    """
+    단일 심볼 시그널 계산 (쿨다운/알림 제외)
+
+    Args:
+        symbol: 심볼
+        df: 캔들 데이터프레임
+        sma_calculator: SMA 계산기
+        signal_detector: 시그널 감지기
+        momentum_engine: 모멘텀 엔진 (상태 없이 구간 계산)
+        options: 분석 옵션 (breakout_type, momentum_enabled)
+
+    Returns:
+        (시그널 정보 리스트, 스캔 우선순위용 상태 {'distance': target SMA와 거리(%), 'momentum': 모멘텀 구간 중 최대 상승률(%)})
+    """
+    signals = []
+    state = {}
+    if df.empty:
+        return signals, state
+
+    # 마지막 캔들의 SMA만 계산 (종가 뷰 사용, 데이터프레임 복사 없음)
+    sma_values = sma_calculator.latest_sma_values(df)
+
+    if sma_values:
+        actual_target_sma = sma_calculator.get_available_target_sma(sma_values)
+        if actual_target_sma != 0:
+            reverse_aligned, reverse_type = sma_calculator.check_reverse_alignment_flexible(sma_values, actual_target_sma)
+            target_sma_value = sma_values.get(actual_target_sma)
+            if target_sma_value:
+                state['distance'] = abs(float(column_view(df, 'close')[-1]) / target_sma_value - 1) * 100
+            signal_info = signal_detector.analyze_signal(
+                symbol=symbol,
+                df=df,
+                sma_values=sma_values,
+                reverse_aligned=reverse_aligned,
+                reverse_type=reverse_type,
+                actual_target_sma=actual_target_sma,
+                breakout_type=options['breakout_type']
+            )
+            if signal_info:
+                signals.append(signal_info)
+
+    # 설정된 모든 모멘텀 구간 (거래대금 누적합 1회)
+    readings = momentum_engine.evaluate(df)
+    if readings:
+        state['momentum'] = max(reading.price_change_pct for reading in readings)
+
+    if options['momentum_enabled'] and readings:
+        signals.extend(signal_detector.analyze_momentum_readings(
+            symbol, readings, float(column_view(df, 'close')[-1]), df.index[-1]
+        ))
+
+    return signals, state
+
+
+def _analyze_shard(shm_name: str, total_rows: int,
+                   shard: List[Tuple[str, int, int]]) -> Tuple[List[Dict], Dict[str, Dict[str, float]], float]:
+    """
+    워커 작업: 공유 메모리의 캔들 배열로 심볼 묶음 분석
+
+    Args:
+        shm_name: 공유 메모리 이름
+        total_rows: 전체 캔들 행 수
+        shard: (심볼, 시작 행, 끝 행) 리스트
+
+    Returns:
+        (시그널 정보 리스트, {심볼: 스캔 우선순위용 상태}, 워커 CPU 시간(초))
+    """
+    started = os.times()
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        timestamps, values = _views(shm, total_rows)
+        signals = []
+        states = {}
+        for symbol, start, end in shard:
+            # 공유 메모리를 닫기 전에 참조가 남지 않도록 심볼 단위로 복사
+            index = pd.DatetimeIndex(timestamps[start:end].astype('datetime64[ms]'), name='timestamp')
+            df = pd.DataFrame(values[start:end].copy(), columns=KLINE_COLUMNS, index=index, copy=False)
+            try:
+                symbol_signals, states[symbol] = evaluate_symbol(
+                    symbol, df, _worker_state['sma'], _worker_state['detector'], _worker_state['momentum'],
+                    _worker_state['options']
+                )
+                signals.extend(symbol_signals)
+            except Exception as e:
+                logger.error(f"{symbol} 분석 중 오류: {e}")
+        del timestamps, values
+    finally:
+        shm.close()
+
+    finished = os.times()
+    return signals, states, (finished.user - started.user) + (finished.system - started.system)
+
+
+def _views(shm: shared_memory.SharedMemory, total_rows: int) -> Tuple[np.ndarray, np.ndarray]:
+    """공유 메모리 → (시각 배열, 값 배열) 뷰"""
+    timestamps = np.ndarray((total_rows,), dtype=np.int64, buffer=shm.buf)
+    values = np.ndarray((total_rows, len(KLINE_COLUMNS)), dtype=np.float64,
+                        buffer=shm.buf, offset=total_rows * 8)
+    return timestamps, values
+
+
+class ParallelAnalyzer:
+    """심볼 분석 프로세스 풀"""
+
+    def __init__(self, options: Dict, workers: int = 0):
+        """
+        초기화
+
+        Args:
+            options: 분석 옵션 (periods, target_sma, confirm_candles, interval, breakout_type,
+                     momentum_enabled, momentum_windows)
+            workers: 프로세스 수 (0이면 CPU 코어 수)
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.options = options
+
+        # 부모의 스레드(알림 디스패처 등)를 복제하지 않도록 spawn 사용
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(options, logging.getLogger().getEffectiveLevel()),
+        )
+
+        # 마지막 분석의 워커 CPU 시간 합계 (초)
+        self.last_cpu_seconds = 0.0
+
+        logger.info(f"분석 프로세스 풀 시작: {self.workers}개 프로세스")
+
+    def analyze(self, frames: Dict[str, pd.DataFrame]) -> Tuple[List[Dict], Dict[str, Dict[str, float]]]:
+        """
+        심볼별 캔들을 공유 메모리에 올리고 프로세스별로 나눠 분석
+
+        Args:
+            frames: {심볼: 캔들 데이터프레임}
+
+        Returns:
+            (시그널 정보 리스트 (심볼 순서대로, 쿨다운 미적용), {심볼: 스캔 우선순위용 상태})
+        """
+        symbols = [symbol for symbol, df in frames.items() if df is not None and not df.empty]
+        if not symbols:
+            return [], {}
+
+        total_rows = sum(len(frames[symbol]) for symbol in symbols)
+        size = total_rows * 8 * (1 + len(KLINE_COLUMNS))
+        shm = shared_memory.SharedMemory(create=True, size=size)
+
+        try:
+            timestamps, values = _views(shm, total_rows)
+            rows: List[Tuple[str, int, int]] = []
+            offset = 0
+            for symbol in symbols:
+                df = frames[symbol]
+                end = offset + len(df)
+                timestamps[offset:end] = df.index.as_unit('ms').asi8
+                values[offset:end] = df[KLINE_COLUMNS].to_numpy(dtype=np.float64)
+                rows.append((symbol, offset, end))
+                offset = end
+            del timestamps, values
+
+            # 프로세스당 여러 묶음으로 나눠 처리 시간 편차 완화
+            shard_count = min(len(rows), self.workers * 4)
+            shards = [rows[i::shard_count] for i in range(shard_count)]
+            futures = [self._pool.submit(_analyze_shard, shm.name, total_rows, shard) for shard in shards]
+
+            signals = []
+            states = {}
+            self.last_cpu_seconds = 0.0
+            for future in futures:
+                shard_signals, shard_states, cpu_seconds = future.result()
+                signals.extend(shard_signals)
+                states.update(shard_states)
+                self.last_cpu_seconds += cpu_seconds
+        finally:
+            shm.close()
+            shm.unlink()
+
+        order = {symbol: i for i, symbol in enumerate(symbols)}
+        signals.sort(key=lambda signal: order[signal['symbol']])
+        return signals, states
+
+    def close(self):
+        """프로세스 풀 종료"""
+        self._pool.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,149 @@
+"""
+현재가 사전 선별 모듈
+전체 심볼 현재가(/ticker/price 1회)와 캐시된 마감 캔들만으로, 이번 스캔에 시그널이 불가능한 심볼을 캔들 조회 전에 제외
+"""
+from typing import Optional, Sequence, Tuple
+import numpy as np
+import pandas as pd
+import logging
+from .candle_view import column_view
+
+logger = logging.getLogger(__name__)
+
+
+class PriceScreen:
+    """현재가 기반 시그널 가능성 판정 (불가능이 증명될 때만 제외)"""
+
+    def __init__(self, interval_ms: int, target_period: int = 480, tolerance_pct: float = 5.0,
+                 momentum_windows: Optional[Sequence[Tuple[int, float]]] = None,
+                 margin_pct: float = 1.0, max_move_pct: float = 30.0, max_unknown_candles: int = 12):
+        """
+        초기화
+
+        Args:
+            interval_ms: 캔들 길이 (ms)
+            target_period: 근처 판정 기준 SMA 기간
+            tolerance_pct: target SMA 근처 허용 오차 (%)
+            momentum_windows: 모멘텀 시그널 구간별 (캔들 수, 최소 상승률 %) (None이면 모멘텀 시그널 미사용)
+            margin_pct: 현재가 조회 후 캔들 조회까지의 가격 변동 여유 (%)
+            max_move_pct: 캐시 이후 마감된(모르는) 캔들 종가가 현재가에서 벗어날 수 있는 최대 폭 (%)
+            max_unknown_candles: 캐시 이후 마감된 캔들이 이보다 많으면 판정하지 않음
+        """
+        self.interval_ms = interval_ms
+        self.target_period = target_period
+        self.tolerance = tolerance_pct / 100
+        self.momentum_windows = list(momentum_windows or [])
+        self.margin = margin_pct / 100
+        self.max_move = max_move_pct / 100
+        self.max_unknown_candles = max_unknown_candles
+
+    def _known_closes(self, df: pd.DataFrame, live_open_ms: int) -> Tuple[np.ndarray, np.ndarray]:
+        """캐시에서 마감이 확실한 캔들의 (시작 시각, 종가) - 마지막 행은 진행 중이었을 수 있어 제외"""
+        timestamps = df.index.as_unit('ms').asi8[:-1]
+        closes = column_view(df, 'close')[:-1]
+        known = timestamps < live_open_ms
+        return timestamps[known], closes[known]
+
+    def target_sma_range(self, df: pd.DataFrame, price: float, live_open_ms: int) -> Optional[Tuple[float, float]]:
+        """
+        진행 중인 캔들 기준 target SMA가 가질 수 있는 범위
+
+        윈도우 = 캐시의 마감 캔들 + 캐시 이후 마감된 캔들(현재가 ±max_move로 가정) + 진행 중인 캔들(종가 = 현재가)
+
+        Args:
+            df: 캐시된 캔들 데이터프레임
+            price: 현재가
+            live_open_ms: 진행 중인 캔들 시작 시각 (ms)
+
+        Returns:
+            (최소, 최대) 또는 None (판정 불가)
+        """
+        timestamps, closes = self._known_closes(df, live_open_ms)
+        if len(timestamps) == 0:
+            return None
+
+        unknown = (live_open_ms - timestamps[-1]) // self.interval_ms - 1
+        if unknown < 0 or unknown > self.max_unknown_candles:
+            return None
+
+        known_count = self.target_period - 1 - unknown
+        window_start = live_open_ms - (self.target_period - 1) * self.interval_ms
+        in_window = timestamps >= window_start
+        # 캐시가 짧거나 중간에 빠진 캔들이 있으면 판정하지 않음
+        if known_count <= 0 or int(in_window.sum()) != known_count:
+            return None
+
+        known_sum = float(closes[in_window].sum())
+        low = (known_sum + unknown * price * (1 - self.max_move) + price) / self.target_period
+        high = (known_sum + unknown * price * (1 + self.max_move) + price) / self.target_period
+        return low, high
+
+    def near_possible(self, df: pd.DataFrame, price: float, live_open_ms: int) -> bool:
+        """
+        현재가가 target SMA의 ±허용 오차 안에 들 수 있는지
+
+        Returns:
+            가능 여부 (판정 불가면 True)
+        """
+        sma_range = self.target_sma_range(df, price, live_open_ms)
+        if sma_range is None:
+            return True
+
+        # |현재가 - SMA| <= 허용 오차 x SMA 를 만족하는 SMA 범위와 겹치는지
+        tolerance = self.tolerance + self.margin
+        low, high = sma_range
+        return high >= price / (1 + tolerance) and low <= price / (1 - tolerance)
+
+    def momentum_possible(self, df: pd.DataFrame, price: float, live_open_ms: int) -> bool:
+        """
+        모멘텀 구간 중 하나라도 상승률이 최소 상승률에 닿을 수 있는지
+
+        Returns:
+            가능 여부 (모멘텀 시그널 미사용이면 False, 판정 불가면 True)
+        """
+        if not self.momentum_windows:
+            return False
+
+        timestamps, closes = self._known_closes(df, live_open_ms)
+        for candles, min_pct in self.momentum_windows:
+            # 진행 중인 캔들에서 candles개 전 캔들의 종가
+            reference_open = live_open_ms - candles * self.interval_ms
+            index = int(np.searchsorted(timestamps, reference_open))
+            if index >= len(timestamps) or timestamps[index] != reference_open:
+                return True
+
+            change_pct = (price / closes[index] - 1) * 100
+            if change_pct >= min_pct - self.margin * 100:
+                return True
+
+        return False
+
+    def can_signal(self, df: Optional[pd.DataFrame], price: Optional[float], live_open_ms: int) -> bool:
+        """
+        이번 스캔에 시그널이 가능한지 (False면 캔들 조회 생략)
+
+        Args:
+            df: 캐시된 캔들 데이터프레임 (None이면 판정 불가)
+            price: 현재가 (None이면 판정 불가)
+            live_open_ms: 진행 중인 캔들 시작 시각 (ms)
+
+        Returns:
+            시그널 가능 여부
+        """
+        if df is None or df.empty or price is None or price <= 0:
+            return True
+
+        return self.near_possible(df, price, live_open_ms) or self.momentum_possible(df, price, live_open_ms)
+
+    def estimate_distance(self, df: pd.DataFrame, price: float, live_open_ms: int) -> Optional[float]:
+        """
+        현재가와 target SMA 추정치의 거리 (%, 스캔 순서/우선순위용)
+
+        Returns:
+            거리 (판정 불가면 None)
+        """
+        sma_range = self.target_sma_range(df, price, live_open_ms)
+        if sma_range is None:
+            return None
+        sma = sum(sma_range) / 2
+        return abs(price / sma - 1) * 100
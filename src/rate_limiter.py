@@ -0,0 +1,203 @@
+"""
+요청 웨이트 레이트 리미터 모듈
+바이낸스 선물 API 웨이트 기준 토큰 버킷 (동기/비동기 공용)
+"""
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+import logging
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+# 바이낸스 선물 IP당 분당 웨이트 한도
+BINANCE_WEIGHT_LIMIT = 2400
+
+# 엔드포인트별 웨이트 (심볼 지정 시, 전체 조회 시)
+ENDPOINT_WEIGHTS = {
+    'futures_exchange_info': (1, 1),
+    'futures_ticker': (1, 40),  # /fapi/v1/ticker/24hr
+    'futures_symbol_ticker': (1, 2),  # /fapi/v2/ticker/price
+    'futures_time': (1, 1),
+    'futures_ping': (1, 1),
+}
+
+
+def klines_weight(limit: int) -> int:
+    """
+    futures_klines 요청 웨이트 (limit 구간별)
+
+    Args:
+        limit: 조회 캔들 수
+
+    Returns:
+        요청 웨이트
+    """
+    if limit < 100:
+        return 1
+    if limit < 500:
+        return 2
+    if limit <= 1000:
+        return 5
+    return 10
+
+
+def request_weight(method: str, params: Dict) -> int:
+    """
+    클라이언트 메서드 호출의 요청 웨이트
+
+    Args:
+        method: python-binance 클라이언트 메서드 이름
+        params: 요청 파라미터
+
+    Returns:
+        요청 웨이트
+    """
+    if method == 'futures_klines':
+        return klines_weight(params.get('limit', 500))
+
+    with_symbol, without_symbol = ENDPOINT_WEIGHTS.get(method, (1, 1))
+    return with_symbol if params.get('symbol') else without_symbol
+
+
+class WeightRateLimiter:
+    """분당 웨이트 토큰 버킷 (텔레그램 메시지 수 등 다른 분당 한도에도 사용)"""
+
+    def __init__(self, weight_per_minute: int = 1800, name: str = '바이낸스 API', unit: str = '웨이트'):
+        """
+        초기화
+
+        Args:
+            weight_per_minute: 분당 사용할 최대 웨이트 (바이낸스 한도 2400보다 낮게)
+            name: 로그에 표시할 제한 대상
+            unit: 로그에 표시할 한도 단위 (웨이트, 메시지 등)
+        """
+        self.name = name
+        self.unit = unit
+        self.capacity = float(weight_per_minute)
+        self.rate = self.capacity / 60.0  # 초당 충전량
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+        # 서버가 알려준 최근 사용 웨이트
+        self.server_used_weight: Optional[int] = None
+
+        logger.info(f"{name} 레이트 리미터 초기화: 분당 {unit} {weight_per_minute}")
+
+    def _refill(self, now: float):
+        """경과 시간만큼 토큰 충전"""
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, weight: int) -> float:
+        """
+        웨이트 예약 (잔량이 부족하면 음수로 빌려 쓰고 대기 시간 반환)
+
+        Args:
+            weight: 요청 웨이트
+
+        Returns:
+            요청 전에 대기해야 할 시간 (초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= weight
+
+            wait = max(0.0, self._blocked_until - now)
+            if self._tokens < 0:
+                wait = max(wait, -self._tokens / self.rate)
+
+            return wait
+
+    def acquire(self, weight: int):
+        """
+        웨이트 확보 (필요하면 블로킹 대기)
+
+        Args:
+            weight: 요청 웨이트
+        """
+        wait = self.reserve(weight)
+        if wait > 0:
+            logger.debug(f"{self.name} 레이트 리밋 대기: {wait:.2f}초 ({self.unit} {weight})")
+            time.sleep(wait)
+
+    async def acquire_async(self, weight: int):
+        """
+        웨이트 확보 (비동기 대기)
+
+        Args:
+            weight: 요청 웨이트
+        """
+        wait = self.reserve(weight)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def sync_used_weight(self, used_weight: int):
+        """
+        응답 헤더(X-MBX-USED-WEIGHT-1M)의 사용 웨이트로 잔량 보정
+        (같은 IP의 다른 프로세스가 쓴 웨이트까지 반영)
+
+        Args:
+            used_weight: 서버 기준 현재 분에 사용된 웨이트
+        """
+        metrics.API_USED_WEIGHT.set(used_weight)
+        with self._lock:
+            self.server_used_weight = used_weight
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, self.capacity - used_weight)
+
+    def block(self, seconds: float):
+        """
+        429/418 응답 시 지정 시간 동안 모든 요청 차단
+
+        Args:
+            seconds: 차단 시간 (Retry-After)
+        """
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+        logger.warning(f"{self.name} 레이트 리밋 초과 응답, {seconds:.0f}초 동안 요청 중단")
+
+    def update_from_headers(self, headers) -> None:
+        """
+        응답 헤더에서 사용 웨이트 읽어 보정
+
+        Args:
+            headers: 응답 헤더 (대소문자 무관 매핑)
+        """
+        if headers is None:
+            return
+
+        used = headers.get('X-MBX-USED-WEIGHT-1M')
+        if used is None:
+            return
+
+        try:
+            self.sync_used_weight(int(used))
+        except (TypeError, ValueError):
+            pass
+
+    def handle_error_status(self, status_code: int, headers) -> None:
+        """
+        429(레이트 리밋)/418(IP 차단) 응답 처리
+
+        Args:
+            status_code: HTTP 상태 코드
+            headers: 응답 헤더
+        """
+        if status_code not in (418, 429):
+            return
+
+        retry_after = None
+        if headers is not None:
+            retry_after = headers.get('Retry-After')
+
+        try:
+            seconds = float(retry_after) if retry_after is not None else 60.0
+        except (TypeError, ValueError):
+            seconds = 60.0
+
+        self.block(seconds)
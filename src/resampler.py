@@ -0,0 +1,268 @@
+"""
+캔들 리샘플링 모듈
+기본 시간 프레임 캔들(예: 15분봉)에서 1시간/4시간/일봉 OHLCV를 로컬로 만들어 시간 프레임별 추가 조회를 없앰
+"""
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+import logging
+from .kline_cache import INTERVAL_MS, KLINE_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+_DAY_MS = INTERVAL_MS['1d']
+
+
+def check_intervals(base_interval: str, interval: str) -> int:
+    """
+    리샘플 가능한 시간 프레임인지 확인
+
+    바이낸스와 같은 UTC 기준 구간을 쓰려면 목표 시간 프레임이 하루를 나누어떨어지게 해야 한다
+    (3d, 1w는 바이낸스 기준 시작일이 달라 지원하지 않음).
+
+    Args:
+        base_interval: 기본 시간 프레임
+        interval: 목표 시간 프레임
+
+    Returns:
+        목표 시간 프레임 길이 (ms)
+    """
+    base_ms = INTERVAL_MS.get(base_interval)
+    interval_ms = INTERVAL_MS.get(interval)
+
+    if base_ms is None or interval_ms is None:
+        raise ValueError(f"알 수 없는 시간 프레임: {base_interval} → {interval}")
+    if interval_ms % base_ms or _DAY_MS % interval_ms:
+        raise ValueError(f"리샘플할 수 없는 시간 프레임: {base_interval} → {interval}")
+
+    return interval_ms
+
+
+def resample_arrays(timestamps: np.ndarray, values: np.ndarray,
+                    interval_ms: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    캔들 배열을 interval_ms 구간(UTC 기준)으로 묶기
+
+    Args:
+        timestamps: 캔들 시작 시각 배열 (ms, 오름차순)
+        values: KLINE_COLUMNS 순서의 값 배열 (N x 컬럼 수)
+        interval_ms: 목표 캔들 길이 (ms)
+
+    Returns:
+        (구간 시작 시각 배열, 구간별 값 배열)
+    """
+    if len(timestamps) == 0:
+        return timestamps[:0], values[:0]
+
+    buckets = timestamps - timestamps % interval_ms
+    starts = np.flatnonzero(np.concatenate(([True], buckets[1:] != buckets[:-1])))
+    ends = np.concatenate((starts[1:], [len(timestamps)])) - 1
+
+    result = np.empty((len(starts), values.shape[1]), dtype=np.float64)
+    for j, column in enumerate(KLINE_COLUMNS):
+        column_values = values[:, j]
+        if column == 'open':
+            result[:, j] = column_values[starts]
+        elif column == 'high':
+            result[:, j] = np.maximum.reduceat(column_values, starts)
+        elif column == 'low':
+            result[:, j] = np.minimum.reduceat(column_values, starts)
+        elif column == 'close':
+            result[:, j] = column_values[ends]
+        else:
+            # 거래량/거래대금 컬럼은 합계
+            result[:, j] = np.add.reduceat(column_values, starts)
+
+    return buckets[starts], result
+
+
+def _frame_values(df: pd.DataFrame) -> np.ndarray:
+    """KLINE_COLUMNS 값 배열 (컬럼이 정확히 KLINE_COLUMNS면 복사 없이)"""
+    if list(df.columns) == KLINE_COLUMNS:
+        return df.to_numpy(dtype=np.float64, copy=False)
+    return df[KLINE_COLUMNS].to_numpy(dtype=np.float64)
+
+
+def index_ms(index: pd.DatetimeIndex) -> np.ndarray:
+    """캔들 시작 시각 배열 (ms, 이미 ms 단위면 복사 없이 - as_unit은 같은 단위여도 복사함)"""
+    if index.unit == 'ms':
+        return index.asi8
+    return index.as_unit('ms').asi8
+
+
+def _frame_arrays(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """데이터프레임 → (캔들 시작 시각 배열(ms), KLINE_COLUMNS 값 배열)"""
+    return index_ms(df.index), _frame_values(df)
+
+
+def _to_frame(timestamps: np.ndarray, values: np.ndarray) -> pd.DataFrame:
+    """(캔들 시작 시각 배열(ms), 값 배열) → 데이터프레임"""
+    index = pd.DatetimeIndex(timestamps.view('datetime64[ms]'), name='timestamp', copy=False)
+    return pd.DataFrame(values, columns=KLINE_COLUMNS, index=index, copy=False)
+
+
+def _skip_partial_head(timestamps: np.ndarray, interval_ms: int) -> int:
+    """데이터 시작이 구간 중간이면 첫 구간(불완전)을 건너뛸 행 수"""
+    if len(timestamps) == 0 or timestamps[0] % interval_ms == 0:
+        return 0
+    return int(np.searchsorted(timestamps, timestamps[0] - timestamps[0] % interval_ms + interval_ms))
+
+
+def resample_frame(df: pd.DataFrame, interval_ms: int, base_ms: Optional[int] = None) -> pd.DataFrame:
+    """
+    OHLCV 데이터프레임 리샘플 (마지막 구간은 진행 중일 수 있음)
+
+    Args:
+        df: KLINE_COLUMNS 컬럼의 데이터프레임 (DatetimeIndex)
+        interval_ms: 목표 캔들 길이 (ms)
+        base_ms: 기본 캔들 길이 (ms, 지정하면 앞부분이 잘린 첫 구간은 버림)
+
+    Returns:
+        리샘플된 데이터프레임
+    """
+    timestamps, values = _frame_arrays(df)
+
+    if base_ms is not None:
+        skip = _skip_partial_head(timestamps, interval_ms)
+        timestamps, values = timestamps[skip:], values[skip:]
+
+    return _to_frame(*resample_arrays(timestamps, values, interval_ms))
+
+
+class _BarBuffer:
+    """
+    심볼/시간 프레임별 리샘플 결과 버퍼
+    - 용량 2×max_bars 배열에 마지막 구간 교체/추가를 제자리에서 기록 (호출마다 전체 배열을 새로 만들지 않음)
+    - 끝에 닿으면 최근 구간만 앞으로 한 번 복사 (max_bars회 추가마다, 분할 상환 O(1))
+    """
+
+    __slots__ = ('timestamps', 'values', 'start', 'end', 'max_bars')
+
+    def __init__(self, timestamps: np.ndarray, values: np.ndarray, max_bars: int):
+        self.max_bars = max_bars
+        self.timestamps = np.empty(2 * max_bars, dtype=np.int64)
+        self.values = np.empty((2 * max_bars, values.shape[1]), dtype=np.float64)
+        self.start = 0
+        self.end = 0
+        self.extend(timestamps, values)
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def last_timestamp(self) -> int:
+        """마지막 구간 시작 시각 (ms)"""
+        return int(self.timestamps[self.end - 1])
+
+    def extend(self, timestamps: np.ndarray, values: np.ndarray):
+        """
+        구간 추가 (max_bars개를 넘으면 오래된 구간부터 버림)
+
+        Args:
+            timestamps: 구간 시작 시각 배열 (ms)
+            values: 구간별 값 배열
+        """
+        timestamps, values = timestamps[-self.max_bars:], values[-self.max_bars:]
+        count = len(timestamps)
+
+        if self.end + count > len(self.timestamps):
+            # 남길 최근 구간을 앞으로 복사 (원본 위치가 max_bars 이후라 겹치지 않아 임시 배열 없음)
+            keep = min(len(self), self.max_bars - count)
+            self.timestamps[:keep] = self.timestamps[self.end - keep:self.end]
+            self.values[:keep] = self.values[self.end - keep:self.end]
+            self.start, self.end = 0, keep
+
+        self.timestamps[self.end:self.end + count] = timestamps
+        self.values[self.end:self.end + count] = values
+        self.end += count
+        self.start = max(self.start, self.end - self.max_bars)
+
+    def replace_last(self, timestamps: np.ndarray, values: np.ndarray):
+        """
+        마지막 구간(진행 중일 수 있음)부터 교체/추가
+
+        Args:
+            timestamps: 마지막 구간부터 다시 집계한 구간 시작 시각 배열 (ms)
+            values: 구간별 값 배열
+        """
+        self.end -= 1
+        self.start = min(self.start, self.end)
+        self.extend(timestamps, values)
+
+    def frame(self) -> pd.DataFrame:
+        """보관 중인 구간의 읽기 전용 데이터프레임 (버퍼와 메모리 공유)"""
+        timestamps = self.timestamps[self.start:self.end]
+        values = self.values[self.start:self.end]
+        values.flags.writeable = False
+        return _to_frame(timestamps, values)
+
+
+class KlineResampler:
+    """심볼/시간 프레임별 리샘플 결과 캐시 (마지막 구간부터만 다시 집계)"""
+
+    def __init__(self, max_bars: int = 500):
+        """
+        초기화
+
+        Args:
+            max_bars: 시간 프레임별 보관할 최대 캔들 수
+        """
+        self.max_bars = max_bars
+        # {(심볼, 목표 시간 프레임): 리샘플 결과 버퍼} - 마지막 구간은 진행 중일 수 있음
+        self._bars: Dict[Tuple[str, str], _BarBuffer] = {}
+
+    def resample(self, symbol: str, df: pd.DataFrame, base_interval: str, interval: str) -> pd.DataFrame:
+        """
+        기본 캔들에서 목표 시간 프레임 캔들 만들기 (증분)
+
+        이전 결과의 마지막 구간 시작 이후 기본 캔들만 다시 묶어 교체/추가한다.
+
+        Args:
+            symbol: 심볼
+            df: 기본 시간 프레임 캔들 (캐시 또는 조회 결과)
+            base_interval: 기본 시간 프레임
+            interval: 목표 시간 프레임
+
+        Returns:
+            목표 시간 프레임 데이터프레임 (읽기 전용, 캐시 버퍼와 메모리를 공유하므로 다음 호출 전까지만 사용)
+        """
+        if interval == base_interval:
+            return df
+
+        interval_ms = check_intervals(base_interval, interval)
+        key = (symbol, interval)
+
+        if df is None or df.empty:
+            return pd.DataFrame(columns=KLINE_COLUMNS)
+
+        timestamps = index_ms(df.index)
+        bars = self._bars.get(key)
+
+        # 이전 결과의 마지막 구간이 기본 캔들 범위 안에 있으면 그 구간부터만 다시 집계해 제자리 교체
+        if bars is not None and len(bars) and timestamps[0] <= bars.last_timestamp() <= timestamps[-1]:
+            start = int(np.searchsorted(timestamps, bars.last_timestamp()))
+            tail = _frame_values(df)[start:]
+            bars.replace_last(*resample_arrays(timestamps[start:], tail, interval_ms))
+        else:
+            values = _frame_values(df)
+            skip = _skip_partial_head(timestamps, interval_ms)
+            bars = self._bars[key] = _BarBuffer(
+                *resample_arrays(timestamps[skip:], values[skip:], interval_ms), self.max_bars
+            )
+
+        # 복사 대신 버퍼의 읽기 전용 뷰로 반환
+        return bars.frame()
+
+    def retain(self, symbols: List[str]):
+        """
+        모니터링 대상이 아닌 심볼의 리샘플 결과 삭제
+
+        Args:
+            symbols: 유지할 심볼 리스트
+        """
+        keep = set(symbols)
+        for key in list(self._bars):
+            if key[0] not in keep:
+                del self._bars[key]
+
+    def __len__(self) -> int:
+        return len(self._bars)
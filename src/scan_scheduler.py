@@ -0,0 +1,142 @@
+"""
+캔들 마감 정렬 스캔 스케줄러 모듈
+바이낸스 서버 시각과의 차이를 추적해 캔들 마감 직후에 스캔을 시작
+"""
+import time
+from typing import Callable, Optional
+import logging
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class ServerClock:
+    """바이낸스 서버 시각 추정 (로컬 시각 + 왕복 시간을 보정한 오프셋)"""
+
+    def __init__(self, fetch_server_time: Callable[[], Optional[int]], resync_interval: float = 600.0,
+                 samples: int = 3):
+        """
+        초기화
+
+        Args:
+            fetch_server_time: 서버 시각(epoch ms)을 돌려주는 함수 (실패 시 None)
+            resync_interval: 오프셋 재측정 주기 (초)
+            samples: 측정당 요청 수 (왕복 시간이 가장 짧은 값 사용)
+        """
+        self._fetch = fetch_server_time
+        self.resync_interval = resync_interval
+        self.samples = samples
+
+        # 서버 시각 - 로컬 시각 (ms)
+        self.offset_ms = 0.0
+        self.rtt_ms: Optional[float] = None
+        self._synced_at: Optional[float] = None
+
+    def sync(self) -> bool:
+        """
+        서버 시각 오프셋 측정
+
+        Returns:
+            측정 성공 여부 (실패하면 이전 오프셋 유지)
+        """
+        best = None
+        for _ in range(self.samples):
+            sent = time.time() * 1000
+            server_ms = self._fetch()
+            received = time.time() * 1000
+            if server_ms is None:
+                continue
+
+            rtt = received - sent
+            if best is None or rtt < best[0]:
+                # 서버 시각은 요청과 응답의 중간 시점으로 간주
+                best = (rtt, server_ms - (sent + received) / 2)
+
+        self._synced_at = time.monotonic()
+        if best is None:
+            logger.warning(f"서버 시각 동기화 실패 (오프셋 {self.offset_ms:+.0f}ms 유지)")
+            return False
+
+        self.rtt_ms, self.offset_ms = best
+        metrics.SERVER_CLOCK_OFFSET_SECONDS.set(self.offset_ms / 1000)
+        logger.debug(f"서버 시각 동기화: 오프셋 {self.offset_ms:+.0f}ms, 왕복 {self.rtt_ms:.0f}ms")
+        return True
+
+    def maybe_sync(self):
+        """재측정 주기가 지났으면 동기화"""
+        if self._synced_at is None or time.monotonic() - self._synced_at >= self.resync_interval:
+            self.sync()
+
+    def now_ms(self) -> float:
+        """현재 서버 시각 추정치 (epoch ms)"""
+        return time.time() * 1000 + self.offset_ms
+
+
+class CandleCloseScheduler:
+    """캔들 마감 + 정착 지연 시점마다 깨우는 스케줄러"""
+
+    def __init__(self, interval_ms: int, clock: ServerClock, settle_delay: float = 2.0):
+        """
+        초기화
+
+        Args:
+            interval_ms: 캔들 길이 (ms)
+            clock: 서버 시각
+            settle_delay: 마감 후 대기 시간 (초, 거래소가 마감 캔들을 확정할 여유)
+        """
+        self.interval_ms = interval_ms
+        self.clock = clock
+        self.settle_ms = settle_delay * 1000
+
+        # 마지막으로 깨운 캔들 마감 시각 (epoch ms)
+        self.last_close_ms: Optional[int] = None
+
+    def next_close_ms(self, now_ms: Optional[float] = None) -> int:
+        """
+        스캔할 다음 캔들 마감 시각
+
+        이전 스캔이 다음 마감을 넘겨 끝났으면 놓친 마감 중 가장 최근 것을 돌려준다 (바로 스캔).
+
+        Args:
+            now_ms: 기준 서버 시각 (epoch ms, 기본 현재)
+
+        Returns:
+            캔들 마감 시각 (epoch ms)
+        """
+        now_ms = self.clock.now_ms() if now_ms is None else now_ms
+        latest_close = int((now_ms - self.settle_ms) // self.interval_ms * self.interval_ms)
+
+        if self.last_close_ms is None or latest_close <= self.last_close_ms:
+            return latest_close + self.interval_ms
+
+        missed = (latest_close - self.last_close_ms) // self.interval_ms - 1
+        if missed > 0:
+            logger.warning(f"스캔이 길어져 캔들 마감 {missed}회를 건너뜀")
+        return latest_close
+
+    def wait(self) -> int:
+        """
+        다음 캔들 마감 + 정착 지연까지 대기
+
+        Returns:
+            캔들 마감 시각 (epoch ms)
+        """
+        self.clock.maybe_sync()
+        close_ms = self.next_close_ms()
+
+        delay = (close_ms + self.settle_ms - self.clock.now_ms()) / 1000
+        if delay > 0:
+            logger.info(f"다음 캔들 마감까지 {delay:.1f}초 대기 중...")
+            time.sleep(delay)
+
+        self.last_close_ms = close_ms
+        return close_ms
+
+    def lag(self, close_ms: int) -> float:
+        """
+        캔들 마감 이후 경과 시간 (초, 서버 시각 기준)
+
+        Args:
+            close_ms: 캔들 마감 시각 (epoch ms)
+        """
+        return (self.clock.now_ms() - close_ms) / 1000
@@ -3,32 +3,72 @@
 역배열 및 SMA 돌파 감지
 """
 import pandas as pd
-from typing import Dict, Optional
-from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from datetime import timedelta
 import logging
+from .alert_store import AlertStore
+from .candle_view import CandleView
+from .kline_cache import INTERVAL_MS
+from .resampler import resample_frame
 
 logger = logging.getLogger(__name__)
 
+# 역배열 시그널의 target SMA 근처 허용 오차 (%)
+NEAR_TOLERANCE_PCT = 5.0
+
+# 역배열 시그널 24시간 모멘텀 필터 (24개 1시간봉, 상승률 5% 이상, 거래대금 10M 이상)
+# 기본 시간 프레임이 1시간보다 짧으면 기본 캔들을 1시간봉으로 리샘플해서 판단
+MOMENTUM_FILTER_CANDLES = 24
+MOMENTUM_FILTER_MIN_CHANGE_PCT = 5.0
+MOMENTUM_FILTER_MIN_VOLUME = 10_000_000
+
+# 모멘텀 시그널 시간 기준별 구간 길이 (밀리초)
+MOMENTUM_TIMEFRAME_MS = {
+    '4h': 4 * 60 * 60_000,
+    '6h': 6 * 60 * 60_000,
+    '12h': 12 * 60 * 60_000,
+    '24h': 24 * 60 * 60_000,
+}
+
+
+def timeframe_candles(timeframe: str, interval: str = '15m') -> int:
+    """
+    모멘텀 시간 기준 구간의 캔들 수 (예: 24h, 15분봉 → 96개)
+
+    Args:
+        timeframe: 시간 기준 (4h, 6h, 12h, 24h)
+        interval: 캔들 시간 프레임
+
+    Returns:
+        캔들 수
+    """
+    duration_ms = MOMENTUM_TIMEFRAME_MS.get(timeframe, MOMENTUM_TIMEFRAME_MS['24h'])
+    return max(1, duration_ms // INTERVAL_MS[interval])
+
 
 class SignalDetector:
     """시그널 감지기"""
 
-    def __init__(self, target_sma: int = 480, confirm_candles: int = 1, cooldown: int = 3600):
+    def __init__(self, target_sma: int = 480, confirm_candles: int = 1, cooldown: int = 3600,
+                 alert_store: Optional[AlertStore] = None, interval: str = '15m'):
         """
         초기화
 
         Args:
             target_sma: 돌파 기준 SMA 기간
             confirm_candles: 돌파 확인할 캔들 수
-            cooldown: 같은 코인 재알림 대기 시간 (초)
+            cooldown: 같은 코인/시그널 타입 재알림 대기 시간 (초)
+            alert_store: 쿨다운 저장소 (None이면 메모리에만 보관)
+            interval: 분석하는 캔들의 시간 프레임
         """
+        self.interval = interval
         self.target_sma = target_sma
         self.target_sma_col = f'sma_{target_sma}'
         self.confirm_candles = confirm_candles
         self.cooldown = cooldown
 
-        # 알림 이력 (중복 방지용)
-        self.last_alert_time: Dict[str, datetime] = {}
+        # 알림 쿨다운 (중복 방지용, (심볼, 시그널 타입)별)
+        self.alert_store = alert_store if alert_store is not None else AlertStore()
 
         logger.info(f"시그널 감지기 초기화: SMA{target_sma} 돌파, {confirm_candles}캔들 확인, "
                    f"{cooldown}초 쿨다운")
@@ -51,21 +91,31 @@ class SignalDetector:
             return False
 
         # 현재 캔들
-        current_candle = df.iloc[-1]
-        current_close = current_candle['close']
-        current_sma = current_candle[target_sma_col]
+        view = CandleView(df)
+        return self.is_near(view.close_at(-1), view.column(target_sma_col)[-1], tolerance_pct)
 
+    @staticmethod
+    def is_near(close: float, sma: Optional[float], tolerance_pct: float = NEAR_TOLERANCE_PCT) -> bool:
+        """
+        종가가 SMA의 ±tolerance_pct% 이내인지 확인
+
+        Args:
+            close: 종가
+            sma: SMA 값
+            tolerance_pct: 허용 오차 퍼센트
+
+        Returns:
+            근처 여부 (NaN이면 False)
+        """
         # NaN 체크
-        if pd.isna(current_close) or pd.isna(current_sma):
+        if sma is None or pd.isna(close) or pd.isna(sma):
             return False
 
         # 종가가 target SMA의 ±tolerance_pct% 이내인지 확인
-        lower_bound = current_sma * (1 - tolerance_pct / 100)
-        upper_bound = current_sma * (1 + tolerance_pct / 100)
-
-        is_near = lower_bound <= current_close <= upper_bound
+        lower_bound = sma * (1 - tolerance_pct / 100)
+        upper_bound = sma * (1 + tolerance_pct / 100)
 
-        return is_near
+        return bool(lower_bound <= close <= upper_bound)
 
     def check_breakout_close(self, df: pd.DataFrame, reverse_aligned: bool) -> bool:
         """
@@ -86,27 +136,27 @@ class SignalDetector:
             return False
 
         # 최신 캔들들 확인
-        recent_candles = df.tail(self.confirm_candles + 1)
-
-        if len(recent_candles) < self.confirm_candles + 1:
+        if len(df) < self.confirm_candles + 1:
             return False
 
+        view = CandleView(df)
+        close = view.close
+        sma = view.column(self.target_sma_col)
+
         # 이전 캔들 (돌파 전)
-        prev_candle = recent_candles.iloc[-self.confirm_candles - 1]
-        prev_close = prev_candle['close']
-        prev_sma = prev_candle[self.target_sma_col]
+        prev_close = close[-self.confirm_candles - 1]
+        prev_sma = sma[-self.confirm_candles - 1]
 
         # 현재 캔들 (돌파 후)
-        current_candle = recent_candles.iloc[-1]
-        current_close = current_candle['close']
-        current_sma = current_candle[self.target_sma_col]
+        current_close = close[-1]
+        current_sma = sma[-1]
 
         # NaN 체크
         if pd.isna(prev_close) or pd.isna(prev_sma) or pd.isna(current_close) or pd.isna(current_sma):
             return False
 
         # 돌파 조건: 이전 종가 < SMA, 현재 종가 > SMA
-        breakout = prev_close < prev_sma and current_close > current_sma
+        breakout = bool(prev_close < prev_sma and current_close > current_sma)
 
         if breakout:
             logger.info(f"돌파 감지! 이전: {prev_close:.4f} < {prev_sma:.4f}, "
@@ -131,78 +181,96 @@ class SignalDetector:
         if not reverse_aligned:
             return False
 
-        recent_candles = df.tail(self.confirm_candles + 1)
-
-        if len(recent_candles) < self.confirm_candles + 1:
+        if len(df) < self.confirm_candles + 1:
             return False
 
+        view = CandleView(df)
+        high = view.high
+        sma = view.column(self.target_sma_col)
+
         # 이전 캔들의 고가가 SMA 아래
-        prev_candle = recent_candles.iloc[-self.confirm_candles - 1]
-        prev_high = prev_candle['high']
-        prev_sma = prev_candle[self.target_sma_col]
+        prev_high = high[-self.confirm_candles - 1]
+        prev_sma = sma[-self.confirm_candles - 1]
 
         # 현재 캔들이 SMA 돌파
-        current_candle = recent_candles.iloc[-1]
-        current_high = current_candle['high']
-        current_low = current_candle['low']
-        current_sma = current_candle[self.target_sma_col]
+        current_high = high[-1]
+        current_low = view.low[-1]
+        current_sma = sma[-1]
 
         if pd.isna(prev_high) or pd.isna(prev_sma) or pd.isna(current_high) or pd.isna(current_sma):
             return False
 
         # 돌파 조건: 이전 고가 < SMA, 현재 캔들이 SMA를 관통
-        breakout = prev_high < prev_sma and current_low < current_sma < current_high
+        breakout = bool(prev_high < prev_sma and current_low < current_sma < current_high)
 
         return breakout
 
-    def should_send_alert(self, symbol: str) -> bool:
+    def should_send_alert(self, symbol: str, signal_type: str) -> bool:
         """
         알림을 보내야 하는지 확인 (쿨다운 체크)
 
         Args:
             symbol: 심볼
+            signal_type: 시그널 타입
 
         Returns:
             알림 전송 여부
         """
-        now = datetime.now()
-
-        if symbol not in self.last_alert_time:
-            return True
-
-        last_time = self.last_alert_time[symbol]
-        elapsed = (now - last_time).total_seconds()
+        remaining = self.alert_store.remaining(symbol, signal_type)
 
-        if elapsed >= self.cooldown:
+        if remaining <= 0:
             return True
 
-        logger.debug(f"{symbol}: 쿨다운 중 ({elapsed:.0f}초/{self.cooldown}초)")
+        logger.debug(f"{symbol} {signal_type}: 쿨다운 중 ({remaining:.0f}초 남음)")
         return False
 
-    def record_alert(self, symbol: str):
+    def record_alert(self, symbol: str, signal_type: str) -> bool:
         """
         알림 기록 (쿨다운 시작)
 
         Args:
             symbol: 심볼
+            signal_type: 시그널 타입
+
+        Returns:
+            기록 여부 (공유 저장소에서 다른 인스턴스가 먼저 기록했으면 False)
+        """
+        if not self.alert_store.record(symbol, signal_type, self.cooldown):
+            logger.debug(f"{symbol} {signal_type}: 다른 인스턴스가 이미 알림")
+            return False
+
+        logger.debug(f"{symbol} {signal_type}: 알림 기록됨")
+        return True
+
+    def _momentum_filter_frame(self, df: pd.DataFrame, hourly_df: Optional[pd.DataFrame]):
+        """
+        24시간 모멘텀 필터에 쓸 캔들과 캔들 수
+
+        Returns:
+            (데이터프레임, 24시간에 해당하는 캔들 수)
         """
-        self.last_alert_time[symbol] = datetime.now()
-        logger.debug(f"{symbol}: 알림 기록됨")
+        if INTERVAL_MS[self.interval] >= INTERVAL_MS['1h']:
+            return df, timeframe_candles('24h', self.interval)
+
+        if hourly_df is None:
+            hourly_df = resample_frame(df, INTERVAL_MS['1h'], INTERVAL_MS[self.interval])
+        return hourly_df, MOMENTUM_FILTER_CANDLES
 
     def analyze_signal(self, symbol: str, df: pd.DataFrame, sma_values: Dict[int, float],
                       reverse_aligned: bool, reverse_type: str, actual_target_sma: int,
-                      breakout_type: str = "CLOSE") -> Optional[Dict]:
+                      breakout_type: str = "CLOSE", hourly_df: Optional[pd.DataFrame] = None) -> Optional[Dict]:
         """
         종합 시그널 분석
 
         Args:
             symbol: 심볼
-            df: SMA가 계산된 데이터프레임
+            df: 캔들 데이터프레임 (SMA 컬럼 불필요, 수정하지 않음)
             sma_values: 현재 SMA 값들
             reverse_aligned: 역배열 여부
             reverse_type: 역배열 타입 ("FULL", "PARTIAL", None)
             actual_target_sma: 실제 사용된 target SMA (480, 1시간봉)
             breakout_type: 돌파 타입 (CLOSE, BODY, NEAR)
+            hourly_df: df에서 리샘플한 1시간봉 (None이면 여기서 리샘플)
 
         Returns:
             시그널 정보 딕셔너리 (시그널 없으면 None)
@@ -211,47 +279,46 @@ class SignalDetector:
         if actual_target_sma == 0:
             return None
 
+        # 현재 캔들 정보 (종가 뷰에서 바로 읽음)
+        view = CandleView(df)
+        current_price = view.close_at(-1)
+
         # target SMA 근처 확인
-        near_target = self.check_near_target_sma(df, actual_target_sma, tolerance_pct=5.0)
+        near_target = self.is_near(current_price, sma_values.get(actual_target_sma), NEAR_TOLERANCE_PCT)
 
         # 조건: 역배열 AND target SMA 근처
         if not (reverse_aligned and near_target):
             return None
 
-        # 추가 필터: 24시간 모멘텀 체크 (상승률 5% + 거래량 10M)
-        candles_24h = 24  # 24시간 = 24개 1시간봉
+        # 추가 필터: 24시간 모멘텀 체크 (상승률 5% + 거래량 10M, 1시간봉 기준)
+        filter_df, candles_24h = self._momentum_filter_frame(df, hourly_df)
 
-        if len(df) < candles_24h + 1:
+        if len(filter_df) < candles_24h + 1:
             return None
 
-        # 현재 캔들 정보
-        current_candle = df.iloc[-1]
-        current_price = current_candle['close']
+        filter_view = view if filter_df is df else CandleView(filter_df)
 
         # 24시간 전 가격
-        past_candle = df.iloc[-(candles_24h + 1)]
-        past_price = past_candle['close']
+        past_price = filter_view.close_at(-(candles_24h + 1))
 
         # 24시간 상승률 계산
         price_change_24h = ((current_price - past_price) / past_price) * 100
 
         # 24시간 거래량 계산
-        df_temp = df.copy()
-        df_temp['quote_volume'] = df_temp['volume'] * df_temp['close']
-        volume_24h = df_temp.tail(candles_24h)['quote_volume'].sum()
+        volume_24h = filter_view.quote_volume_sum(candles_24h)
 
         # 24시간 모멘텀 필터: 상승률 5% 이상 AND 거래량 10M 이상
-        if price_change_24h < 5.0 or volume_24h < 10_000_000:
+        if price_change_24h < MOMENTUM_FILTER_MIN_CHANGE_PCT or volume_24h < MOMENTUM_FILTER_MIN_VOLUME:
             return None
 
+        # 시그널 타입 (480만 사용, 1시간봉)
+        signal_type = "REVERSE_ALIGNED_AND_NEAR_SMA480"
+
         # 쿨다운 확인
-        if not self.should_send_alert(symbol):
+        if not self.should_send_alert(symbol, signal_type):
             return None
 
-        current_time = df.index[-1]
-
-        # 시그널 타입 (480만 사용, 1시간봉)
-        signal_type = "REVERSE_ALIGNED_AND_NEAR_SMA480"
+        current_time = view.last_timestamp()
 
         # 시그널 정보 생성
         signal_info = {
@@ -268,7 +335,8 @@ class SignalDetector:
         }
 
         # 알림 기록
-        self.record_alert(symbol)
+        if not self.record_alert(symbol, signal_type):
+            return None
 
         logger.info(f"시그널 발생: {symbol} @ {current_price:.4f} (타입: {signal_type}, 역배열: {reverse_type})")
 
@@ -289,64 +357,85 @@ class SignalDetector:
         Returns:
             시그널 정보 딕셔너리 (시그널 없으면 None)
         """
-        # 쿨다운 확인
-        if not self.should_send_alert(symbol):
-            return None
+        signal_type = f'STRONG_MOMENTUM_{timeframe.upper()}'
 
-        if df.empty:
+        # 쿨다운 확인
+        if not self.should_send_alert(symbol, signal_type):
             return None
 
-        # 시간 기준에 따른 캔들 수 매핑
-        timeframe_candles = {
-            '4h': 16,   # 4시간 = 16개 15분봉
-            '6h': 24,   # 6시간 = 24개 15분봉
-            '12h': 48,  # 12시간 = 48개 15분봉
-            '24h': 96,  # 24시간 = 96개 15분봉
-        }
-
-        candles = timeframe_candles.get(timeframe, 96)
+        # 시간 기준에 따른 캔들 수 (분석 캔들 시간 프레임 기준)
+        candles = timeframe_candles(timeframe, self.interval)
+        view = CandleView(df)
 
-        # 충분한 데이터가 있는지 확인
-        if len(df) < candles + 1:
+        price_change_pct = view.change_pct(candles)
+        if price_change_pct is None:
             return None
 
-        # 현재 캔들
-        current_candle = df.iloc[-1]
-        current_price = current_candle['close']
+        # 거래량 계산 (N시간)
+        recent_volume = view.quote_volume_sum(candles)
 
-        # N시간 전 가격
-        past_candle = df.iloc[-(candles + 1)]
-        past_price = past_candle['close']
+        return self._momentum_signal(symbol, timeframe, price_change_pct, recent_volume,
+                                     view.close_at(-1), view.last_timestamp(),
+                                     min_volume_usd, min_price_change_pct)
 
-        # 상승률 계산
-        price_change_pct = ((current_price - past_price) / past_price) * 100
+    def analyze_momentum_readings(self, symbol: str, readings: List, current_price: float,
+                                  timestamp: pd.Timestamp) -> List[Dict]:
+        """
+        여러 구간 모멘텀 시그널 분석 (MomentumEngine이 한 번에 계산한 구간별 결과 사용)
 
-        # 거래량 계산 (N시간)
-        df['quote_volume'] = df['volume'] * df['close']
-        recent_volume = df.tail(candles)['quote_volume'].sum()
+        Args:
+            symbol: 심볼
+            readings: 구간 결과 리스트 (MomentumReading, 구간별 기준 포함)
+            current_price: 현재 종가
+            timestamp: 현재 캔들 시작 시각
 
+        Returns:
+            시그널 정보 리스트 (구간마다 시그널 타입/쿨다운이 따로 적용됨)
+        """
+        signals = []
+        for reading in readings:
+            window = reading.window
+
+            # 쿨다운 확인
+            if not self.should_send_alert(symbol, f'STRONG_MOMENTUM_{window.timeframe.upper()}'):
+                continue
+
+            signal_info = self._momentum_signal(symbol, window.timeframe, reading.price_change_pct,
+                                                reading.quote_volume, current_price, timestamp,
+                                                window.min_volume_usd, window.min_price_change_pct)
+            if signal_info:
+                signals.append(signal_info)
+
+        return signals
+
+    def _momentum_signal(self, symbol: str, timeframe: str, price_change_pct: float, quote_volume: float,
+                         current_price: float, timestamp: pd.Timestamp,
+                         min_volume_usd: float, min_price_change_pct: float) -> Optional[Dict]:
+        """구간 상승률/거래대금이 기준을 넘으면 시그널 생성 후 알림 기록"""
         # 조건 확인
         # 1. 상승률 체크
         if price_change_pct < min_price_change_pct:
             return None
 
         # 2. 거래량 체크
-        if recent_volume < min_volume_usd:
+        if quote_volume < min_volume_usd:
             return None
 
         # 모든 조건 만족! 시그널 생성
+        signal_type = f'STRONG_MOMENTUM_{timeframe.upper()}'
         signal_info = {
             'symbol': symbol,
-            'timestamp': df.index[-1],
-            'signal_type': f'STRONG_MOMENTUM_{timeframe.upper()}',
+            'timestamp': timestamp,
+            'signal_type': signal_type,
             'timeframe': timeframe,
-            'quote_volume': recent_volume,
+            'quote_volume': quote_volume,
             'price_change_percent': price_change_pct,
             'current_price': current_price,
         }
 
         # 알림 기록
-        self.record_alert(symbol)
+        if not self.record_alert(symbol, signal_type):
+            return None
 
         logger.info(f"모멘텀 시그널 발생: {symbol} ({timeframe} 상승률: {price_change_pct:+.2f}%)")
 
@@ -366,8 +455,10 @@ class SignalDetector:
         Returns:
             시그널 정보 딕셔너리 (시그널 없으면 None)
         """
+        signal_type = 'STRONG_MOMENTUM'
+
         # 쿨다운 확인
-        if not self.should_send_alert(symbol):
+        if not self.should_send_alert(symbol, signal_type):
             return None
 
         # 조건 확인
@@ -386,13 +477,14 @@ class SignalDetector:
         signal_info = {
             'symbol': symbol,
             'timestamp': pd.Timestamp.now(),
-            'signal_type': 'STRONG_MOMENTUM',
+            'signal_type': signal_type,
             'quote_volume': quote_volume,
             'price_change_percent': price_change_pct,
         }
 
         # 알림 기록
-        self.record_alert(symbol)
+        if not self.record_alert(symbol, signal_type):
+            return None
 
         logger.info(f"모멘텀 시그널 발생: {symbol} (상승률: {price_change_pct:+.2f}%)")
 
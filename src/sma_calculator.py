@@ -1,14 +1,186 @@
 """
 SMA(단순이동평균) 계산 모듈
 """
+import math
+from collections import deque
 import pandas as pd
 import numpy as np
-from typing import Dict, List
+from typing import Dict, List, Optional
 import logging
+from .candle_view import column_view
 
 logger = logging.getLogger(__name__)
 
 
+class StreamingSMA:
+    """
+    심볼별 증분 SMA 엔진
+    - 종가 링 버퍼 1개 + 기간별 보정 누적합(Neumaier)
+    - 캔들 추가/교체 비용 O(기간 수)
+    """
+
+    def __init__(self, periods: List[int], history: int = 2):
+        """
+        초기화
+
+        Args:
+            periods: SMA 기간 리스트
+            history: 보관할 최근 SMA 값 개수 (현재 + 이전)
+        """
+        self.periods = sorted(periods)
+        self.max_period = max(periods)
+        self.history = history
+
+        self._buffer = [0.0] * self.max_period  # 종가 링 버퍼
+        self._pos = 0  # 다음에 쓸 위치
+        self._count = 0  # 지금까지 추가된 캔들 수
+        self._sums = {p: 0.0 for p in self.periods}
+        self._comps = {p: 0.0 for p in self.periods}  # 누적합 보정값
+        self._pushes_since_resync = 0
+
+        # 최근 캔들별 SMA 값 {기간: SMA값} (마지막이 현재 캔들)
+        self._values: deque = deque(maxlen=history)
+        self.last_timestamp: Optional[pd.Timestamp] = None
+
+    def _add(self, period: int, value: float):
+        """보정 누적합에 값 더하기 (Neumaier)"""
+        total = self._sums[period]
+        new_total = total + value
+        if abs(total) >= abs(value):
+            self._comps[period] += (total - new_total) + value
+        else:
+            self._comps[period] += (value - new_total) + total
+        self._sums[period] = new_total
+
+    def _resync(self):
+        """누적합을 버퍼에서 정확히 다시 계산 (오차 누적 방지)"""
+        for period in self.periods:
+            n = min(period, self._count)
+            window = [self._buffer[(self._pos - i - 1) % self.max_period] for i in range(n)]
+            self._sums[period] = math.fsum(window)
+            self._comps[period] = 0.0
+        self._pushes_since_resync = 0
+
+    def _snapshot(self) -> Dict[int, float]:
+        """현재 SMA 값들"""
+        return {
+            p: (self._sums[p] + self._comps[p]) / p if self._count >= p else np.nan
+            for p in self.periods
+        }
+
+    def push(self, close: float, timestamp: Optional[pd.Timestamp] = None):
+        """
+        새 캔들 추가
+
+        Args:
+            close: 종가
+            timestamp: 캔들 시작 시각
+        """
+        close = float(close)
+        for period in self.periods:
+            if self._count >= period:
+                self._add(period, -self._buffer[(self._pos - period) % self.max_period])
+            self._add(period, close)
+
+        self._buffer[self._pos] = close
+        self._pos = (self._pos + 1) % self.max_period
+        self._count += 1
+        self.last_timestamp = timestamp
+
+        # 최대 기간마다 한 번 재계산 (분할 상환 O(1))
+        self._pushes_since_resync += 1
+        if self._pushes_since_resync >= self.max_period:
+            self._resync()
+
+        self._values.append(self._snapshot())
+
+    def replace_last(self, close: float):
+        """
+        마지막 캔들 종가 교체 (진행 중인 캔들 갱신)
+
+        Args:
+            close: 새 종가
+        """
+        if self._count == 0:
+            return
+
+        close = float(close)
+        last = (self._pos - 1) % self.max_period
+        old = self._buffer[last]
+
+        for period in self.periods:
+            self._add(period, -old)
+            self._add(period, close)
+
+        self._buffer[last] = close
+        self._values[-1] = self._snapshot()
+
+    def reset(self):
+        """상태 초기화"""
+        self._buffer = [0.0] * self.max_period
+        self._pos = 0
+        self._count = 0
+        self._sums = {p: 0.0 for p in self.periods}
+        self._comps = {p: 0.0 for p in self.periods}
+        self._pushes_since_resync = 0
+        self._values.clear()
+        self.last_timestamp = None
+
+    def update(self, df: pd.DataFrame):
+        """
+        캔들 데이터프레임과 동기화
+        - 마지막으로 반영한 캔들 이후만 추가 (같은 캔들은 종가 교체)
+        - 이어지지 않으면 전체 다시 적재
+
+        Args:
+            df: OHLCV 데이터프레임
+        """
+        if df.empty:
+            return
+
+        closes = column_view(df, 'close')
+        index = df.index
+        start = 0
+
+        if self.last_timestamp is not None:
+            pos = index.searchsorted(self.last_timestamp)
+            if pos < len(index) and index[pos] == self.last_timestamp:
+                self.replace_last(closes[pos])
+                start = pos + 1
+            else:
+                self.reset()
+
+        for i in range(start, len(closes)):
+            self.push(closes[i], index[i])
+
+    def current_values(self) -> Dict[int, float]:
+        """
+        현재(최신) SMA 값들
+
+        Returns:
+            {기간: SMA값} 딕셔너리
+        """
+        return dict(self._values[-1]) if self._values else {}
+
+    def previous_values(self) -> Dict[int, float]:
+        """
+        직전 캔들의 SMA 값들
+
+        Returns:
+            {기간: SMA값} 딕셔너리
+        """
+        return dict(self._values[-2]) if len(self._values) >= 2 else {}
+
+    def recent_values(self) -> List[Dict[int, float]]:
+        """
+        보관 중인 최근 SMA 값들 (오래된 순)
+
+        Returns:
+            [{기간: SMA값}, ...]
+        """
+        return list(self._values)
+
+
 class SMACalculator:
     """SMA 계산기"""
 
@@ -21,6 +193,10 @@ class SMACalculator:
         """
         self.periods = sorted(periods)  # 오름차순 정렬
         self.max_period = max(periods)
+
+        # 심볼별 증분 SMA 엔진
+        self._streams: Dict[str, StreamingSMA] = {}
+
         logger.info(f"SMA 계산기 초기화: 기간 {self.periods}")
 
     def calculate_sma(self, df: pd.DataFrame, period: int) -> pd.Series:
@@ -42,24 +218,103 @@ class SMACalculator:
 
     def calculate_all_smas(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        모든 SMA 계산
+        모든 SMA 계산 (전체 구간, 백테스트/단일 심볼 점검용)
+
+        Args:
+            df: OHLCV 데이터프레임 (수정하지 않음)
+
+        Returns:
+            SMA가 추가된 데이터프레임 (원본 컬럼은 복사하지 않고 공유)
+        """
+        if df.empty:
+            return df
+
+        return df.assign(**{f'sma_{period}': self.calculate_sma(df, period) for period in self.periods})
+
+    def latest_sma_values(self, df: pd.DataFrame) -> Dict[int, float]:
+        """
+        마지막 캔들의 SMA 값만 계산 (종가 뷰의 끝 구간 합, 데이터프레임 복사 없음)
 
         Args:
             df: OHLCV 데이터프레임
 
+        Returns:
+            {기간: SMA값} 딕셔너리 (데이터가 부족한 기간은 NaN)
+        """
+        if df.empty:
+            return {}
+
+        closes = column_view(df, 'close')
+        return {
+            period: float(closes[-period:].sum()) / period if len(closes) >= period else np.nan
+            for period in self.periods
+        }
+
+    def update_streaming(self, symbol: str, df: pd.DataFrame, history: int = 2) -> Dict[int, float]:
+        """
+        증분 엔진에 새 캔들 반영 후 현재 SMA 값 (데이터프레임 복사 없음)
+
+        Args:
+            symbol: 심볼
+            df: OHLCV 데이터프레임
+            history: 엔진이 보관할 최근 SMA 값 개수
+
+        Returns:
+            {기간: SMA값} 딕셔너리 (데이터 없으면 빈 딕셔너리)
+        """
+        if df.empty:
+            return {}
+
+        stream = self._streams.get(symbol)
+        if stream is None or stream.history != history:
+            stream = StreamingSMA(self.periods, history=history)
+            self._streams[symbol] = stream
+
+        stream.update(df)
+        return stream.current_values()
+
+    def calculate_all_smas_streaming(self, symbol: str, df: pd.DataFrame, history: int = 2) -> pd.DataFrame:
+        """
+        모든 SMA 계산 (증분 엔진 사용)
+        - 새로 들어온 캔들만 엔진에 반영
+        - SMA 컬럼은 최근 history개 캔들만 채워짐 (나머지는 NaN)
+        - 값만 필요하면 update_streaming 사용 (컬럼 생성 비용 없음)
+
+        Args:
+            symbol: 심볼
+            df: OHLCV 데이터프레임
+            history: 값을 채울 최근 캔들 수
+
         Returns:
             SMA가 추가된 데이터프레임
         """
         if df.empty:
             return df
 
-        df_result = df.copy()
+        self.update_streaming(symbol, df, history=history)
 
+        recent = self._streams[symbol].recent_values()
+        n = min(len(recent), len(df))
+        columns = {}
         for period in self.periods:
-            col_name = f'sma_{period}'
-            df_result[col_name] = self.calculate_sma(df, period)
+            values = np.full(len(df), np.nan)
+            if n:
+                values[-n:] = [v[period] for v in recent[-n:]]
+            columns[f'sma_{period}'] = values
 
-        return df_result
+        return df.assign(**columns)
+
+    def retain_streams(self, symbols: List[str]):
+        """
+        모니터링 대상이 아닌 심볼의 증분 SMA 엔진 삭제
+
+        Args:
+            symbols: 유지할 심볼 리스트
+        """
+        keep = set(symbols)
+        for symbol in list(self._streams):
+            if symbol not in keep:
+                del self._streams[symbol]
 
     def check_reverse_alignment(self, sma_values: Dict[int, float]) -> bool:
         """
@@ -0,0 +1,127 @@
+"""
+SMTP 세션 모듈
+인증된 SMTP 연결을 유지해 여러 알림 메일을 한 연결로 전송 (유휴 타임아웃/끊김 시 재연결)
+"""
+import smtplib
+import ssl
+import threading
+import time
+from email.message import Message
+from typing import List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 재연결 후 다시 시도할 연결 오류
+_DISCONNECT_ERRORS = (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError)
+
+
+class SMTPSession:
+    """재사용 가능한 SMTP 세션 (STARTTLS + 로그인은 연결할 때 한 번만)"""
+
+    def __init__(self, host: str, port: int, username: Optional[str] = None, password: Optional[str] = None,
+                 starttls: bool = True, timeout: float = 30.0, idle_timeout: float = 240.0):
+        """
+        초기화
+
+        Args:
+            host: SMTP 서버 주소
+            port: SMTP 포트
+            username: 로그인 계정 (없으면 로그인 생략)
+            password: 로그인 비밀번호 (없으면 로그인 생략)
+            starttls: STARTTLS 사용 여부
+            timeout: 소켓 타임아웃 (초)
+            idle_timeout: 이 시간 이상 쓰지 않은 연결은 새로 연결 (서버 유휴 종료 대비, 초)
+        """
+        self.host = host
+        self.port = int(port)
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+
+        self._server: Optional[smtplib.SMTP] = None
+        self._last_used = 0.0
+        self._lock = threading.Lock()
+
+        # 연결 횟수 (재사용 확인용)
+        self.connect_count = 0
+
+    @property
+    def connected(self) -> bool:
+        return self._server is not None
+
+    def _connect(self):
+        """연결, STARTTLS, 로그인"""
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            server.ehlo()
+            if self.starttls:
+                server.starttls(context=ssl.create_default_context())
+                server.ehlo()
+            if self.username and self.password:
+                server.login(self.username, self.password)
+        except Exception:
+            server.close()
+            raise
+
+        self._server = server
+        self._last_used = time.monotonic()
+        self.connect_count += 1
+        logger.info(f"SMTP 연결: {self.host}:{self.port}")
+
+    def _disconnect(self):
+        """연결 종료 (오류 무시)"""
+        if self._server is None:
+            return
+        try:
+            self._server.quit()
+        except Exception:
+            self._server.close()
+        self._server = None
+
+    def _ensure_connected(self):
+        """유휴 시간이 길면 끊고 새로 연결"""
+        if self._server is not None and time.monotonic() - self._last_used > self.idle_timeout:
+            logger.debug("SMTP 연결 유휴 시간 초과, 재연결")
+            self._disconnect()
+
+        if self._server is None:
+            self._connect()
+
+    def send(self, messages: List[Message]) -> int:
+        """
+        메일 여러 통을 한 연결로 전송 (연결이 끊겨 있으면 한 번 재연결 후 재시도)
+
+        Args:
+            messages: 메일 메시지 리스트
+
+        Returns:
+            전송한 메일 수
+        """
+        sent = 0
+        with self._lock:
+            for message in messages:
+                for attempt in range(2):
+                    try:
+                        self._ensure_connected()
+                        self._server.send_message(message)
+                        break
+                    except _DISCONNECT_ERRORS as e:
+                        if self._server is not None:
+                            self._server.close()
+                            self._server = None
+                        if attempt:
+                            raise
+                        logger.warning(f"SMTP 연결 끊김, 재연결 후 재시도: {e}")
+
+                self._last_used = time.monotonic()
+                sent += 1
+
+        return sent
+
+    def close(self):
+        """연결 종료"""
+        with self._lock:
+            self._disconnect()
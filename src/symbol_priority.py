@@ -0,0 +1,102 @@
+"""
+심볼 우선순위 스케줄링 모듈
+target SMA 밴드와의 거리와 모멘텀 상태로 심볼을 나눠, 시그널이 가능한 심볼만 매 스캔 조회
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 기본 거리 구간: (target SMA와 거리 상한 %, 스캔 간격) - 밴드(±5%) 근처는 매 스캔
+DEFAULT_TIERS: Tuple[Tuple[float, int], ...] = ((7.5, 1), (15.0, 2), (30.0, 4))
+
+
+class PriorityScheduler:
+    """거리/모멘텀 구간별 스캔 간격 관리"""
+
+    def __init__(self, tiers: Sequence[Tuple[float, int]] = DEFAULT_TIERS, cold_every: int = 8,
+                 momentum_hot_pct: float = 5.0):
+        """
+        초기화
+
+        Args:
+            tiers: (target SMA와 거리 상한 %, 스캔 간격) 리스트
+            cold_every: 모든 구간보다 먼 심볼의 스캔 간격
+            momentum_hot_pct: 모멘텀 구간 상승률이 이 값 이상이면 거리와 무관하게 매 스캔 (%)
+        """
+        self.tiers = sorted((float(distance), max(1, int(every))) for distance, every in tiers)
+        self.cold_every = max(1, int(cold_every))
+        self.momentum_hot_pct = momentum_hot_pct
+
+        # 스캔 횟수, 심볼별 마지막 스캔 번호
+        self.scan_count = 0
+        self._last_scanned: Dict[str, int] = {}
+
+    def every(self, distance: Optional[float], momentum_pct: Optional[float] = None) -> int:
+        """
+        심볼의 스캔 간격 (가까워질수록 자주)
+
+        Args:
+            distance: 마지막 분석 시 종가와 target SMA의 거리 (%, 모르면 None)
+            momentum_pct: 마지막 분석 시 모멘텀 구간 상승률 (%)
+
+        Returns:
+            스캔 간격 (1이면 매 스캔)
+        """
+        # 분석 전이거나 SMA를 계산하지 못한 심볼은 건너뛸 근거가 없으므로 매 스캔
+        if distance is None:
+            return 1
+        if momentum_pct is not None and momentum_pct >= self.momentum_hot_pct:
+            return 1
+
+        for max_distance, every in self.tiers:
+            if distance <= max_distance:
+                return every
+        return self.cold_every
+
+    def select(self, symbols: List[str], distances: Dict[str, float],
+               momentum: Dict[str, float]) -> List[str]:
+        """
+        이번 스캔에서 조회할 심볼 선택 (선택한 심볼은 스캔한 것으로 기록)
+
+        Args:
+            symbols: 전체 심볼 리스트 (스캔 순서)
+            distances: {심볼: target SMA와 거리(%)}
+            momentum: {심볼: 모멘텀 구간 상승률(%)}
+
+        Returns:
+            이번 스캔 대상 심볼 리스트 (순서 유지)
+        """
+        self.scan_count += 1
+        selected = []
+        for symbol in symbols:
+            last = self._last_scanned.get(symbol)
+            if last is None or self.scan_count - last >= self.every(distances.get(symbol), momentum.get(symbol)):
+                selected.append(symbol)
+                self._last_scanned[symbol] = self.scan_count
+
+        return selected
+
+    def tier_counts(self, symbols: List[str], distances: Dict[str, float],
+                    momentum: Dict[str, float]) -> Dict[int, int]:
+        """
+        스캔 간격별 심볼 수
+
+        Returns:
+            {스캔 간격: 심볼 수}
+        """
+        counts: Dict[int, int] = {}
+        for symbol in symbols:
+            every = self.every(distances.get(symbol), momentum.get(symbol))
+            counts[every] = counts.get(every, 0) + 1
+        return dict(sorted(counts.items()))
+
+    def retain(self, symbols: List[str]):
+        """
+        모니터링 대상이 아닌 심볼의 기록 삭제
+
+        Args:
+            symbols: 유지할 심볼 리스트
+        """
+        keep = set(symbols)
+        self._last_scanned = {symbol: last for symbol, last in self._last_scanned.items() if symbol in keep}
@@ -0,0 +1,37 @@
+"""
+SMA/시그널 경로 메모리 할당 검증
+실제 모니터 분석 경로(SMAMonitor.analyze_symbol)의 심볼당 최대 할당량이 한도 이하이고 캔들 수에 따라 늘지 않는지 확인
+"""
+import logging
+import tracemalloc
+
+import pytest
+
+from benchmarks.bench_signal_alloc import KLINE_LIMIT, MAX_KIB, measure_path
+
+SYMBOLS = 5
+SCANS = 2
+
+
+@pytest.fixture
+def traced():
+    logging.disable(logging.CRITICAL)
+    tracemalloc.start()
+    yield
+    tracemalloc.stop()
+    logging.disable(logging.NOTSET)
+
+
+def test_analyze_symbol_allocation_is_bounded(traced):
+    worst, mean = {}, {}
+    for n_candles in (KLINE_LIMIT, 4 * KLINE_LIMIT):
+        # SMAMonitor.analyze_symbol 전체 (1시간봉 리샘플, 시그널 알림 포함)
+        peaks = measure_path(SYMBOLS, n_candles, SCANS, legacy=False)
+        worst[n_candles] = max(peaks) / 1024
+        mean[n_candles] = sum(peaks) / len(peaks) / 1024
+        assert worst[n_candles] < MAX_KIB, f"캔들 {n_candles}개: {worst[n_candles]:.1f} KiB"
+
+    # 캔들 데이터는 4배(약 66 → 265 KiB)지만 할당량은 거의 같아야 함
+    # (최대값은 그 스캔에 시그널이 났는지에 따라 달라지므로 평균으로 비교)
+    small, large = mean[KLINE_LIMIT], mean[4 * KLINE_LIMIT]
+    assert large < small + 2.0, f"캔들 수에 따라 증가: {small:.1f} → {large:.1f} KiB"
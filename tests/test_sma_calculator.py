@@ -0,0 +1,118 @@
+"""
+StreamingSMA 증분 계산 검증
+push/replace_last/주기적 재계산/update 리셋 경로의 SMA가 pandas rolling 평균과 같은지 확인
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import make_frame
+from src.sma_calculator import StreamingSMA
+
+PERIODS = [5, 20, 60]
+MAX_PERIOD = max(PERIODS)
+RTOL = 1e-12
+
+
+def rolling_values(closes: pd.Series) -> dict:
+    """기간별 마지막 캔들의 rolling 평균"""
+    return {period: closes.rolling(period).mean().iloc[-1] for period in PERIODS}
+
+
+def assert_matches(stream: StreamingSMA, closes: pd.Series):
+    """엔진 현재 값과 rolling 평균 비교 (데이터가 부족한 기간은 둘 다 NaN)"""
+    expected = rolling_values(closes)
+    actual = stream.current_values()
+    np.testing.assert_allclose(
+        [actual[p] for p in PERIODS], [expected[p] for p in PERIODS], rtol=RTOL
+    )
+
+
+@pytest.fixture
+def frame() -> pd.DataFrame:
+    return make_frame(n=8 * MAX_PERIOD, seed=7)
+
+
+def test_push_matches_rolling_mean(frame):
+    stream = StreamingSMA(PERIODS)
+    expected = {p: frame['close'].rolling(p).mean().to_numpy() for p in PERIODS}
+
+    for i, (timestamp, close) in enumerate(frame['close'].items()):
+        stream.push(close, timestamp)
+        actual = stream.current_values()
+        np.testing.assert_allclose(
+            [actual[p] for p in PERIODS], [expected[p][i] for p in PERIODS], rtol=RTOL
+        )
+
+
+def test_replace_last_matches_rolling_mean(frame):
+    stream = StreamingSMA(PERIODS)
+    closes = frame['close'].copy()
+    rng = np.random.default_rng(0)
+
+    for i, (timestamp, close) in enumerate(closes.items()):
+        stream.push(close, timestamp)
+        # 진행 중인 캔들 종가가 여러 번 바뀌는 상황
+        for _ in range(3):
+            close = close * (1 + rng.normal(0, 0.01))
+            closes.iloc[i] = close
+            stream.replace_last(close)
+        assert_matches(stream, closes.iloc[:i + 1])
+
+    previous = rolling_values(closes.iloc[:-1])
+    assert stream.previous_values() == pytest.approx(previous, rel=RTOL)
+
+
+def test_resync_keeps_sums_exact():
+    # 큰 가격대에서 작은 변동이 누적될 때 max_period마다 재계산으로 오차가 쌓이지 않는지 확인
+    rng = np.random.default_rng(1)
+    closes = pd.Series(1e6 + np.cumsum(rng.normal(0, 1e-3, 20 * MAX_PERIOD)))
+    stream = StreamingSMA(PERIODS)
+
+    for i, close in enumerate(closes):
+        stream.push(close)
+        if (i + 1) % MAX_PERIOD == 0:
+            # 재계산 직후에는 보정값이 비고 합이 버퍼와 정확히 같음
+            assert stream._pushes_since_resync == 0
+            assert all(comp == 0.0 for comp in stream._comps.values())
+            assert_matches(stream, closes.iloc[:i + 1])
+
+    assert_matches(stream, closes)
+
+
+def test_update_incremental_and_replace(frame):
+    stream = StreamingSMA(PERIODS)
+    n = 4 * MAX_PERIOD
+
+    stream.update(frame.iloc[:n])
+    assert_matches(stream, frame['close'].iloc[:n])
+
+    # 창이 밀리며 새 캔들이 추가된 데이터 (앞부분은 잘림)
+    for end in range(n + 1, n + 10):
+        stream.update(frame.iloc[end - n:end])
+        assert_matches(stream, frame['close'].iloc[:end])
+
+    # 마지막 캔들 종가만 바뀐 데이터
+    window = frame.iloc[10:n + 9].copy()
+    window.iloc[-1, window.columns.get_loc('close')] *= 1.05
+    stream.update(window)
+    closes = pd.concat([frame['close'].iloc[:n + 8], window['close'].iloc[-1:]])
+    assert_matches(stream, closes)
+
+
+def test_update_resets_on_gap(frame):
+    stream = StreamingSMA(PERIODS)
+    stream.update(frame.iloc[:2 * MAX_PERIOD])
+
+    # 마지막으로 반영한 캔들이 없는 (이어지지 않는) 데이터는 처음부터 다시 적재
+    later = frame.iloc[4 * MAX_PERIOD:]
+    stream.update(later)
+    assert stream.last_timestamp == later.index[-1]
+    assert_matches(stream, later['close'])
+
+    # 기간보다 짧은 데이터로 리셋되면 긴 기간은 NaN
+    short = make_frame(n=MAX_PERIOD - 1, seed=8)
+    stream.update(short)
+    values = stream.current_values()
+    assert np.isnan(values[MAX_PERIOD])
+    assert_matches(stream, short['close'])